@@ -0,0 +1,70 @@
+"""
+Micro-benchmark of per-object construction time and memory.
+
+Run from the repository root:
+
+    python -m benchmarks.construction
+"""
+import timeit
+import tracemalloc
+import numpy as np
+from pylarization.ellipse import PolarizationEllipse
+from pylarization.vectors import JonesVector, StokesVector
+from pylarization.matrices import JonesMatrix, MuellerMatrix
+
+
+CASES = (
+    ("PolarizationEllipse(...)",
+     lambda: PolarizationEllipse(0.445, 0.89, 1.57)),
+    ("JonesVector(...)",
+     lambda: JonesVector(0.445, 0.89j)),
+    ("JonesVector.from_matrix",
+     lambda: JonesVector.from_matrix(np.array([[0.445], [0.89j]]))),
+    ("StokesVector(...)",
+     lambda: StokesVector(1, 0.6, 0, 0.8)),
+    ("StokesVector.from_matrix",
+     lambda: StokesVector.from_matrix(np.array([[1], [0.6], [0], [0.8]]))),
+    ("JonesMatrix @ JonesVector",
+     lambda: JONES_MATRIX @ JONES_VECTOR),
+    ("MuellerMatrix @ StokesVector",
+     lambda: MUELLER_MATRIX @ STOKES_VECTOR),
+    )
+
+JONES_MATRIX = JonesMatrix(0.3, 1.0, 0.5)
+JONES_VECTOR = JonesVector(0.445, 0.89j)
+MUELLER_MATRIX = MuellerMatrix(np.eye(4))
+STOKES_VECTOR = StokesVector(1, 0.6, 0, 0.8)
+
+
+def construction_time(factory, number=20000):
+    """
+    Return the best time of a single call in microseconds.
+    """
+    times = timeit.repeat(factory, number=number, repeat=5)
+    return min(times) / number * 1e6
+
+
+def construction_memory(factory, count=10000):
+    """
+    Return the memory held by a single object in bytes.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main():
+    print("{:<30} {:>10} {:>10}".format("case", "time [us]", "memory [B]"))
+    for name, factory in CASES:
+        print("{:<30} {:>10.2f} {:>10.0f}".format(
+            name,
+            construction_time(factory),
+            construction_memory(factory)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark of import time of the package.
+
+Every statement is run in a fresh interpreter, and the startup time of
+an empty interpreter is subtracted. Importing pylarization.vectors
+stands for the cost the enums paid before they became lazy,
+as they built their members from the class hierarchy at import.
+
+Run from the repository root:
+
+    python -m benchmarks.imports
+"""
+import subprocess
+import sys
+import time
+
+
+STATEMENTS = (
+    "import pylarization",
+    "import pylarization.polarizations",
+    "import pylarization.elements",
+    "from pylarization import JonesVectorState",
+    "import pylarization.vectors",
+    "from pylarization.polarizations import JonesVectorState; "
+    "JonesVectorState.LINEAR_HORIZONTAL.value",
+    )
+
+_PROBE = "{}; import sys; sys.exit('numpy' in sys.modules)"
+
+
+def startup_time(statement, repeat=20):
+    """
+    Return the best wall time of running a statement
+    in a fresh interpreter, in seconds, and whether it imported numpy.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        code = subprocess.call(
+            [sys.executable, '-c', _PROBE.format(statement)])
+        best = min(best, time.perf_counter() - start)
+    return best, bool(code)
+
+
+def main():
+    empty, _ = startup_time("pass")
+    print("{:<70} {:>10} {:>6}".format("statement", "time [ms]", "numpy"))
+    for statement in STATEMENTS:
+        seconds, numpy = startup_time(statement)
+        print("{:<70} {:>10.1f} {:>6}".format(
+            statement.split('; ')[-1] if ';' in statement else statement,
+            (seconds - empty) * 1e3, "yes" if numpy else "no"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+"""
+Benchmark suite of constructors, transforms and derived properties,
+for scalar objects and batches from 1 to 10^7 states.
+
+Run from the repository root:
+
+    python -m benchmarks.suite run --output baseline.json
+    python -m benchmarks.suite run --output current.json
+    python -m benchmarks.suite compare baseline.json current.json
+
+The comparison exits with status 1 if any case got slower than
+the baseline by more than the tolerance (10% by default).
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import numpy as np
+from pylarization.ellipse import PolarizationEllipse, PolarizationEllipseArray
+from pylarization.vectors import JonesVector, StokesVector
+from pylarization.vectors import JonesVectorArray, StokesVectorArray
+from pylarization.matrices import JonesMatrix, MuellerMatrix
+
+
+SIZES = tuple(10 ** power for power in range(8))
+
+SCALAR = 'scalar'
+
+
+def _scalar_cases():
+    jones_matrix = JonesMatrix(0.3, 1.0, 0.5)
+    jones_vector = JonesVector(0.445, 0.89j)
+    mueller_matrix = MuellerMatrix(np.eye(4))
+    stokes_vector = StokesVector(1, 0.6, 0, 0.8)
+    ellipse = PolarizationEllipse(0.445, 0.89, 1.57)
+
+    def azimuth():
+        ellipse._invalidate()
+        return ellipse.azimuth
+
+    return {
+        "JonesVector(...)": lambda: JonesVector(0.445, 0.89j),
+        "StokesVector.normalize": stokes_vector.normalize,
+        "JonesMatrix @ JonesVector": lambda: jones_matrix @ jones_vector,
+        "MuellerMatrix @ StokesVector":
+            lambda: mueller_matrix @ stokes_vector,
+        "PolarizationEllipse.azimuth": azimuth,
+        }
+
+
+def _batch_cases(size):
+    rng = np.random.default_rng(0)
+    Ex = rng.random(size)
+    Ey = rng.random(size) * np.exp(1j * rng.random(size))
+    phase = rng.random(size)
+    jones_matrix = JonesMatrix(0.3, 1.0, 0.5)
+    jones_vectors = JonesVectorArray(Ex, Ey)
+    mueller_matrix = MuellerMatrix(np.eye(4))
+    stokes_vectors = StokesVectorArray(np.ones(size), Ex, Ex.imag, phase)
+    ellipses = PolarizationEllipseArray(Ex, Ey.real, phase)
+    return {
+        "JonesVector(...)": lambda: JonesVectorArray(Ex, Ey),
+        "StokesVector.normalize": stokes_vectors.normalize,
+        "JonesMatrix @ JonesVector": lambda: jones_matrix @ jones_vectors,
+        "MuellerMatrix @ StokesVector":
+            lambda: mueller_matrix @ stokes_vectors,
+        "PolarizationEllipse.azimuth": lambda: ellipses.azimuth,
+        }
+
+
+def measure(function, repeat=5):
+    """
+    Return the best time of a single call in seconds.
+
+    The number of calls per measurement is chosen so that
+    a measurement takes at least 0.2 s.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < 0.2:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(sizes=SIZES, repeat=5):
+    """
+    Run every case for scalar objects and for batches of given sizes.
+
+    Returns
+    -------
+    dict
+        Metadata of the environment and a list of results.
+    """
+    results = []
+    for size in (SCALAR,) + tuple(sizes):
+        # inputs of one size at a time, large batches are not kept
+        # allocated while the other sizes are timed
+        functions = _scalar_cases() if size == SCALAR else _batch_cases(size)
+        for name, function in functions.items():
+            seconds = measure(function, repeat)
+            count = 1 if size == SCALAR else size
+            results.append({
+                'case': name,
+                'size': size,
+                'seconds': seconds,
+                'seconds_per_state': seconds / count,
+                })
+            print("{:<30} {:>10} {:>14.3e} s".format(
+                name, size, seconds), file=sys.stderr)
+        del functions
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+        'results': results,
+        }
+
+
+def compare(baseline, current, tolerance=0.1):
+    """
+    Compare two benchmark reports.
+
+    Parameters
+    ----------
+    :baseline:
+        Report of the reference run.
+    :current:
+        Report of the run being checked.
+    :tolerance:
+        Relative slowdown allowed before a case is flagged.
+
+    Returns
+    -------
+    list
+        Tuples of case, size, baseline time, current time, their ratio
+        and whether the case is a regression, for cases found in both.
+    """
+    reference = {(result['case'], result['size']): result['seconds']
+                 for result in baseline['results']}
+    rows = []
+    for result in current['results']:
+        key = (result['case'], result['size'])
+        if key not in reference:
+            continue
+        ratio = result['seconds'] / reference[key]
+        rows.append(key + (reference[key], result['seconds'], ratio,
+                           ratio > 1.0 + tolerance))
+    return rows
+
+
+def _load(path):
+    with open(path) as report:
+        return json.load(report)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    run_parser = commands.add_parser('run', help="run the suite")
+    run_parser.add_argument('--output', help="JSON file, stdout if omitted")
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                            help="batch sizes")
+    run_parser.add_argument('--repeat', type=int, default=5)
+    compare_parser = commands.add_parser(
+        'compare', help="flag slowdowns against a baseline")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--tolerance', type=float, default=0.1)
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == 'run':
+        report = run(arguments.sizes, arguments.repeat)
+        if arguments.output is None:
+            json.dump(report, sys.stdout, indent=2)
+        else:
+            with open(arguments.output, 'w') as output:
+                json.dump(report, output, indent=2)
+        return 0
+
+    rows = compare(_load(arguments.baseline), _load(arguments.current),
+                   arguments.tolerance)
+    print("{:<30} {:>10} {:>12} {:>12} {:>7}".format(
+        "case", "size", "baseline [s]", "current [s]", "ratio"))
+    for case, size, before, after, ratio, slower in rows:
+        print("{:<30} {:>10} {:>12.3e} {:>12.3e} {:>7.2f}{}".format(
+            case, size, before, after, ratio, "  SLOWER" if slower else ""))
+    return 1 if any(row[-1] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
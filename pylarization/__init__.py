@@ -0,0 +1,98 @@
+"""
+Package for polarization state calculations.
+
+Classes and functions listed in _EXPORTS are available directly from
+the package, e.g. pylarization.JonesVector. Their modules, and numpy,
+are imported on first access only, so importing the package is cheap.
+Stages of pylarization.streaming with generic names (normalize,
+transform, ellipse_parameters, windowed) are not exported, use them
+from their module.
+"""
+import os
+import sys
+import types
+from importlib import import_module
+
+
+_EXPORTS = {
+    'PolarizationEllipse': 'ellipse',
+    'PolarizationEllipseArray': 'ellipse',
+    'JonesVector': 'vectors',
+    'JonesVectorArray': 'vectors',
+    'StokesVector': 'vectors',
+    'StokesVectorArray': 'vectors',
+    'JonesMatrix': 'matrices',
+    'JonesMatrixArray': 'matrices',
+    'MuellerMatrix': 'matrices',
+    'MuellerMatrixArray': 'matrices',
+    'CoherencyMatrix': 'matrices',
+    'OpticalTrain': 'trains',
+    'CoherencyAccumulator': 'accumulators',
+    'MuellerPolarimeter': 'polarimetry',
+    'RotatingElementPolarimeter': 'demodulation',
+    'StateClassifier': 'classification',
+    'lu_chipman': 'decomposition',
+    'ElementCache': 'cache',
+    'StokesCube': 'cubes',
+    'MuellerCube': 'cubes',
+    'stokes_blocks': 'streaming',
+    'jones_blocks': 'streaming',
+    'pipeline': 'streaming',
+    'ProcessExecutor': 'parallel',
+    'ThreadExecutor': 'parallel',
+    'monte_carlo': 'tolerance',
+    'ElementTolerance': 'tolerance',
+    'ToleranceResult': 'tolerance',
+    'lazy': 'expressions',
+    'jones_to_mueller': 'conversions',
+    'jones_to_coherency': 'conversions',
+    'coherency_to_stokes': 'conversions',
+    'jones_to_stokes': 'conversions',
+    'stokes_to_jones': 'conversions',
+    'JonesVectorState': 'polarizations',
+    'StokesVectorState': 'polarizations',
+    'PolarizationEllipseState': 'polarizations',
+    'JonesMatrixOpticalElements': 'elements',
+    'get_precision': 'precision',
+    'set_precision': 'precision',
+    'using_precision': 'precision',
+    'profile': 'profiling',
+    }
+
+__all__ = sorted(_EXPORTS)
+
+
+class _Namespace(types.ModuleType):
+    """
+    Module type importing exported names and submodules on first access.
+    """
+
+    def __getattr__(self, name):
+        missing = AttributeError("module {!r} has no attribute {!r}".format(
+            __name__, name))
+        if name in _EXPORTS:
+            module = import_module('{}.{}'.format(__name__, _EXPORTS[name]))
+            value = getattr(module, name)
+        elif name.startswith('_'):
+            raise missing
+        else:
+            submodule = '{}.{}'.format(__name__, name)
+            try:
+                value = import_module(submodule)
+            except ImportError as error:
+                if error.name != submodule:
+                    raise
+                raise missing
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_EXPORTS))
+
+
+sys.modules[__name__].__class__ = _Namespace
+
+
+if os.environ.get('PYLARIZATION_PROFILE'):
+    from pylarization import profiling
+    profiling._from_environment(os.environ['PYLARIZATION_PROFILE'])
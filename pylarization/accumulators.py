@@ -0,0 +1,162 @@
+"""
+Module containing a running coherency matrix of partially coherent light.
+
+Incoherent superposition of fields adds their coherency matrices.
+The accumulator keeps only the running mean and the sum of squared
+deviations of the coherency matrix, so any number of samples can be
+averaged in constant memory and no object is created per sample.
+"""
+import numpy as np
+from pylarization.vectors import JonesVector, JonesVectorArray
+from pylarization.matrices import CoherencyMatrix
+from pylarization.conversions import coherency_to_stokes, jones_to_coherency
+from pylarization.precision import float_dtype, complex_dtype
+
+
+class CoherencyAccumulator(object):
+    """
+    Class accumulating the coherency matrix J = <E E^H> of field samples.
+
+    Mean and variance are updated with the weighted Welford algorithm,
+    merging whole batches at once. Statistics of a batch are computed
+    from deviations of its own mean, using an (N, 2, 2) temporary,
+    so a large mean does not cancel a small spread.
+
+    Parameters
+    ----------
+    :forgetting:
+        Factor 0. < forgetting <= 1.0 by which the weight of past
+        samples is multiplied for every new sample. 1.0 averages
+        all samples equally; smaller values track drifting sources.
+    :precision:
+        'single' or 'double', the global default when omitted.
+
+    Attributes
+    ----------
+    :_weight:
+        Total weight of the samples, i.e. their count
+        without forgetting.
+    :_mean:
+        Running mean of the coherency matrix.
+    :_m2:
+        Running weighted sum of squared deviations
+        of the coherency matrix elements.
+    """
+
+    def __init__(self, forgetting=1.0, precision=None):
+        if not 0.0 < forgetting <= 1.0:
+            raise ValueError("Forgetting factor must be in (0, 1]")
+        self.forgetting = forgetting
+        self._weight = 0.0
+        self._mean = np.zeros((2, 2), dtype=complex_dtype(precision))
+        self._m2 = np.zeros((2, 2), dtype=float_dtype(precision))
+
+    def reset(self):
+        """
+        Forget all samples.
+        """
+        self._weight = 0.0
+        self._mean[...] = 0
+        self._m2[...] = 0
+
+    def add(self, samples):
+        """
+        Add field samples.
+
+        Parameters
+        ----------
+        :samples:
+            JonesVector, JonesVectorArray, (2,) ndarray holding a single
+            sample or (N, 2) ndarray of Ex and Ey samples, in order
+            of arrival.
+
+        Returns
+        -------
+        CoherencyAccumulator
+            self, so calls can be chained.
+        """
+        if isinstance(samples, JonesVector):
+            samples = samples.vector.reshape(1, 2)
+        elif isinstance(samples, JonesVectorArray):
+            samples = samples.vector
+        samples = np.asarray(samples, dtype=self._mean.dtype)
+        if samples.ndim == 1:
+            samples = samples.reshape(1, 2)
+        if samples.ndim != 2 or samples.shape[1] != 2:
+            raise ValueError("Wrong samples shape")
+        size = samples.shape[0]
+        if size == 0:
+            return self
+
+        # statistics of the batch from deviations of its own mean,
+        # merged below with the decayed running ones
+        coherency = jones_to_coherency(samples)
+        if self.forgetting == 1.0:
+            weight = float(size)
+            mean = coherency.mean(axis=0)
+            deviations = np.abs(coherency - mean) ** 2
+            m2 = deviations.sum(axis=0)
+            decay = 1.0
+        else:
+            weights = self.forgetting ** np.arange(size - 1, -1, -1.0)
+            weights = weights.astype(self._m2.dtype, copy=False)
+            weight = float(weights.sum())
+            mean = np.einsum('n,nij->ij', weights, coherency) / weight
+            deviations = np.abs(coherency - mean) ** 2
+            m2 = np.einsum('n,nij->ij', weights, deviations)
+            decay = self.forgetting ** size
+
+        previous = self._weight * decay
+        self._weight = previous + weight
+        delta = mean - self._mean
+        self._m2 *= decay
+        self._m2 += m2 + np.abs(delta) ** 2 * (previous * weight /
+                                               self._weight)
+        self._mean += delta * (weight / self._weight)
+        return self
+
+    @property
+    def weight(self):
+        return self._weight
+
+    @property
+    def mean(self):
+        """
+        Mean coherency matrix of the samples.
+        """
+        return self._mean.copy()
+
+    @property
+    def variance(self):
+        """
+        Variance of every element of the coherency matrix,
+        E|J - <J>|^2, as a (2, 2) array.
+        """
+        if self._weight == 0.0:
+            return np.full((2, 2), np.nan, dtype=self._m2.dtype)
+        return self._m2 / self._weight
+
+    def coherency_matrix(self):
+        """
+        Return the mean coherency matrix as a CoherencyMatrix.
+        """
+        return CoherencyMatrix.from_matrix(self._mean)
+
+    def stokes(self):
+        """
+        Return the Stokes vector of the mean coherency matrix.
+        """
+        return coherency_to_stokes(self._mean)
+
+    @property
+    def degree_of_polarization(self):
+        """
+        Degree of polarization of the mean coherency matrix,
+        sqrt(1 - 4 det J / (tr J)^2). 0 if no light was added.
+        """
+        mean = self._mean
+        trace = (mean[0, 0] + mean[1, 1]).real
+        if trace == 0:
+            return 0.0
+        determinant = (mean[0, 0] * mean[1, 1] - mean[0, 1] * mean[1, 0]).real
+        return float(np.sqrt(max(1.0 - 4.0 * determinant / trace ** 2, 0.0)))
@@ -0,0 +1,135 @@
+"""
+Module containing a cache of matrices of standard optical elements.
+
+Elements are keyed by their parameters rounded to a given resolution,
+so repeated requests for the same waveplate or polarizer return one
+shared JonesMatrix instead of recomputing it. Shared matrices are
+read-only, so a caller can not change the element seen by others.
+"""
+import threading
+from collections import OrderedDict, namedtuple
+from pylarization.matrices import JonesMatrix
+from pylarization.precision import complex_dtype
+
+
+CacheStatistics = namedtuple(
+    'CacheStatistics', ['hits', 'misses', 'evictions', 'size', 'maxsize'])
+
+
+def _read_only(matrix):
+    matrix.matrix.flags.writeable = False
+    return matrix
+
+
+class ElementCache(object):
+    """
+    Bounded, thread-safe cache of JonesMatrix elements.
+
+    Parameters
+    ----------
+    :maxsize:
+        Maximum number of cached elements.
+    :resolution:
+        Parameters are rounded to multiples of the resolution, both to
+        form the key and to build the element, so requests differing
+        by less than the resolution share one matrix.
+    :policy:
+        'lru' evicts the least recently used element,
+        'fifo' evicts the element cached first.
+    """
+
+    _policies = ('lru', 'fifo')
+
+    def __init__(self, maxsize=256, resolution=1e-9, policy='lru'):
+        if policy not in self._policies:
+            raise ValueError("Unknown eviction policy")
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive")
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.policy = policy
+        self._elements = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _get(self, key, factory):
+        with self._lock:
+            if key in self._elements:
+                self._hits += 1
+                if self.policy == 'lru':
+                    self._elements.move_to_end(key)
+                return self._elements[key]
+            self._misses += 1
+            element = _read_only(factory())
+            self._elements[key] = element
+            while len(self._elements) > self.maxsize:
+                self._elements.popitem(last=False)
+                self._evictions += 1
+            return element
+
+    def _quantize(self, value):
+        return int(round(value / self.resolution))
+
+    def jones_matrix(self, angle=0.0, retardance=0.0, transparency=0.0,
+                     precision=None):
+        """
+        Return a read-only JonesMatrix of an element,
+        see JonesMatrix for parameters.
+        """
+        key = (self._quantize(angle), self._quantize(retardance),
+               self._quantize(transparency), complex_dtype(precision))
+        return self._get(key, lambda: JonesMatrix(
+            key[0] * self.resolution, key[1] * self.resolution,
+            key[2] * self.resolution, precision))
+
+    def element(self, member, precision=None):
+        """
+        Return a read-only JonesMatrix of a member
+        of JonesMatrixOpticalElements.
+        """
+        key = (member, complex_dtype(precision))
+        return self._get(key, lambda: JonesMatrix.from_matrix(
+            member.value.matrix, precision))
+
+    def clear(self):
+        """
+        Remove all elements and reset statistics.
+        """
+        with self._lock:
+            self._elements.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self):
+        return len(self._elements)
+
+    @property
+    def statistics(self):
+        with self._lock:
+            return CacheStatistics(self._hits, self._misses,
+                                   self._evictions, len(self._elements),
+                                   self.maxsize)
+
+
+_default = ElementCache()
+
+
+def jones_matrix(angle=0.0, retardance=0.0, transparency=0.0,
+                 precision=None):
+    """
+    Return a read-only JonesMatrix from the package-wide cache.
+    """
+    return _default.jones_matrix(angle, retardance, transparency, precision)
+
+
+def element(member, precision=None):
+    """
+    Return a read-only JonesMatrix of a member of JonesMatrixOpticalElements
+    from the package-wide cache.
+    """
+    return _default.element(member, precision)
+
+
+def default_cache():
+    return _default
@@ -0,0 +1,177 @@
+"""
+Module containing classification of polarization states by the nearest
+reference state on the Poincare sphere.
+
+States are compared by the direction of their polarized part only,
+so intensity and degree of polarization do not affect the result.
+The distance between states is the angle between their points on
+the sphere, i.e. twice the angle between the polarization ellipses.
+"""
+from enum import EnumMeta
+import numpy as np
+from pylarization.vectors import JonesVector, JonesVectorArray
+from pylarization.vectors import StokesVector, StokesVectorArray
+from pylarization.conversions import jones_to_stokes
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # references are searched by brute force
+    cKDTree = None
+
+
+def _stokes(state):
+    """
+    Return (N, 3) polarized parts of Stokes vectors of given states.
+    """
+    if isinstance(state, (StokesVector, StokesVectorArray)):
+        return state.vector.reshape(-1, 4)[:, 1:]
+    if isinstance(state, (JonesVector, JonesVectorArray)):
+        return jones_to_stokes(state).vector.reshape(-1, 4)[:, 1:]
+    if hasattr(state, 'phase'):
+        E0x = np.asarray(state.E0x, dtype=float).reshape(-1)
+        E0y = np.asarray(state.E0y, dtype=float).reshape(-1)
+        phase = np.asarray(state.phase, dtype=float).reshape(-1)
+        return np.stack([E0x ** 2 - E0y ** 2,
+                         2 * E0x * E0y * np.cos(phase),
+                         2 * E0x * E0y * np.sin(phase)], axis=1)
+    return np.asarray(state, dtype=float).reshape(-1, 4)[:, 1:]
+
+
+def poincare_points(states):
+    """
+    Map polarization states onto the unit Poincare sphere.
+
+    Parameters
+    ----------
+    :states:
+        Vector, vector array or ellipse object, (N, 4) array of Stokes
+        vectors, or a sequence of any of those.
+
+    Returns
+    -------
+    ndarray
+        (N, 3) unit vectors. Unpolarized states are mapped to NaN.
+    """
+    if isinstance(states, (list, tuple)):
+        points = np.concatenate([_stokes(state) for state in states])
+    else:
+        points = _stokes(states)
+    norm = np.sqrt(np.square(points).sum(axis=1, keepdims=True))
+    return np.divide(points, norm, out=np.full_like(points, np.nan),
+                     where=norm != 0)
+
+
+class StateClassifier(object):
+    """
+    Class labelling polarization states with the nearest reference state.
+
+    Parameters
+    ----------
+    :references:
+        Enum of reference states (e.g. StokesVectorState), or states
+        accepted by poincare_points().
+    :labels:
+        Labels of the references. Members of the enum by default,
+        indices of references otherwise.
+    :tree:
+        Whether to search references with scipy's cKDTree.
+        By default the tree is used if scipy is available and there
+        are at least tree_threshold references; smaller sets are
+        searched by brute force in blocks.
+    :block_size:
+        Number of states compared with all references at once
+        by the brute force search.
+
+    Attributes
+    ----------
+    :_points:
+        (R, 3) references on the unit Poincare sphere.
+    :_labels:
+        Object array of labels.
+    """
+
+    tree_threshold = 64
+
+    def __init__(self, references, labels=None, tree=None, block_size=4096):
+        if isinstance(references, EnumMeta):
+            members = list(references)
+            if labels is None:
+                labels = members
+            references = [member.value for member in members]
+        self._points = poincare_points(references)
+        if np.isnan(self._points).any():
+            raise ValueError("Reference states must be polarized")
+        if labels is None:
+            labels = range(len(self._points))
+        self._labels = np.empty(len(self._points), dtype=object)
+        self._labels[:] = list(labels)
+        if tree is None:
+            tree = (cKDTree is not None and
+                    len(self._points) >= self.tree_threshold)
+        if tree and cKDTree is None:
+            raise ImportError("scipy is required to build the tree")
+        self._tree = cKDTree(self._points) if tree else None
+        self.block_size = block_size
+
+    def __len__(self):
+        return len(self._points)
+
+    @property
+    def labels(self):
+        return self._labels
+
+    def _nearest_brute(self, points):
+        indices = np.empty(len(points), dtype=np.intp)
+        cosines = np.empty(len(points))
+        for start in range(0, len(points), self.block_size):
+            block = points[start:start + self.block_size]
+            products = block @ self._points.T
+            indices[start:start + len(block)] = products.argmax(axis=1)
+            cosines[start:start + len(block)] = products.max(axis=1)
+        return indices, np.arccos(np.clip(cosines, -1.0, 1.0))
+
+    def _nearest_tree(self, points):
+        chords, indices = self._tree.query(points)
+        return indices, 2 * np.arcsin(np.clip(chords / 2, 0.0, 1.0))
+
+    def nearest(self, states):
+        """
+        Find the nearest reference of every state.
+
+        Parameters
+        ----------
+        :states:
+            States accepted by poincare_points().
+
+        Returns
+        -------
+        tuple of ndarrays
+            Indices of the nearest references and angular distances
+            to them on the sphere in radians. Unpolarized states get
+            an index of -1 and a distance of NaN.
+        """
+        points = poincare_points(states)
+        polarized = ~np.isnan(points[:, 0])
+        indices = np.full(len(points), -1, dtype=np.intp)
+        distances = np.full(len(points), np.nan)
+        if polarized.any():
+            search = (self._nearest_brute if self._tree is None
+                      else self._nearest_tree)
+            indices[polarized], distances[polarized] = search(
+                points[polarized])
+        return indices, distances
+
+    def classify(self, states):
+        """
+        Label states with their nearest references.
+
+        Returns
+        -------
+        tuple of ndarrays
+            Object array of labels, None for unpolarized states,
+            and angular distances on the sphere in radians.
+        """
+        indices, distances = self.nearest(states)
+        labels = self._labels[indices]
+        labels[indices == -1] = None
+        return labels, distances
@@ -0,0 +1,184 @@
+"""
+Module containing conversions between Jones and Stokes-Mueller calculus.
+
+Every function accepts single objects, batches (vector arrays and
+matrix stacks) or plain ndarrays with the batch along the first axis,
+and returns the same kind of value, in the same precision,
+it was given.
+"""
+import numpy as np
+from pylarization.vectors import JonesVector, StokesVector
+from pylarization.vectors import JonesVectorArray, StokesVectorArray
+from pylarization.matrices import JonesMatrix, MuellerMatrix
+from pylarization.matrices import JonesMatrixArray, MuellerMatrixArray
+from pylarization.precision import complex_dtype
+
+
+# Maps E (x) E* = [ExEx*, ExEy*, EyEx*, EyEy*] onto [I, M, C, S].
+_TRANSFORM = np.array([[1, 0, 0, 1],
+                       [1, 0, 0, -1],
+                       [0, 1, 1, 0],
+                       [0, 1j, -1j, 0]])
+_TRANSFORM_INV = np.linalg.inv(_TRANSFORM)
+
+
+def jones_to_mueller(jones):
+    """
+    Convert Jones matrices to Mueller matrices.
+
+    Uses M = A (J (x) J*) A^-1, with the Kronecker product
+    calculated for the whole stack at once.
+
+    Parameters
+    ----------
+    :jones:
+        JonesMatrix, JonesMatrixArray or (N, 2, 2) ndarray.
+
+    Returns
+    -------
+    MuellerMatrix, MuellerMatrixArray or (N, 4, 4) ndarray.
+    """
+    if isinstance(jones, JonesMatrix):
+        return MuellerMatrix(_jones_to_mueller(jones.matrix[np.newaxis])[0])
+    if isinstance(jones, JonesMatrixArray):
+        return MuellerMatrixArray.from_matrix(_jones_to_mueller(jones.matrix))
+    return _jones_to_mueller(np.asarray(jones))
+
+
+def jones_to_coherency(jones):
+    """
+    Convert Jones vectors to coherency matrices J = E E^H,
+    so that Jxy = Ex Ey*.
+
+    Parameters
+    ----------
+    :jones:
+        JonesVector, JonesVectorArray or (N, 2) ndarray.
+
+    Returns
+    -------
+    ndarray
+        (2, 2) matrix for a single vector, (N, 2, 2) otherwise.
+    """
+    if isinstance(jones, JonesVector):
+        return _jones_to_coherency(jones.vector.reshape(1, 2))[0]
+    if isinstance(jones, JonesVectorArray):
+        return _jones_to_coherency(jones.vector)
+    return _jones_to_coherency(np.asarray(jones))
+
+
+def coherency_to_stokes(coherency):
+    """
+    Convert coherency matrices to Stokes vectors.
+
+    Parameters
+    ----------
+    :coherency:
+        CoherencyMatrix, (2, 2) or (N, 2, 2) ndarray.
+
+    Returns
+    -------
+    StokesVector for a single matrix, StokesVectorArray otherwise.
+    """
+    coherency = np.asarray(getattr(coherency, 'matrix', coherency))
+    if coherency.ndim == 2:
+        stokes = _coherency_to_stokes(coherency[np.newaxis])
+        return StokesVector._from_buffer(stokes.reshape(4, 1))
+    return StokesVectorArray.from_matrix(_coherency_to_stokes(coherency))
+
+
+def jones_to_stokes(jones):
+    """
+    Convert Jones vectors to Stokes vectors.
+    Equivalent to coherency_to_stokes(jones_to_coherency(jones)),
+    but without storing the coherency matrices.
+
+    Parameters
+    ----------
+    :jones:
+        JonesVector, JonesVectorArray or (N, 2) ndarray.
+
+    Returns
+    -------
+    StokesVector, StokesVectorArray or (N, 4) ndarray.
+    """
+    if isinstance(jones, JonesVector):
+        stokes = _jones_to_stokes(jones.vector.reshape(1, 2))
+        return StokesVector._from_buffer(stokes.reshape(4, 1))
+    if isinstance(jones, JonesVectorArray):
+        return StokesVectorArray.from_matrix(_jones_to_stokes(jones.vector))
+    return _jones_to_stokes(np.asarray(jones))
+
+
+def stokes_to_jones(stokes):
+    """
+    Convert Stokes vectors to Jones vectors.
+
+    Jones vectors describe fully polarized light only,
+    so the unpolarized part of partially polarized states is discarded.
+    The X component of resulting vectors is always real.
+
+    Parameters
+    ----------
+    :stokes:
+        StokesVector, StokesVectorArray or (N, 4) ndarray.
+
+    Returns
+    -------
+    JonesVector, JonesVectorArray or (N, 2) ndarray.
+    """
+    if isinstance(stokes, StokesVector):
+        jones = _stokes_to_jones(stokes.vector.reshape(1, 4))
+        return JonesVector._from_buffer(jones.reshape(2, 1))
+    if isinstance(stokes, StokesVectorArray):
+        return JonesVectorArray.from_matrix(_stokes_to_jones(stokes.vector))
+    return _stokes_to_jones(np.asarray(stokes))
+
+
+def _jones_to_mueller(jones):
+    size = jones.shape[0]
+    kronecker = np.einsum('nij,nkl->nikjl', jones, jones.conj())
+    kronecker = kronecker.reshape(size, 4, 4)
+    transform = _TRANSFORM.astype(kronecker.dtype, copy=False)
+    transform_inv = _TRANSFORM_INV.astype(kronecker.dtype, copy=False)
+    return np.matmul(np.matmul(transform, kronecker), transform_inv).real
+
+
+def _jones_to_coherency(jones):
+    return jones[:, :, np.newaxis] * jones[:, np.newaxis, :].conj()
+
+
+def _coherency_to_stokes(coherency):
+    stokes = np.empty((coherency.shape[0], 4), dtype=coherency.real.dtype)
+    xx = coherency[:, 0, 0].real
+    yy = coherency[:, 1, 1].real
+    xy = coherency[:, 0, 1]
+    stokes[:, 0] = xx + yy
+    stokes[:, 1] = xx - yy
+    stokes[:, 2] = 2 * xy.real
+    stokes[:, 3] = -2 * xy.imag
+    return stokes
+
+
+def _jones_to_stokes(jones):
+    Ex = jones[:, 0]
+    Ey = jones[:, 1]
+    xx = np.square(Ex.real) + np.square(Ex.imag)
+    yy = np.square(Ey.real) + np.square(Ey.imag)
+    cross = Ex.conj() * Ey
+    stokes = np.empty((jones.shape[0], 4), dtype=jones.real.dtype)
+    stokes[:, 0] = xx + yy
+    stokes[:, 1] = xx - yy
+    stokes[:, 2] = 2 * cross.real
+    stokes[:, 3] = 2 * cross.imag
+    return stokes
+
+
+def _stokes_to_jones(stokes):
+    M = stokes[:, 1]
+    polarized = np.sqrt(np.square(stokes[:, 1:]).sum(axis=1))
+    jones = np.empty((stokes.shape[0], 2), dtype=complex_dtype(like=stokes))
+    jones[:, 0] = np.sqrt(np.maximum(polarized + M, 0) / 2)
+    jones[:, 1] = (np.sqrt(np.maximum(polarized - M, 0) / 2) *
+                   np.exp(1j * np.arctan2(stokes[:, 3], stokes[:, 2])))
+    return jones
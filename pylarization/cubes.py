@@ -0,0 +1,190 @@
+"""
+Module containing classes describing Stokes and Mueller images.
+
+Images are usually memory-mapped from files and processed tile by tile,
+so they never have to fit into memory as a whole.
+"""
+import numpy as np
+from pylarization.vectors import StokesVectorArray
+from pylarization.matrices import MuellerMatrixArray
+from pylarization.precision import float_dtype
+
+
+class _Cube(object):
+    """
+    Abstract image class.
+    Not to be used directly.
+
+    Parameters
+    ----------
+    :data:
+        (H, W, ...) array, usually a np.memmap.
+    :tile_bytes:
+        Approximate size of a single tile in bytes.
+
+    Attributes
+    ----------
+    :_data:
+        Full image.
+    :_tile_rows:
+        Number of image rows in a single tile.
+    """
+
+    _pixel_shape = None
+    _array_class = None
+
+    def __init__(self, data, tile_bytes=2**24):
+        if data.ndim != 2 + len(self._pixel_shape) or \
+                data.shape[2:] != self._pixel_shape:
+            raise ValueError("Wrong cube shape")
+        self._data = data
+        row_bytes = data.itemsize * int(np.prod(data.shape[1:]))
+        self._tile_rows = max(1, tile_bytes // max(row_bytes, 1))
+
+    @classmethod
+    def open(cls, path, mode='r', tile_bytes=2**24):
+        """
+        Memory-map a cube stored in a .npy file.
+        """
+        return cls(np.load(path, mmap_mode=mode), tile_bytes)
+
+    @classmethod
+    def open_raw(cls, path, height, width, dtype=float, offset=0, mode='r',
+                 tile_bytes=2**24):
+        """
+        Memory-map a cube stored as raw pixels in C order.
+        """
+        shape = (height, width) + cls._pixel_shape
+        data = np.memmap(path, dtype=dtype, mode=mode, offset=offset,
+                         shape=shape)
+        return cls(data, tile_bytes)
+
+    @classmethod
+    def create(cls, path, height, width, dtype=float, tile_bytes=2**24):
+        """
+        Create a new .npy file holding a cube and memory-map it.
+        """
+        data = np.lib.format.open_memmap(
+            path, mode='w+', dtype=dtype,
+            shape=(height, width) + cls._pixel_shape)
+        return cls(data, tile_bytes)
+
+    @property
+    def data(self):
+        return self._data
+
+    @property
+    def shape(self):
+        return self._data.shape
+
+    def _tile_slices(self):
+        for start in range(0, self._data.shape[0], self._tile_rows):
+            yield slice(start, min(start + self._tile_rows,
+                                   self._data.shape[0]))
+
+    def _tile(self, rows):
+        tile = np.asarray(self._data[rows])
+        return self._array_class.from_matrix(
+            tile.reshape((-1,) + self._pixel_shape))
+
+    def tiles(self):
+        """
+        Iterate over tiles of the image.
+
+        Yields
+        ------
+        tuple
+            Slice of rows covered by the tile and the tile itself
+            as a flat batch of pixels.
+        """
+        for rows in self._tile_slices():
+            yield rows, self._tile(rows)
+
+    def flush(self):
+        flush = getattr(self._data, 'flush', None)
+        if flush is not None:
+            flush()
+
+
+class MuellerCube(_Cube):
+    """
+    Class describing an image of Mueller matrices,
+    i.e. an optical element varying from pixel to pixel.
+
+    Parameters
+    ----------
+    :data:
+        (H, W, 4, 4) array, usually a np.memmap.
+    """
+
+    _pixel_shape = (4, 4)
+    _array_class = MuellerMatrixArray
+
+
+class StokesCube(_Cube):
+    """
+    Class describing an image of Stokes vectors.
+
+    Parameters
+    ----------
+    :data:
+        (H, W, 4) array, usually a np.memmap.
+    """
+
+    _pixel_shape = (4,)
+    _array_class = StokesVectorArray
+
+    def apply(self, operator, path, dtype=None):
+        """
+        Transform every pixel and write the result to a new cube.
+
+        Parameters
+        ----------
+        :operator:
+            MuellerMatrix applied to every pixel,
+            or MuellerCube of the same height and width applied per pixel.
+        :path:
+            Path of the .npy file created for the result.
+
+        Returns
+        -------
+        StokesCube
+            Memory-mapped result.
+        """
+        height, width = self.shape[:2]
+        if isinstance(operator, MuellerCube) and \
+                operator.shape[:2] != (height, width):
+            raise ValueError("Cubes of different size")
+        result = StokesCube.create(path, height, width,
+                                   dtype or self._data.dtype)
+        for rows in self._tile_slices():
+            if isinstance(operator, MuellerCube):
+                product = operator._tile(rows) @ self._tile(rows)
+            else:
+                product = operator @ self._tile(rows)
+            result._data[rows] = product.vector.reshape(-1, width, 4)
+        result.flush()
+        return result
+
+    def ellipse_parameters(self, path):
+        """
+        Calculate azimuth, ellipticity angle and degree of polarization
+        of every pixel and write them to a new (H, W, 3) .npy file.
+
+        Returns
+        -------
+        np.memmap
+            Memory-mapped result.
+        """
+        height, width = self.shape[:2]
+        result = np.lib.format.open_memmap(
+            path, mode='w+', dtype=float_dtype(like=self._data),
+            shape=(height, width, 3))
+        for rows, tile in self.tiles():
+            azimuth, ellipticity_angle = tile.ellipse_angles()[:2]
+            parameters = result[rows].reshape(-1, 3)
+            parameters[:, 0] = azimuth
+            parameters[:, 1] = ellipticity_angle
+            parameters[:, 2] = tile.degree_of_polarization
+        result.flush()
+        return result
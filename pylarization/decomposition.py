@@ -0,0 +1,170 @@
+"""
+Module containing the Lu-Chipman polar decomposition of Mueller matrices.
+
+Every matrix is split as M = M_depolarizer @ M_retarder @ M_diattenuator.
+Whole stacks are decomposed with batched linear algebra. The square root
+of m' m'^T needed by the depolarizer comes from a symmetric eigenvalue
+decomposition, so no matrix is ever inverted by a solver that could
+fail on a single singular pixel. Quantities that are undefined for a
+pixel, e.g. the retardance behind an ideal polarizer, are NaN instead.
+"""
+import numpy as np
+from pylarization.matrices import MuellerMatrixArray
+from pylarization.precision import float_dtype
+
+
+# Relative threshold below which diattenuation is ideal (D = 1)
+# and the depolarizer is singular.
+_TOLERANCE = 1e-10
+
+
+def _block(top_left, top_right, bottom_left, bottom_right):
+    matrix_ = np.empty(bottom_right.shape[:-2] + (4, 4),
+                       dtype=bottom_right.dtype)
+    matrix_[:, 0, 0] = top_left
+    matrix_[:, 0, 1:] = top_right
+    matrix_[:, 1:, 0] = bottom_left
+    matrix_[:, 1:, 1:] = bottom_right
+    return matrix_
+
+
+class LuChipmanDecomposition(object):
+    """
+    Class holding results of the Lu-Chipman decomposition of a stack
+    of Mueller matrices. Use lu_chipman() to create it.
+
+    Attributes
+    ----------
+    :transmittance:
+        M00 of every matrix.
+    :diattenuation:
+        0. <= diattenuation <= 1.0
+    :retardance:
+        Total retardance, 0. <= retardance <= pi.
+    :linear_retardance:
+        Linear component of the retardance.
+    :fast_axis:
+        Orientation of the fast axis of the linear retardance,
+        measured like the angle of a JonesMatrix element.
+    :depolarization_power:
+        1 - |tr(m_depolarizer)| / 3, 0 for non-depolarizing matrices.
+    :depolarization_index:
+        Gil-Bernabeu depolarization index of the whole matrix,
+        1 for non-depolarizing matrices.
+    :valid:
+        Whether the matrix could be decomposed completely.
+        Diattenuation and the depolarization index are always
+        available for matrices transmitting light.
+    """
+
+    def __init__(self, transmittance, diattenuator, retarder, depolarizer,
+                 depolarization_index, valid):
+        self.transmittance = transmittance
+        self._diattenuator = diattenuator
+        self._retarder = retarder
+        self._depolarizer = depolarizer
+        self.depolarization_index = depolarization_index
+        self.valid = valid
+
+        d = diattenuator[:, 0, 1:]
+        self.diattenuation = np.sqrt(np.square(d).sum(axis=1))
+        mR = retarder[:, 1:, 1:]
+        trace = np.trace(mR, axis1=1, axis2=2)
+        self.retardance = np.arccos(np.clip((trace - 1) / 2, -1, 1))
+        linear = np.sqrt(np.square(mR[:, 0, 0] + mR[:, 1, 1]) +
+                         np.square(mR[:, 1, 0] - mR[:, 0, 1]))
+        self.linear_retardance = np.arccos(np.clip(linear - 1, -1, 1))
+        self.fast_axis = 0.5 * np.arctan2(mR[:, 0, 2] - mR[:, 2, 0],
+                                          mR[:, 2, 1] - mR[:, 1, 2])
+        trace = np.trace(depolarizer[:, 1:, 1:], axis1=1, axis2=2)
+        self.depolarization_power = 1 - np.abs(trace) / 3
+
+    def __len__(self):
+        return len(self.transmittance)
+
+    @property
+    def diattenuator(self):
+        return MuellerMatrixArray.from_matrix(self._diattenuator)
+
+    @property
+    def retarder(self):
+        return MuellerMatrixArray.from_matrix(self._retarder)
+
+    @property
+    def depolarizer(self):
+        return MuellerMatrixArray.from_matrix(self._depolarizer)
+
+
+def lu_chipman(mueller):
+    """
+    Decompose Mueller matrices into diattenuators, retarders
+    and depolarizers.
+
+    Parameters
+    ----------
+    :mueller:
+        MuellerMatrix, MuellerMatrixArray, (4, 4) or (N, 4, 4) ndarray.
+
+    Returns
+    -------
+    LuChipmanDecomposition
+        Arrays of N results, N = 1 for a single matrix.
+        Diattenuator, retarder and depolarizer are normalized,
+        so the transmittance has to be applied separately.
+    """
+    matrix_ = np.asarray(getattr(mueller, 'matrix', mueller))
+    matrix_ = matrix_.astype(float_dtype(like=matrix_), copy=False)
+    matrix_ = matrix_.reshape(-1, 4, 4)
+    size = matrix_.shape[0]
+    identity = np.eye(3, dtype=matrix_.dtype)
+    transmittance = matrix_[:, 0, 0].copy()
+
+    # pixels without light are replaced by the identity and masked
+    lit = (transmittance > 0) & np.isfinite(matrix_).all(axis=(1, 2))
+    m = np.where(lit[:, None, None],
+                 matrix_ / np.where(lit, transmittance, 1)[:, None, None],
+                 np.eye(4, dtype=matrix_.dtype))
+    depolarization_index = np.sqrt(
+        np.maximum(np.square(m).sum(axis=(1, 2)) - 1, 0) / 3)
+
+    # diattenuator, the inverse exists only for D < 1
+    d = m[:, 0, 1:]
+    D = np.sqrt(np.square(d).sum(axis=1))
+    partial = D < 1 - _TOLERANCE
+    a = np.sqrt(np.maximum(1 - np.square(D), 0))
+    unit = np.divide(d, D[:, None], out=np.zeros_like(d),
+                     where=D[:, None] > 0)
+    mD = (a[:, None, None] * identity +
+          (1 - a)[:, None, None] * unit[:, :, None] * unit[:, None, :])
+    diattenuator = _block(1, d, d, mD)
+    scale = np.where(partial, 1 - np.square(D), 1)[:, None, None]
+    safe_d = np.where(partial[:, None], d, 0)
+    safe_mD = np.where(partial[:, None, None], mD, identity)
+    inverse = _block(1, -safe_d, -safe_d, safe_mD) / scale
+    rest = np.matmul(m, inverse)
+
+    # depolarizer m_delta = +-sqrt(m' m'^T), retarder m_R = m_delta^-1 m'
+    mp = rest[:, 1:, 1:]
+    eigenvalues, eigenvectors = np.linalg.eigh(
+        np.matmul(mp, np.swapaxes(mp, 1, 2)))
+    roots = np.sqrt(np.maximum(eigenvalues, 0))
+    regular = roots[:, 0] > _TOLERANCE * np.maximum(roots[:, 2], 1e-300)
+    sign = np.where(np.linalg.det(mp) < 0, -1, 1)[:, None, None]
+    transposed = np.swapaxes(eigenvectors, 1, 2)
+    mDelta = sign * np.matmul(eigenvectors * roots[:, None, :], transposed)
+    inverse_roots = np.divide(1, roots, out=np.zeros_like(roots),
+                              where=regular[:, None])
+    mR = sign * np.matmul(
+        np.matmul(eigenvectors * inverse_roots[:, None, :], transposed), mp)
+    zeros = np.zeros((size, 3), dtype=matrix_.dtype)
+    depolarizer = _block(1, zeros, rest[:, 1:, 0], mDelta)
+    retarder = _block(1, zeros, zeros, mR)
+
+    # undefined parts are NaN
+    diattenuator[~lit] = np.nan
+    depolarizer[~(lit & partial)] = np.nan
+    valid = lit & partial & regular
+    retarder[~valid] = np.nan
+    depolarization_index[~lit] = np.nan
+    return LuChipmanDecomposition(transmittance, diattenuator, retarder,
+                                  depolarizer, depolarization_index, valid)
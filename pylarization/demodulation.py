@@ -0,0 +1,132 @@
+"""
+Module containing demodulation of intensity traces of rotating-element
+polarimeters into Stokes vectors.
+
+The detected intensity is I(t) = A(t) . S, where A(t) is the first row
+of the Mueller matrix of the instrument at sample t. The instrument
+is modelled with JonesMatrix elements, so A(t) holds only a few
+harmonics of the rotation. Traces are reduced with a real FFT and the
+Stokes vector is recovered from those harmonics with a demodulation
+matrix computed once per instrument.
+"""
+import numpy as np
+from pylarization.vectors import StokesVector, StokesVectorArray
+from pylarization.matrices import JonesMatrix, JonesMatrixArray
+from pylarization.conversions import jones_to_mueller
+from pylarization.precision import float_dtype
+
+
+class RotatingElementPolarimeter(object):
+    """
+    Class describing a polarimeter with a rotating element in front
+    of a detector, sampled uniformly over whole rotations.
+
+    Parameters
+    ----------
+    :samples:
+        Number of samples in a trace.
+    :element:
+        'retarder' for a rotating retarder followed by a fixed
+        linear analyzer, or 'analyzer' for a rotating linear analyzer.
+        A rotating analyzer can not measure circular polarization,
+        so S3 of demodulated vectors is always 0.
+    :retardance:
+        Retardance of the rotating retarder.
+    :analyzer_angle:
+        Orientation of the fixed analyzer.
+    :rotations:
+        Number of rotations of the element during a trace.
+    :offset:
+        Orientation of the rotating element at the first sample.
+
+    Attributes
+    ----------
+    :_analyzers:
+        (T, 4) analyzer vectors A(t) of the instrument.
+    :_harmonics:
+        Indices of harmonics carrying the signal.
+    :_demodulation:
+        (4, 2H) matrix mapping real and imaginary parts of harmonics
+        onto Stokes vectors.
+    """
+
+    _elements = ('retarder', 'analyzer')
+
+    def __init__(self, samples, element='retarder', retardance=np.pi / 2,
+                 analyzer_angle=0.0, rotations=1, offset=0.0):
+        if element not in self._elements:
+            raise ValueError("Unknown rotating element")
+        angles = offset + 2 * np.pi * rotations * np.arange(samples) / samples
+        if element == 'retarder':
+            rotating = JonesMatrixArray.sweep(angles, retardance, 1.0)
+            instrument = JonesMatrix(analyzer_angle, 0.0, 0.0) @ rotating
+        else:
+            instrument = JonesMatrixArray.sweep(angles, 0.0, 0.0)
+        self._analyzers = jones_to_mueller(instrument).matrix[:, 0, :]
+
+        spectrum = np.fft.rfft(self._analyzers, axis=0)
+        magnitude = np.abs(spectrum).max(axis=1)
+        self._harmonics = np.flatnonzero(magnitude > 1e-9 * magnitude.max())
+        if 2 * self._harmonics[-1] >= samples:
+            raise ValueError("Too few samples to resolve the modulation")
+        spectrum = spectrum[self._harmonics]
+        self._demodulation = np.linalg.pinv(
+            np.concatenate([spectrum.real, spectrum.imag]))
+
+    def __len__(self):
+        return self._analyzers.shape[0]
+
+    @property
+    def analyzers(self):
+        return self._analyzers
+
+    @property
+    def harmonics(self):
+        return self._harmonics
+
+    def measure(self, stokes):
+        """
+        Calculate traces measured for given Stokes vectors.
+
+        Parameters
+        ----------
+        :stokes:
+            StokesVector, StokesVectorArray or (N, 4) ndarray.
+
+        Returns
+        -------
+        ndarray
+            (T,) trace for a single vector, (N, T) otherwise.
+        """
+        if isinstance(stokes, StokesVector):
+            return self._analyzers @ stokes.vector[:, 0]
+        vectors = np.asarray(getattr(stokes, 'vector', stokes))
+        return vectors @ self._analyzers.T
+
+    def demodulate(self, traces, precision=None):
+        """
+        Demodulate intensity traces into Stokes vectors.
+
+        Parameters
+        ----------
+        :traces:
+            (T,) trace or (N, T) batch of traces.
+        :precision:
+            'single' or 'double', the precision of traces when omitted.
+
+        Returns
+        -------
+        StokesVector for a single trace, StokesVectorArray otherwise.
+        """
+        traces = np.asarray(traces)
+        if traces.shape[-1] != len(self):
+            raise ValueError("Expected traces of {} samples, got {}".format(
+                len(self), traces.shape[-1]))
+        dtype = float_dtype(precision, traces)
+        spectrum = np.fft.rfft(traces.reshape(-1, len(self)), axis=1)
+        spectrum = spectrum[:, self._harmonics]
+        stokes = np.concatenate([spectrum.real, spectrum.imag], axis=1)
+        stokes = (stokes @ self._demodulation.T).astype(dtype, copy=False)
+        if traces.ndim == 1:
+            return StokesVector._from_buffer(stokes.reshape(4, 1))
+        return StokesVectorArray.from_matrix(stokes)
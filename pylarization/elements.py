@@ -1,14 +1,19 @@
 """
 Enums for popular optical elements.
+Values of members are built on first access, always in double precision.
 """
 
-from enum import Enum
-from math import sqrt, pi
-from pylarization.matrices import JonesMatrix
+from functools import partial
+from pylarization.registry import LazyEnum
 
 
-class JonesMatrixOpticalElements(Enum):
-    HORIZONTAL_LINEAR_POLARIZER = JonesMatrix.from_matrix([[1.0, 0.0],
-                                                           [0.0, 0.0]])
-    VERTICAL_LINEAR_POLARIZER = JonesMatrix.from_matrix([[0.0, 0.0],
-                                                         [0.0, 1.0]])
+class JonesMatrixOpticalElements(LazyEnum):
+    HORIZONTAL_LINEAR_POLARIZER = (((1.0, 0.0),
+                                    (0.0, 0.0)),)
+    VERTICAL_LINEAR_POLARIZER = (((0.0, 0.0),
+                                  (0.0, 1.0)),)
+
+    @staticmethod
+    def _factory():
+        from pylarization.matrices import JonesMatrix
+        return partial(JonesMatrix.from_matrix, precision='double')
@@ -2,6 +2,8 @@
 Module containing a class describing polarization state using trigonometry.
 """
 import numpy as np
+from pylarization import kernels
+from pylarization.precision import float_dtype
 
 
 class PolarizationEllipse(object):
@@ -19,13 +21,24 @@ class PolarizationEllipse(object):
 
     Attributes
     ----------
-    :_ellipse:
-        Float matrix holding values of X and Y amplitudes of
-        electric field vector as well as the phase.
+    :_E0x:
+        Amplitude along the X axis as a plain float.
+    :_E0y:
+        Amplitude along the Y axis as a plain float.
+    :_phase:
+        Phase difference as a plain float.
+    :_derived:
+        Cached intensity and angles of the ellipse,
+        None until any of them is read.
     """
 
+    __slots__ = ('_E0x', '_E0y', '_phase', '_derived')
+
     def __init__(self, E0x, E0y, phase):
-        self._ellipse = np.array([[E0x], [E0y], [phase]], dtype=float)
+        self._E0x = float(E0x)
+        self._E0y = float(E0y)
+        self._phase = float(phase)
+        self._derived = None
 
     @classmethod
     def from_matrix(cls, matrix_):
@@ -35,6 +48,32 @@ class PolarizationEllipse(object):
                       )
         return ellipse
 
+    def _invalidate(self):
+        """
+        Drops cached derived parameters.
+        Has to be called whenever amplitudes or the phase change.
+        """
+        self._derived = None
+
+    def _derive(self):
+        """
+        Calculates intensity and all angles of the ellipse at once
+        and caches them until the next call to _invalidate().
+        """
+        angles = kernels.ellipse_angles(self._E0x, self._E0y, self._phase)
+        self._derived = ((self._E0x**2 + self._E0y**2,) +
+                         tuple(float(angle) for angle in angles))
+        return self._derived
+
+    @property
+    def _ellipse(self):
+        """
+        Float matrix holding values of X and Y amplitudes of
+        electric field vector as well as the phase.
+        """
+        return np.array([[self._E0x], [self._E0y], [self._phase]],
+                        dtype=float)
+
     @property
     def E0x(self):
         """
@@ -45,7 +84,7 @@ class PolarizationEllipse(object):
         float
             Amplitude along X axis.
         """
-        return self._ellipse[0].item()
+        return self._E0x
 
     @property
     def E0y(self):
@@ -57,7 +96,7 @@ class PolarizationEllipse(object):
         float
             Amplitude along Y axis.
         """
-        return self._ellipse[1].item()
+        return self._E0y
 
     @property
     def phase(self):
@@ -69,7 +108,7 @@ class PolarizationEllipse(object):
         float
             Phase in radians.
         """
-        return self._ellipse[2].item()
+        return self._phase
 
     @property
     def intensity(self):
@@ -81,7 +120,7 @@ class PolarizationEllipse(object):
         float
             Intensity of the light beam.
         """
-        return np.square(self._ellipse[:2]).sum()
+        return (self._derived or self._derive())[0]
 
     @property
     def azimuth(self):
@@ -97,17 +136,7 @@ class PolarizationEllipse(object):
 
             -diagonal_angle <= azimuth <= diagonal_angle
         """
-        cos_phase = np.cos(self.phase)
-        try:
-            tan_b = self.E0y / self.E0x
-            tan_2b = 2 * tan_b / (1 - tan_b**2)
-            azimuth = 0.5 * np.arctan(tan_2b * cos_phase)
-        except ZeroDivisionError:
-            denominator = self.E0x**2 - self.E0y**2
-            numerator = 2 * self.E0x * self.E0y * cos_phase
-            azimuth = 0.5 * np.arctan2(numerator, denominator)
-        finally:
-            return azimuth
+        return (self._derived or self._derive())[1]
 
     @property
     def ellipticity_angle(self, degrees=False):
@@ -123,10 +152,7 @@ class PolarizationEllipse(object):
 
             -pi/4 <= ellipticity_angle <= pi/4
         """
-        numerator = 2 * self.E0x * self.E0y * np.sin(self.phase)
-        denominator = self.E0x**2 + self.E0y**2
-        ellipticity_angle = 0.5 * np.arcsin(numerator / denominator)
-        return ellipticity_angle
+        return (self._derived or self._derive())[2]
 
     @property
     def diagonal_angle(self, degrees=False):
@@ -142,11 +168,7 @@ class PolarizationEllipse(object):
 
             0 <= diagonal_angle <= pi/2
         """
-        diagonal_angle = np.arctan2(
-            self.E0y,
-            self.E0x
-            )
-        return np.abs(diagonal_angle)
+        return (self._derived or self._derive())[3]
 
     @property
     def complement_diagonal_angle(self):
@@ -162,7 +184,7 @@ class PolarizationEllipse(object):
 
             0 <= complement_diagonal_angle <= pi/2
         """
-        return np.pi / 2 - self.diagonal_angle
+        return (self._derived or self._derive())[4]
 
     def __str__(self):
         return "E0x = {:5.3f}, E0y = {:5.3f}, phase = {:5.3f}".format(
@@ -172,7 +194,130 @@ class PolarizationEllipse(object):
             )
 
     def __add__(self, other):
-        ellipse = self._ellipse + other._ellipse
-        return PolarizationEllipse.from_matrix(ellipse)
+        return PolarizationEllipse(self._E0x + other._E0x,
+                                   self._E0y + other._E0y,
+                                   self._phase + other._phase)
 
     ___radd__ = __add__
+
+
+class PolarizationEllipseArray(object):
+    """
+    Class for describing many polarization states at once.
+    Every parameter is held as an array with one entry per state.
+
+    Parameters
+    ----------
+    :E0x:
+        Amplitudes of the electric field vector along the X axis.
+    :E0y:
+        Amplitudes of the electric field vector along the Y axis.
+    :phase:
+        Phase differences between E0x and E0y.
+    :precision:
+        'single' or 'double', the global default when omitted.
+
+    Attributes
+    ----------
+    :_ellipse:
+        (N, 3) float matrix holding X and Y amplitudes
+        and the phase of every state.
+    """
+
+    def __init__(self, E0x, E0y, phase, precision=None):
+        E0x, E0y, phase = np.broadcast_arrays(E0x, E0y, phase)
+        self._ellipse = np.empty((E0x.size, 3), dtype=float_dtype(precision))
+        self._ellipse[:, 0] = E0x.ravel()
+        self._ellipse[:, 1] = E0y.ravel()
+        self._ellipse[:, 2] = phase.ravel()
+
+    @classmethod
+    def from_matrix(cls, matrix_, precision=None):
+        matrix_ = np.asarray(matrix_, dtype=float_dtype(precision, matrix_))
+        if matrix_.ndim != 2 or matrix_.shape[1] != 3:
+            raise ValueError("Wrong matrix shape")
+        ellipse = cls.__new__(cls)
+        ellipse._ellipse = matrix_
+        return ellipse
+
+    @property
+    def E0x(self):
+        """
+        Return amplitudes along X axis.
+        """
+        return self._ellipse[:, 0]
+
+    @property
+    def E0y(self):
+        """
+        Return amplitudes along Y axis.
+        """
+        return self._ellipse[:, 1]
+
+    @property
+    def phase(self):
+        """
+        Return phase differences of light amplitudes in radians.
+        """
+        return self._ellipse[:, 2]
+
+    @property
+    def intensity(self):
+        """
+        Intensities of the light beams.
+        """
+        return kernels.intensity(self.E0x, self.E0y)
+
+    @property
+    def azimuth(self):
+        """
+        Azimuths (orientation angles) of polarized light in radians.
+        """
+        return kernels.azimuth(self.E0x, self.E0y, self.phase)
+
+    @property
+    def ellipticity_angle(self):
+        """
+        Ellipticity angles of polarized light in radians.
+        """
+        return kernels.ellipticity_angle(self.E0x, self.E0y, self.phase)
+
+    @property
+    def diagonal_angle(self):
+        """
+        Diagonal angles of the rectangles created by light amplitudes.
+        """
+        return kernels.diagonal_angle(self.E0x, self.E0y)
+
+    @property
+    def complement_diagonal_angle(self):
+        """
+        Complements of diagonal angles.
+        """
+        return kernels.complement_diagonal_angle(self.E0x, self.E0y)
+
+    def ellipse_angles(self):
+        """
+        Calculate all angles of the polarization ellipses in one pass.
+
+        Returns
+        -------
+        tuple
+            Arrays of azimuths, ellipticity angles, diagonal angles and
+            complements of the diagonal angles.
+        """
+        return kernels.ellipse_angles(self.E0x, self.E0y, self.phase)
+
+    def __len__(self):
+        return self._ellipse.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return PolarizationEllipse.from_matrix(self._ellipse[index])
+        return type(self).from_matrix(self._ellipse[index])
+
+    def __add__(self, other):
+        ellipse = self._ellipse + other._ellipse.reshape(-1, 3)
+        return PolarizationEllipseArray.from_matrix(ellipse)
+
+    __radd__ = __add__
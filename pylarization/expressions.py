@@ -0,0 +1,184 @@
+"""
+Module containing lazy evaluation of chains of @ operations.
+
+Writing lazy(M1) @ M2 @ M3 @ v does not calculate anything,
+it only records operands. Evaluation picks the cheapest order of
+multiplications and performs all of them in a single einsum call.
+"""
+import numpy as np
+from pylarization.vectors import JonesVector, StokesVector
+from pylarization.vectors import JonesVectorArray, StokesVectorArray
+from pylarization.matrices import JonesMatrix, MuellerMatrix
+from pylarization.matrices import JonesMatrixArray, MuellerMatrixArray
+
+
+_FAMILIES = (
+    (JonesMatrix, JonesMatrixArray, JonesVector, JonesVectorArray),
+    (MuellerMatrix, MuellerMatrixArray, StokesVector, StokesVectorArray),
+    )
+
+_VECTORS = tuple(kind for family in _FAMILIES for kind in family[2:])
+
+
+def lazy(operand):
+    """
+    Start a lazily evaluated chain of @ operations.
+    """
+    return MatMulExpression([operand])
+
+
+class MatMulExpression(object):
+    """
+    Class describing a chain of matrix products, which is evaluated
+    only when evaluate() is called.
+
+    Parameters
+    ----------
+    :operands:
+        Matrices, matrix stacks and, as the last operand,
+        optionally a vector or a vector batch.
+
+    Attributes
+    ----------
+    :_operands:
+        List of operands in the order of writing.
+    """
+
+    def __init__(self, operands):
+        self._operands = list(operands)
+        if any(isinstance(operand, _VECTORS)
+               for operand in self._operands[:-1]):
+            raise TypeError("Only the last operand can be a vector")
+
+    @property
+    def operands(self):
+        return tuple(self._operands)
+
+    def __matmul__(self, other):
+        if isinstance(other, MatMulExpression):
+            return MatMulExpression(self._operands + other._operands)
+        return MatMulExpression(self._operands + [other])
+
+    def __rmatmul__(self, other):
+        return MatMulExpression([other] + self._operands)
+
+    def _family(self):
+        for family in _FAMILIES:
+            if all(isinstance(operand, family) for operand in self._operands):
+                return family
+        raise TypeError("Operands are not of the same kind")
+
+    @staticmethod
+    def _batch_size(operand):
+        if isinstance(operand, (JonesMatrixArray, MuellerMatrixArray,
+                                JonesVectorArray, StokesVectorArray)):
+            return len(operand)
+        return 1
+
+    def _association(self):
+        """
+        Find the cheapest order of multiplications
+        with the classic matrix-chain dynamic programming.
+
+        The cost of a product is the number of multiplications of scalars,
+        so batches of vectors are pushed through stacks of matrices,
+        while single matrices are folded together before touching a batch.
+
+        Returns
+        -------
+        tuple
+            Split points, splits[i][j] being the last product
+            of operands i..j, and the total cost.
+        """
+        family = self._family()
+        size = family[0]._required_shape[0]
+        batches = [self._batch_size(operand) for operand in self._operands]
+        vector_last = isinstance(self._operands[-1], family[2:])
+        count = len(self._operands)
+        cost = [[0] * count for _ in range(count)]
+        batch = [[batches[i] if i == j else 0 for j in range(count)]
+                 for i in range(count)]
+        splits = [[i] * count for i in range(count)]
+        for length in range(2, count + 1):
+            for i in range(count - length + 1):
+                j = i + length - 1
+                columns = 1 if vector_last and j == count - 1 else size
+                cost[i][j] = None
+                for m in range(i, j):
+                    result = max(batch[i][m], batch[m + 1][j])
+                    candidate = (cost[i][m] + cost[m + 1][j] +
+                                 result * size * size * columns)
+                    if cost[i][j] is None or candidate < cost[i][j]:
+                        cost[i][j] = candidate
+                        splits[i][j] = m
+                        batch[i][j] = result
+        return splits, cost[0][count - 1]
+
+    def _path(self, splits):
+        """
+        Translate split points into an einsum contraction path.
+        """
+        current = [(i, i) for i in range(len(self._operands))]
+        path = ['einsum_path']
+
+        def contract(i, j):
+            if i == j:
+                return
+            m = splits[i][j]
+            contract(i, m)
+            contract(m + 1, j)
+            positions = (current.index((i, m)), current.index((m + 1, j)))
+            for position in sorted(positions, reverse=True):
+                del current[position]
+            current.append((i, j))
+            path.append(positions)
+
+        contract(0, len(self._operands) - 1)
+        return path
+
+    def evaluate(self):
+        """
+        Calculate the product using the cheapest order of multiplications.
+
+        Returns
+        -------
+        object
+            Vector, vector batch, matrix or matrix stack,
+            depending on the operands.
+        """
+        family = self._family()
+        matrix_class, stack_class, vector_class, vector_array_class = family
+        if len(self._operands) == 1:
+            return self._operands[0]
+        vector_last = isinstance(self._operands[-1], family[2:])
+        letters = 'abcdefghijklmnopqrstuvwxyz'
+        count = len(self._operands)
+        if count + 1 > len(letters):
+            raise ValueError("Chain too long")
+        subscripts = []
+        arrays = []
+        for index, operand in enumerate(self._operands):
+            if vector_last and index == count - 1:
+                subscripts.append('...' + letters[index])
+                if isinstance(operand, vector_array_class):
+                    arrays.append(operand.vector)
+                else:
+                    arrays.append(operand.vector.ravel())
+            else:
+                subscripts.append('...' + letters[index:index + 2])
+                arrays.append(operand.matrix)
+        output = '...' + letters[0]
+        if not vector_last:
+            output += letters[count]
+        splits, _ = self._association()
+        product = np.einsum(','.join(subscripts) + '->' + output, *arrays,
+                            optimize=self._path(splits))
+        batched = any(isinstance(operand, (stack_class, vector_array_class))
+                      for operand in self._operands)
+        if vector_last:
+            if batched:
+                return vector_array_class.from_matrix(product)
+            return vector_class.from_matrix(product.reshape(-1, 1))
+        if batched:
+            return stack_class.from_matrix(product)
+        return matrix_class.from_matrix(product)
@@ -0,0 +1,104 @@
+"""
+Module containing vectorized kernels calculating parameters
+of the polarization ellipse.
+All functions accept scalars or arrays of amplitudes and phases
+and never branch on the values, so whole batches are handled in one call.
+"""
+import numpy as np
+
+
+def intensity(E0x, E0y):
+    """
+    Intensity of a beam.
+    """
+    return np.square(E0x) + np.square(E0y)
+
+
+def azimuth(E0x, E0y, phase):
+    """
+    Azimuth (orientation angle) of polarized light in radians.
+
+    The azimuth is folded into the range of (-pi/4, pi/4] unless
+    E0x == 0 or E0x == E0y, in which case the full arctan2 range is used.
+    """
+    E0x = np.asarray(E0x)
+    E0y = np.asarray(E0y)
+    numerator = 2 * E0x * E0y * np.cos(phase)
+    denominator = np.square(E0x) - np.square(E0y)
+    return _azimuth(E0x, numerator, denominator)
+
+
+def ellipticity_angle(E0x, E0y, phase):
+    """
+    Ellipticity angle of polarized light in radians.
+    Beams with zero intensity have an ellipticity angle of 0.
+
+    Expected values are in the range of:
+
+    -pi/4 <= ellipticity_angle <= pi/4
+    """
+    E0x = np.asarray(E0x)
+    E0y = np.asarray(E0y)
+    numerator = 2 * E0x * E0y * np.sin(phase)
+    return _ellipticity_angle(numerator, intensity(E0x, E0y))
+
+
+def diagonal_angle(E0x, E0y):
+    """
+    Diagonal angle of the rectangle created by light amplitudes.
+
+    Expected values are in the range of:
+
+    0 <= diagonal_angle <= pi/2
+    """
+    return np.abs(np.arctan2(E0y, E0x))
+
+
+def complement_diagonal_angle(E0x, E0y):
+    """
+    Complement of diagonal angle.
+
+    Expected values are in the range of:
+
+    0 <= complement_diagonal_angle <= pi/2
+    """
+    return np.pi / 2 - diagonal_angle(E0x, E0y)
+
+
+def ellipse_angles(E0x, E0y, phase):
+    """
+    Calculate all angles of the polarization ellipse in one pass.
+    Intermediate products are shared between the angles.
+
+    Returns
+    -------
+    tuple
+        Azimuth, ellipticity angle, diagonal angle and
+        complement of the diagonal angle.
+    """
+    E0x = np.asarray(E0x)
+    E0y = np.asarray(E0y)
+    square_x = np.square(E0x)
+    square_y = np.square(E0y)
+    product = 2 * E0x * E0y
+    diagonal = diagonal_angle(E0x, E0y)
+    return (_azimuth(E0x, product * np.cos(phase), square_x - square_y),
+            _ellipticity_angle(product * np.sin(phase), square_x + square_y),
+            diagonal,
+            np.pi / 2 - diagonal)
+
+
+def _azimuth(E0x, numerator, denominator):
+    # Flipping signs of both arctan2 arguments turns it into
+    # arctan(numerator / denominator), which folds the azimuth.
+    fold = (E0x != 0) & (denominator != 0)
+    sign = np.where(fold, np.sign(denominator), 1.0)
+    return 0.5 * np.arctan2(sign * numerator, sign * denominator)
+
+
+def _ellipticity_angle(numerator, denominator):
+    numerator = np.asarray(numerator)
+    ratio = np.divide(numerator, denominator,
+                      out=np.zeros_like(numerator),
+                      where=denominator != 0)
+    return 0.5 * np.arcsin(np.clip(ratio, -1.0, 1.0))
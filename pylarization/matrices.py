@@ -6,7 +6,9 @@ It also contains the coherency matrix, which is used to describe polarization.
 import numpy as np
 import abc
 from pylarization.vectors import JonesVector, StokesVector
+from pylarization.vectors import JonesVectorArray, StokesVectorArray
 from pylarization.ellipse import PolarizationEllipse
+from pylarization.precision import float_dtype, complex_dtype, resolve
 
 
 class _Matrix(abc.ABC):
@@ -16,6 +18,7 @@ class _Matrix(abc.ABC):
     """
 
     _vector_class = None
+    _vector_array_class = None
 
     def _validate_shape(self, matrix_):
         if matrix_.shape != self._required_shape:
@@ -24,10 +27,14 @@ class _Matrix(abc.ABC):
     def __matmul__(self, other):
         if isinstance(other, self._vector_class):
             product = self._matrix @ other.vector
-            return self._vector_class.from_matrix(product)
+            return self._vector_class._from_buffer(product)
+        elif isinstance(other, self._vector_array_class):
+            product = other.vector @ self._matrix.T
+            return self._vector_array_class.from_matrix(product)
         elif isinstance(other, type(self)):
             product = self._matrix @ other.matrix
             return type(self).from_matrix(product)
+        return NotImplemented
 
     def __rmatmul__(self, other):
         raise ValueError("Wrong operation order")
@@ -64,32 +71,53 @@ class JonesMatrix(_Matrix):
         Magnitude of the light that is allowed through the
         absorption axis of the optical element.
         0. <= transparency <= 1.0
+    :precision:
+        'single' or 'double', the global default when omitted.
     """
 
     _required_shape = (2, 2)
     _vector_class = JonesVector
+    _vector_array_class = JonesVectorArray
 
-    def __init__(self, angle=0.0, retardance=0.0, transparency=0.0):
+    def __init__(self, angle=0.0, retardance=0.0, transparency=0.0,
+                 precision=None):
         device_factor = JonesMatrix.device_factor(transparency, retardance)
-        cosine = np.cos(angle)
-        sine = np.sin(angle)
-        self._matrix = np.array(
-            [[cosine + device_factor * sine ** 2,
-              sine * cosine - device_factor * sine * cosine],
-             [sine * cosine - device_factor * sine * cosine,
-              sine + device_factor * cosine ** 2]],
-            dtype=complex)
+        self._matrix = JonesMatrix._element_matrix(
+            np.cos(angle), np.sin(angle), device_factor,
+            complex_dtype(precision))
 
     @classmethod
-    def from_matrix(cls, matrix):
-        JM = cls(0, 0)
-        JM._matrix = np.array(matrix)
+    def from_matrix(cls, matrix, precision=None):
+        JM = cls.__new__(cls)
+        JM._matrix = np.array(matrix, dtype=complex_dtype(precision, matrix))
         return JM
 
     @classmethod
     def device_factor(cls, transparency=0.0, retardance=0.0):
         return transparency * np.exp(1j * retardance)
 
+    @staticmethod
+    def _element_matrix(cosine, sine, device_factor, dtype=complex):
+        """
+        Build matrices of elements rotated by angles given by their
+        cosines and sines. All arguments are broadcast against each other.
+
+        Returns
+        -------
+        ndarray
+            (..., 2, 2) complex matrix.
+        """
+        shape = np.broadcast(cosine, sine, device_factor).shape
+        cosine2 = cosine ** 2
+        sine2 = sine ** 2
+        off_diagonal = sine * cosine - device_factor * sine * cosine
+        matrix = np.empty(shape + (2, 2), dtype=dtype)
+        matrix[..., 0, 0] = cosine2 + device_factor * sine2
+        matrix[..., 0, 1] = off_diagonal
+        matrix[..., 1, 0] = off_diagonal
+        matrix[..., 1, 1] = sine2 + device_factor * cosine2
+        return matrix
+
 
 class MuellerMatrix(_Matrix):
     """
@@ -100,14 +128,157 @@ class MuellerMatrix(_Matrix):
     ----------
     :matrix_:
         4 x 4 matrix representing an optical element.
+    :precision:
+        'single' or 'double', the precision of matrix_ when omitted.
     """
 
     _required_shape = (4, 4)
     _vector_class = StokesVector
+    _vector_array_class = StokesVectorArray
 
-    def __init__(self, matrix_):
+    def __init__(self, matrix_, precision=None):
+        matrix_ = np.asarray(matrix_)
         self._validate_shape(matrix_)
-        self._matrix = np.array(matrix_, dtype=float)
+        self._matrix = np.array(matrix_, dtype=float_dtype(precision, matrix_))
+
+    @classmethod
+    def from_matrix(cls, matrix_, precision=None):
+        return cls(matrix_, precision)
+
+
+class _MatrixArray(abc.ABC):
+    """
+    Abstract class for stacks of matrices.
+    Not to be used directly.
+
+    Parameters
+    ----------
+    :matrix_:
+        (N, n, n) matrix holding N optical elements.
+    :precision:
+        'single' or 'double', the precision of matrix_ when omitted.
+
+    Attributes
+    ----------
+    :_matrix:
+        Full stack of matrices.
+    """
+
+    _matrix_class = None
+    _dtype = None
+
+    def __init__(self, matrix_, precision=None):
+        matrix_ = np.array(matrix_, dtype=self._dtype(precision, matrix_))
+        self._validate_shape(matrix_)
+        self._matrix = matrix_
+
+    @classmethod
+    def from_matrix(cls, matrix_, precision=None):
+        """
+        Create a stack from a (N, n, n) matrix.
+        The matrix is adopted without copying when it already has
+        the right type.
+        """
+        matrix_ = np.asarray(matrix_, dtype=cls._dtype(precision, matrix_))
+        stack = cls.__new__(cls)
+        stack._validate_shape(matrix_)
+        stack._matrix = matrix_
+        return stack
+
+    def _validate_shape(self, matrix_):
+        if (matrix_.ndim != 3 or
+                matrix_.shape[1:] != self._matrix_class._required_shape):
+            raise ValueError("Wrong matrix shape")
+
+    def __matmul__(self, other):
+        matrix_class = self._matrix_class
+        if isinstance(other, (matrix_class._vector_class,
+                              matrix_class._vector_array_class)):
+            size = matrix_class._required_shape[0]
+            vectors = other.vector.reshape(-1, size, 1)
+            product = np.matmul(self._matrix, vectors)[:, :, 0]
+            return matrix_class._vector_array_class.from_matrix(product)
+        elif isinstance(other, (matrix_class, type(self))):
+            product = np.matmul(self._matrix, other.matrix)
+            return type(self).from_matrix(product)
+        return NotImplemented
+
+    def __rmatmul__(self, other):
+        if isinstance(other, self._matrix_class):
+            product = np.matmul(other.matrix, self._matrix)
+            return type(self).from_matrix(product)
+        raise ValueError("Wrong operation order")
+
+    def __len__(self):
+        return self._matrix.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self._matrix_class.from_matrix(self._matrix[index])
+        return type(self).from_matrix(self._matrix[index])
+
+    @property
+    def matrix(self):
+        return self._matrix
+
+
+class JonesMatrixArray(_MatrixArray):
+    """
+    Class describing a stack of Jones matrices,
+    e.g. one optical element per pixel or per wavelength.
+
+    Parameters
+    ----------
+    :matrix_:
+        (N, 2, 2) complex matrix.
+    """
+
+    _matrix_class = JonesMatrix
+    _dtype = staticmethod(complex_dtype)
+
+    @classmethod
+    def sweep(cls, angle=0.0, retardance=0.0, transparency=0.0,
+              precision=None):
+        """
+        Create a stack of elements for every combination of parameters.
+        Parameters are broadcast against each other like NumPy arrays,
+        so a scan of angles over retardances is written as:
+
+        JonesMatrixArray.sweep(angles[:, None], retardances[None, :], 1.0)
+
+        Sine and cosine are calculated once per supplied angle and
+        the device factor once per supplied retardance and transparency.
+
+        Returns
+        -------
+        JonesMatrixArray
+            Stack of matrices flattened in C order.
+            Reshape .matrix to broadcast_shape + (2, 2) to recover the grid.
+        """
+        dtype = float_dtype(precision)
+        angle = np.asarray(angle, dtype=dtype)
+        device_factor = JonesMatrix.device_factor(
+            np.asarray(transparency, dtype=dtype),
+            np.asarray(retardance, dtype=dtype))
+        matrix = JonesMatrix._element_matrix(
+            np.cos(angle), np.sin(angle), device_factor,
+            complex_dtype(precision))
+        return cls.from_matrix(matrix.reshape(-1, 2, 2))
+
+
+class MuellerMatrixArray(_MatrixArray):
+    """
+    Class describing a stack of Mueller matrices,
+    e.g. one optical element per pixel or per wavelength.
+
+    Parameters
+    ----------
+    :matrix_:
+        (N, 4, 4) float matrix.
+    """
+
+    _matrix_class = MuellerMatrix
+    _dtype = staticmethod(float_dtype)
 
 
 class CoherencyMatrix(PolarizationEllipse):
@@ -128,35 +299,43 @@ class CoherencyMatrix(PolarizationEllipse):
     :Iyy:
         Product of electric field vector component along the Y axis
         and it's conjugated number.
+    :precision:
+        'single' or 'double', the global default when omitted.
 
     Attributes
     ----------
     :_matrix:
         Full Coherency Matrix
     """
-    def __init__(self, Ixx, Ixy, Iyx, Iyy):
-        self._matrix = np.array([[Ixx, Ixy], [Iyx, Iyy]], dtype=complex)
+
+    __slots__ = ('_matrix',)
+
+    def __init__(self, Ixx, Ixy, Iyx, Iyy, precision=None):
+        self._matrix = np.array([[Ixx, Ixy], [Iyx, Iyy]],
+                                dtype=complex_dtype(precision))
         super().__init__(
                          self._calc_E0x(),
                          self._calc_E0y(),
                          self._calc_phase()
                         )
 
-    def _calc_E0x():
+    def _calc_E0x(self):
         return np.sqrt(self._matrix.item(0)).real
 
     def _calc_E0y(self):
         return np.sqrt(self._matrix.item(3)).real
 
     def _calc_phase(self):
-        return np.angle(self._matrix.item(1))
+        return np.angle(self._matrix.item(2))
 
     @classmethod
-    def from_matrix(cls, matrix_):
+    def from_matrix(cls, matrix_, precision=None):
+        matrix_ = np.asarray(matrix_)
         matrix = cls(matrix_.item(0),
                      matrix_.item(1),
                      matrix_.item(2),
-                     matrix_.item(3)
+                     matrix_.item(3),
+                     precision=resolve(precision, matrix_)
                      )
         return matrix
 
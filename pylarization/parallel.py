@@ -0,0 +1,364 @@
+"""
+Module containing executors spreading large batches of polarization
+states across several CPU cores.
+
+ProcessExecutor copies batches to shared memory once, so workers only
+receive names of the buffers and the range of rows they have to process.
+Shared memory needs Python 3.8, older interpreters process batches
+serially in the calling process and warn about it.
+ThreadExecutor splits batches into tiles processed by threads,
+relying on NumPy releasing the GIL in heavy operations.
+"""
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from pylarization.vectors import JonesVectorArray, StokesVectorArray
+from pylarization.matrices import _Matrix, _MatrixArray
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8, executors run serially
+    shared_memory = None
+
+
+_ARRAY_CLASSES = {
+    'jones': JonesVectorArray,
+    'stokes': StokesVectorArray,
+    }
+
+
+def _kind(states):
+    for kind, array_class in _ARRAY_CLASSES.items():
+        if isinstance(states, array_class):
+            return kind
+    raise TypeError("Not a batch of Jones or Stokes vectors")
+
+
+def _ellipse_angles(vectors, kind):
+    angles = _ARRAY_CLASSES[kind].from_matrix(vectors).ellipse_angles()
+    return np.column_stack(angles)
+
+
+def _apply(vectors, matrix_):
+    return vectors @ matrix_.T
+
+
+def _apply_stack(vectors, matrices):
+    return np.matmul(matrices, vectors[:, :, np.newaxis])[:, :, 0]
+
+
+def _normalize(vectors, kind):
+    states = _ARRAY_CLASSES[kind].from_matrix(vectors)
+    states.normalize()
+    return states.vector
+
+
+def _attach(descriptions):
+    memories = [shared_memory.SharedMemory(name=name)
+                for name, _, _ in descriptions]
+    arrays = [np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+              for memory, (_, shape, dtype) in zip(memories, descriptions)]
+    return memories, arrays
+
+
+def _share(size):
+    return shared_memory.SharedMemory(create=True, size=max(1, size))
+
+
+def _run(function, inputs, output, start, stop, args):
+    """
+    Process rows start:stop of shared inputs and write them to
+    the shared output. Executed in worker processes.
+    """
+    memories, arrays = _attach(list(inputs) + [output])
+    try:
+        chunks = [array[start:stop] for array in arrays[:-1]]
+        arrays[-1][start:stop] = function(*(chunks + list(args)))
+    finally:
+        # views have to be released before the memory is closed
+        del arrays, chunks
+        for memory in memories:
+            memory.close()
+
+
+class _Executor(object):
+    """
+    Abstract executor.
+    Not to be used directly.
+    """
+
+    _pool_class = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = self._pool_class(self.workers)
+        return self._pool
+
+    @staticmethod
+    def _check_lengths(inputs, size):
+        lengths = [len(array) for array in inputs]
+        if any(length != size for length in lengths):
+            raise ValueError(
+                "Inputs of lengths {} do not match the batch of {}".format(
+                    lengths, size))
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    @staticmethod
+    def _map_serial(function, inputs, output_shape, output_dtype, args, out):
+        result = function(*(list(inputs) + list(args)))
+        if out is None:
+            return np.asarray(result, dtype=output_dtype).reshape(output_shape)
+        out[...] = result
+        return out
+
+    def ellipse_angles(self, states):
+        """
+        Calculate all angles of the polarization ellipses of a batch.
+
+        Parameters
+        ----------
+        :states:
+            JonesVectorArray or StokesVectorArray.
+
+        Returns
+        -------
+        tuple
+            Arrays of azimuths, ellipticity angles, diagonal angles and
+            complements of the diagonal angles.
+        """
+        vectors = states.vector
+        angles = self.map(_ellipse_angles, [vectors], (len(states), 4),
+                          vectors.real.dtype, args=(_kind(states),))
+        return tuple(angles.T)
+
+    def apply(self, operator, states):
+        """
+        Transform a batch of states with an optical element.
+
+        Parameters
+        ----------
+        :operator:
+            Jones or Mueller matrix, a stack of them with one element
+            per state, or an OpticalTrain.
+        :states:
+            JonesVectorArray or StokesVectorArray.
+
+        Returns
+        -------
+        JonesVectorArray or StokesVectorArray.
+        """
+        array_class = _ARRAY_CLASSES[_kind(states)]
+        operator = getattr(operator, 'operator', operator)
+        vectors = states.vector
+        if isinstance(operator, _MatrixArray) and len(operator) > 1:
+            product = self.map(_apply_stack, [vectors, operator.matrix],
+                               vectors.shape, vectors.dtype)
+        elif isinstance(operator, (_Matrix, _MatrixArray)):
+            matrix_ = operator.matrix.reshape(operator.matrix.shape[-2:])
+            product = self.map(_apply, [vectors], vectors.shape,
+                               np.result_type(vectors, matrix_),
+                               args=(matrix_,))
+        else:
+            raise TypeError("Not an optical element")
+        return array_class.from_matrix(product)
+
+    def normalize(self, states):
+        """
+        Normalize a batch of states in place.
+
+        Parameters
+        ----------
+        :states:
+            JonesVectorArray or StokesVectorArray.
+        """
+        vectors = states.vector
+        self.map(_normalize, [vectors], vectors.shape, vectors.dtype,
+                 args=(_kind(states),), out=vectors)
+
+
+class ProcessExecutor(_Executor):
+    """
+    Executor splitting batches of states across a pool of processes.
+
+    Parameters
+    ----------
+    :workers:
+        Number of processes, all available CPUs by default.
+    :threshold:
+        Batches with fewer states are processed serially in the
+        calling process, as starting workers would cost more.
+    :chunks_per_worker:
+        Number of chunks handed to every worker, more chunks balance
+        the load better at the cost of more messages.
+
+    Inputs are copied to shared memory and the result is copied out
+    of it, one copy each way, so only work heavier than a copy per
+    state pays off. Without multiprocessing.shared_memory (Python < 3.8)
+    every batch is processed serially and a RuntimeWarning is issued
+    on the first batch that would have been split.
+
+    Attributes
+    ----------
+    :_pool:
+        ProcessPoolExecutor, created on first use.
+    """
+
+    _pool_class = ProcessPoolExecutor
+
+    def __init__(self, workers=None, threshold=1000000, chunks_per_worker=4):
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self.chunks_per_worker = chunks_per_worker
+        self._pool = None
+        self._warned = False
+
+    def _serial(self, size):
+        if self.workers <= 1 or size < self.threshold:
+            return True
+        if shared_memory is None:
+            if not self._warned:
+                warnings.warn("Shared memory requires Python 3.8, "
+                              "batches are processed serially",
+                              RuntimeWarning, stacklevel=3)
+                self._warned = True
+            return True
+        return False
+
+    def map(self, function, inputs, output_shape, output_dtype=float,
+            args=(), out=None):
+        """
+        Calculate function(*inputs_chunk, *args) for chunks of rows
+        and assemble the results in order.
+
+        Parameters
+        ----------
+        :function:
+            Module-level function, so that it can be sent to workers.
+        :inputs:
+            List of arrays sharing the length of the first axis.
+        :output_shape:
+            Shape of the assembled result.
+        :out:
+            Optional array the result is written to.
+
+        Returns
+        -------
+        ndarray
+        """
+        size = output_shape[0]
+        self._check_lengths(inputs, size)
+        if self._serial(size):
+            return self._map_serial(function, inputs, output_shape,
+                                    output_dtype, args, out)
+        output_dtype = np.dtype(output_dtype)
+        memories = []
+        try:
+            descriptions = []
+            for array in inputs:
+                array = np.asarray(array)
+                memory = _share(array.nbytes)
+                memories.append(memory)
+                np.ndarray(array.shape, dtype=array.dtype,
+                           buffer=memory.buf)[...] = array
+                descriptions.append((memory.name, array.shape,
+                                     array.dtype.str))
+            memory = _share(int(np.prod(output_shape)) * output_dtype.itemsize)
+            memories.append(memory)
+            output = (memory.name, output_shape, output_dtype.str)
+            pool = self._get_pool()
+            chunks = self.workers * self.chunks_per_worker
+            bounds = np.linspace(0, size, chunks + 1).astype(int)
+            futures = [pool.submit(_run, function, descriptions, output,
+                                   start, stop, args)
+                       for start, stop in zip(bounds[:-1], bounds[1:])
+                       if stop > start]
+            for future in futures:
+                future.result()
+            if out is None:
+                out = np.empty(output_shape, dtype=output_dtype)
+            out[...] = np.ndarray(output_shape, dtype=output_dtype,
+                                  buffer=memory.buf)
+        finally:
+            for memory in memories:
+                memory.close()
+                memory.unlink()
+        return out
+
+
+class ThreadExecutor(_Executor):
+    """
+    Executor splitting batches of states into tiles processed
+    concurrently by a pool of threads within a single process.
+    Cheaper to start than ProcessExecutor, so it suits medium batches.
+
+    Parameters
+    ----------
+    :workers:
+        Number of threads, all available CPUs by default.
+    :tile_size:
+        Number of states in a single tile. Tiles small enough to stay
+        in CPU cache work best. Batches not larger than a single tile
+        are processed serially.
+
+    Attributes
+    ----------
+    :_pool:
+        ThreadPoolExecutor, created on first use.
+    """
+
+    _pool_class = ThreadPoolExecutor
+
+    def __init__(self, workers=None, tile_size=16384):
+        self.workers = workers or os.cpu_count() or 1
+        self.tile_size = tile_size
+        self._pool = None
+
+    def map(self, function, inputs, output_shape, output_dtype=float,
+            args=(), out=None):
+        """
+        Calculate function(*inputs_tile, *args) for tiles of rows
+        and write the results to a single array.
+
+        Parameters
+        ----------
+        :function:
+            Function processing a single tile.
+        :inputs:
+            List of arrays sharing the length of the first axis.
+        :output_shape:
+            Shape of the assembled result.
+        :out:
+            Optional array the result is written to.
+
+        Returns
+        -------
+        ndarray
+        """
+        size = output_shape[0]
+        self._check_lengths(inputs, size)
+        if self.workers <= 1 or size <= self.tile_size:
+            return self._map_serial(function, inputs, output_shape,
+                                    output_dtype, args, out)
+        if out is None:
+            out = np.empty(output_shape, dtype=output_dtype)
+
+        def run(start):
+            stop = min(start + self.tile_size, size)
+            tiles = [array[start:stop] for array in inputs]
+            out[start:stop] = function(*(tiles + list(args)))
+
+        pool = self._get_pool()
+        for _ in pool.map(run, range(0, size, self.tile_size)):
+            pass
+        return out
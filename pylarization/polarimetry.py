@@ -0,0 +1,151 @@
+"""
+Module containing reconstruction of Mueller matrices from intensities
+measured by a polarimeter.
+
+A measurement with the generator in Stokes state s and the analyzer
+sensitive to Stokes state a gives I = a^T M s = (a (x) s) . vec(M).
+Stacking all measurements gives I = W vec(M), so the Mueller matrix is
+recovered with the pseudo-inverse of W. The pseudo-inverse depends on
+the instrument only, so it is computed once and then applied to whole
+stacks of frames with a single matrix product.
+"""
+import numpy as np
+from pylarization.vectors import StokesVector, StokesVectorArray
+from pylarization.matrices import MuellerMatrix, MuellerMatrixArray
+from pylarization.precision import float_dtype
+
+
+def _states(states):
+    if isinstance(states, StokesVectorArray):
+        return states.vector
+    if isinstance(states, StokesVector):
+        return states.vector.reshape(1, 4)
+    states = [state.vector.reshape(4) if isinstance(state, StokesVector)
+              else state for state in states]
+    states = np.asarray(states, dtype=float)
+    if states.ndim != 2 or states.shape[1] != 4:
+        raise ValueError("Wrong shape of Stokes states")
+    return states
+
+
+class MuellerPolarimeter(object):
+    """
+    Class describing a polarimeter by its generator and analyzer states.
+
+    Parameters
+    ----------
+    :generators:
+        StokesVectorArray, sequence of StokesVector or (G, 4) array
+        of states illuminating the sample.
+    :analyzers:
+        StokesVectorArray, sequence of StokesVector or (A, 4) array
+        of states the detector is sensitive to, i.e. first rows
+        of Mueller matrices of the analyzer.
+    :combinations:
+        If True, every analyzer is used with every generator, giving
+        A * G measurements ordered analyzer first. If False,
+        generators and analyzers are paired, giving G == A measurements.
+
+    Attributes
+    ----------
+    :_instrument:
+        (K, 16) instrument matrix W.
+    :_reductions:
+        Data-reduction matrices, pseudo-inverses of W, per dtype.
+    """
+
+    def __init__(self, generators, analyzers, combinations=True):
+        generators = _states(generators)
+        analyzers = _states(analyzers)
+        if combinations:
+            instrument = np.einsum('ai,gj->agij', analyzers, generators)
+        elif generators.shape != analyzers.shape:
+            raise ValueError("Generators and analyzers can not be paired")
+        else:
+            instrument = np.einsum('ki,kj->kij', analyzers, generators)
+        self._instrument = instrument.reshape(-1, 16)
+        if np.linalg.matrix_rank(self._instrument) < 16:
+            raise ValueError(
+                "Measurements do not determine all Mueller matrix elements")
+        self._reductions = {}
+        self._condition_number = None
+
+    def __len__(self):
+        return self._instrument.shape[0]
+
+    @property
+    def instrument_matrix(self):
+        return self._instrument
+
+    @property
+    def condition_number(self):
+        """
+        Condition number of the instrument matrix.
+        Relative noise of intensities is amplified at most this much
+        in reconstructed matrices, so lower is better.
+        """
+        if self._condition_number is None:
+            self._condition_number = float(np.linalg.cond(self._instrument))
+        return self._condition_number
+
+    def reduction_matrix(self, dtype=np.float64):
+        """
+        Return the (16, K) data-reduction matrix, computed on first use.
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in self._reductions:
+            double = np.dtype(np.float64)
+            if double not in self._reductions:
+                self._reductions[double] = np.linalg.pinv(self._instrument)
+            self._reductions[dtype] = self._reductions[double].astype(dtype)
+        return self._reductions[dtype]
+
+    def measure(self, mueller):
+        """
+        Calculate intensities measured for given Mueller matrices.
+
+        Parameters
+        ----------
+        :mueller:
+            MuellerMatrix, MuellerMatrixArray or (N, 4, 4) ndarray.
+
+        Returns
+        -------
+        ndarray
+            (K,) intensities for a single matrix, (K, N) otherwise.
+        """
+        matrix_ = np.asarray(getattr(mueller, 'matrix', mueller))
+        if matrix_.ndim == 2:
+            return self._instrument @ matrix_.reshape(16)
+        return self._instrument @ matrix_.reshape(-1, 16).T
+
+    def reconstruct(self, frames, precision=None):
+        """
+        Reconstruct Mueller matrices from measured intensities.
+
+        Parameters
+        ----------
+        :frames:
+            (K,) intensities of a single sample, or (K, ...) stack
+            of frames with one measurement per frame, e.g. (K, H, W)
+            images.
+        :precision:
+            'single' or 'double', the precision of frames when omitted.
+
+        Returns
+        -------
+        MuellerMatrix for (K,) intensities, otherwise MuellerMatrixArray
+        with one matrix per pixel, in C order of the frame axes.
+        """
+        frames = np.asarray(frames)
+        if frames.shape[0] != len(self):
+            raise ValueError("Expected {} frames, got {}".format(
+                len(self), frames.shape[0]))
+        dtype = float_dtype(precision, frames)
+        reduction = self.reduction_matrix(dtype)
+        if frames.ndim == 1:
+            return MuellerMatrix.from_matrix(
+                (reduction @ frames.astype(dtype)).reshape(4, 4))
+        pixels = frames.reshape(len(self), -1).astype(dtype, copy=False)
+        matrices = pixels.T @ reduction.T
+        return MuellerMatrixArray.from_matrix(matrices.reshape(-1, 4, 4))
@@ -2,36 +2,52 @@
 Enums for edge cases of polarizarion.
 NOTE!
 Enums presented here confirm to the IEEE convention of left-/righ-handedness.
+Values of members are built on first access, always in double precision,
+so the precision active at that moment does not leak into shared states.
 """
 
-from enum import Enum
+from functools import partial
 from math import sqrt, pi
-from pylarization.ellipse import PolarizationEllipse
-from pylarization.vectors import JonesVector, StokesVector
-
-
-class JonesVectorState(Enum):
-    LINEAR_HORIZONTAL = JonesVector(1, 0)
-    LINEAR_VERTICAL = JonesVector(0, 1)
-    LINEAR_DIAGONAL = JonesVector(sqrt(2) * 0.5, sqrt(2) * 0.5)
-    LINEAR_ANTIDIAGONAL = JonesVector(sqrt(2) * 0.5, -sqrt(2) * 0.5)
-    CIRCULAR_LEFT_HANDED = JonesVector(sqrt(2) * 0.5, sqrt(2) * 0.5 * 1j)
-    CIRCULAR_RIGHT_HANDED = JonesVector(sqrt(2) * 0.5, -sqrt(2) * 0.5 * 1j)
-
-
-class StokesVectorState(Enum):
-    LINEAR_HORIZONTAL = StokesVector(1, 1, 0, 0)
-    LINEAR_VERTICAL = StokesVector(1, -1, 0, 0)
-    LINEAR_DIAGONAL = StokesVector(1, 0, 1, 0)
-    LINEAR_ANTIDIAGONAL = StokesVector(1, 0, -1, 0)
-    CIRCULAR_LEFT_HANDED = StokesVector(1, 0, 0, 1)
-    CIRCULAR_RIGHT_HANDED = StokesVector(1, 0, 0, -1)
-
-
-class PolarizationEllipseState(Enum):
-    LINEAR_HORIZONTAL = PolarizationEllipse(1.0, 0.0, 0.0)
-    LINEAR_VERTICAL = PolarizationEllipse(0.0, 1.0, 0.0)
-    LINEAR_DIAGONAL = PolarizationEllipse(sqrt(2) * 0.5, sqrt(2) * 0.5, 0.0)
-    LINEAR_ANTIDIAGONAL = PolarizationEllipse(sqrt(2) * 0.5, sqrt(2) * 0.5, pi)
-    CIRCULAR_LEFT_HANDED = PolarizationEllipse(sqrt(2) * 0.5, sqrt(2) * 0.5, pi/2)
-    CIRCULAR_RIGHT_HANDED = PolarizationEllipse(sqrt(2) * 0.5, sqrt(2) * 0.5, -pi/2)
\ No newline at end of file
+from pylarization.registry import LazyEnum
+
+
+class JonesVectorState(LazyEnum):
+    LINEAR_HORIZONTAL = (1, 0)
+    LINEAR_VERTICAL = (0, 1)
+    LINEAR_DIAGONAL = (sqrt(2) * 0.5, sqrt(2) * 0.5)
+    LINEAR_ANTIDIAGONAL = (sqrt(2) * 0.5, -sqrt(2) * 0.5)
+    CIRCULAR_LEFT_HANDED = (sqrt(2) * 0.5, sqrt(2) * 0.5 * 1j)
+    CIRCULAR_RIGHT_HANDED = (sqrt(2) * 0.5, -sqrt(2) * 0.5 * 1j)
+
+    @staticmethod
+    def _factory():
+        from pylarization.vectors import JonesVector
+        return partial(JonesVector, precision='double')
+
+
+class StokesVectorState(LazyEnum):
+    LINEAR_HORIZONTAL = (1, 1, 0, 0)
+    LINEAR_VERTICAL = (1, -1, 0, 0)
+    LINEAR_DIAGONAL = (1, 0, 1, 0)
+    LINEAR_ANTIDIAGONAL = (1, 0, -1, 0)
+    CIRCULAR_LEFT_HANDED = (1, 0, 0, 1)
+    CIRCULAR_RIGHT_HANDED = (1, 0, 0, -1)
+
+    @staticmethod
+    def _factory():
+        from pylarization.vectors import StokesVector
+        return partial(StokesVector, precision='double')
+
+
+class PolarizationEllipseState(LazyEnum):
+    LINEAR_HORIZONTAL = (1.0, 0.0, 0.0)
+    LINEAR_VERTICAL = (0.0, 1.0, 0.0)
+    LINEAR_DIAGONAL = (sqrt(2) * 0.5, sqrt(2) * 0.5, 0.0)
+    LINEAR_ANTIDIAGONAL = (sqrt(2) * 0.5, sqrt(2) * 0.5, pi)
+    CIRCULAR_LEFT_HANDED = (sqrt(2) * 0.5, sqrt(2) * 0.5, pi/2)
+    CIRCULAR_RIGHT_HANDED = (sqrt(2) * 0.5, sqrt(2) * 0.5, -pi/2)
+
+    @staticmethod
+    def _factory():
+        from pylarization.ellipse import PolarizationEllipse
+        return PolarizationEllipse
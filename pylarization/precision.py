@@ -0,0 +1,113 @@
+"""
+Module containing the floating point precision policy.
+
+Double precision (float64 and complex128) is used by default.
+Single precision (float32 and complex64) halves memory use and bandwidth
+at the cost of accuracy, which is usually acceptable for imaging.
+
+The global default can be changed with set_precision() or temporarily
+with using_precision(). Constructors accept a precision argument
+overriding the default for a single object or batch, and from_matrix
+keeps the precision of the matrix it is given.
+"""
+import numpy as np
+
+
+_DTYPES = {
+    'double': (np.dtype(np.float64), np.dtype(np.complex128)),
+    'single': (np.dtype(np.float32), np.dtype(np.complex64)),
+    }
+
+_default = 'double'
+
+
+def _validate(precision):
+    if precision not in _DTYPES:
+        raise ValueError("Unknown precision, use 'single' or 'double'")
+
+
+def get_precision():
+    """
+    Return the global default precision.
+    """
+    return _default
+
+
+def set_precision(precision):
+    """
+    Set the global default precision.
+
+    Parameters
+    ----------
+    :precision:
+        'single' or 'double'.
+    """
+    global _default
+    _validate(precision)
+    _default = precision
+
+
+class using_precision(object):
+    """
+    Context manager changing the global default precision
+    until the end of the block.
+
+    Parameters
+    ----------
+    :precision:
+        'single' or 'double'.
+    """
+
+    def __init__(self, precision):
+        _validate(precision)
+        self._precision = precision
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = get_precision()
+        set_precision(self._precision)
+        return self
+
+    def __exit__(self, *exc_info):
+        set_precision(self._previous)
+
+
+def resolve(precision=None, like=None):
+    """
+    Decide which precision to use.
+
+    Parameters
+    ----------
+    :precision:
+        Explicitly requested precision, takes priority.
+    :like:
+        Array whose precision is kept, if it is a float or complex array.
+
+    Returns
+    -------
+    str
+        'single' or 'double'.
+    """
+    if precision is not None:
+        _validate(precision)
+        return precision
+    dtype = getattr(like, 'dtype', None)
+    if dtype is not None:
+        for name, dtypes in _DTYPES.items():
+            if dtype in dtypes:
+                return name
+    return _default
+
+
+def float_dtype(precision=None, like=None):
+    """
+    Return the float dtype of the resolved precision.
+    """
+    return _DTYPES[resolve(precision, like)][0]
+
+
+def complex_dtype(precision=None, like=None):
+    """
+    Return the complex dtype of the resolved precision.
+    """
+    return _DTYPES[resolve(precision, like)][1]
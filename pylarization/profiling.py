@@ -0,0 +1,235 @@
+"""
+Module containing opt-in instrumentation of the package.
+
+While a profile is active, every object created by the classes of the
+ellipse, vectors and matrices modules is counted, and every public
+method, property and operator of those classes is timed.
+Objects are counted by the outermost constructor call (__init__,
+from_matrix or _from_buffer), so a constructor delegating to another
+one counts a single object.
+Times are inclusive, e.g. the time of JonesMatrix.__matmul__ contains
+the time of the JonesVector.from_matrix call it makes.
+
+Instrumentation is installed by patching the classes when a profile
+starts and removed when it ends, so there is no overhead at all
+while profiling is disabled.
+
+Profiling can be enabled for a block of code:
+
+    with profile() as stats:
+        ...
+    print(stats.summary())
+
+or for the whole program with the PYLARIZATION_PROFILE environment
+variable, set to 'table' or 'json'. The summary is then written to
+stderr at exit.
+"""
+import atexit
+import functools
+import inspect
+import json
+import sys
+import threading
+import time
+
+
+_MODULES = ('pylarization.ellipse', 'pylarization.vectors',
+            'pylarization.matrices')
+
+_OPERATORS = ('__init__', '__matmul__', '__rmatmul__', '__add__',
+              '__getitem__')
+
+_CONSTRUCTORS = ('__init__', 'from_matrix', '_from_buffer')
+
+_active = None
+
+_local = threading.local()
+
+
+def _classes():
+    classes = []
+    for name in _MODULES:
+        module = __import__(name, fromlist=['_'])
+        classes += [value for value in vars(module).values()
+                    if inspect.isclass(value) and value.__module__ == name]
+    return classes
+
+
+def _instance_label(name):
+    return lambda args: "{}.{}".format(type(args[0]).__name__, name)
+
+
+def _class_label(name):
+    return lambda args: "{}.{}".format(args[0].__name__, name)
+
+
+def _timed(stats, label, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats._record(label(args), time.perf_counter() - start)
+    return wrapper
+
+
+def _counted(stats, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        depth = getattr(_local, 'depth', 0)
+        _local.depth = depth + 1
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            _local.depth = depth
+        if depth == 0:
+            created = args[0] if result is None else result
+            stats._allocate(type(created).__name__)
+        return result
+    return wrapper
+
+
+def _instrument(stats, cls):
+    """
+    Replace attributes of a class with instrumented ones.
+
+    Returns
+    -------
+    dict
+        Original attributes.
+    """
+    originals = {}
+    for name, value in list(vars(cls).items()):
+        if (name.startswith('_') and name not in _OPERATORS and
+                name not in _CONSTRUCTORS):
+            continue
+        if name in _CONSTRUCTORS:
+            if isinstance(value, classmethod):
+                patched = classmethod(_counted(
+                    stats, _timed(stats, _class_label(name), value.__func__)))
+            else:
+                patched = _counted(
+                    stats, _timed(stats, _instance_label(name), value))
+        elif isinstance(value, property):
+            fget = _timed(stats, _instance_label(name), value.fget)
+            patched = property(fget, value.fset, value.fdel, value.__doc__)
+        elif isinstance(value, classmethod):
+            patched = classmethod(
+                _timed(stats, _class_label(name), value.__func__))
+        elif isinstance(value, staticmethod):
+            label = "{}.{}".format(cls.__name__, name)
+            patched = staticmethod(_timed(
+                stats, lambda args, label=label: label, value.__func__))
+        elif inspect.isfunction(value):
+            patched = _timed(stats, _instance_label(name), value)
+        else:
+            continue
+        originals[name] = value
+        setattr(cls, name, patched)
+    return originals
+
+
+def _restore(cls, originals):
+    for name, value in originals.items():
+        setattr(cls, name, value)
+
+
+class profile(object):
+    """
+    Context manager profiling the package until the end of the block.
+
+    Attributes
+    ----------
+    :allocations:
+        Number of created objects per class name.
+    :operations:
+        Number of calls and total time in seconds per operation.
+    """
+
+    def __init__(self):
+        self.allocations = {}
+        self.operations = {}
+        self._lock = threading.Lock()
+        self._originals = []
+
+    def _allocate(self, name):
+        with self._lock:
+            self.allocations[name] = self.allocations.get(name, 0) + 1
+
+    def _record(self, label, seconds):
+        with self._lock:
+            calls, total = self.operations.get(label, (0, 0.0))
+            self.operations[label] = (calls + 1, total + seconds)
+
+    def start(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError("Profiling is already enabled")
+        _active = self
+        self._originals = [(cls, _instrument(self, cls))
+                           for cls in _classes()]
+
+    def stop(self):
+        global _active
+        for cls, originals in reversed(self._originals):
+            _restore(cls, originals)
+        self._originals = []
+        _active = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def as_dict(self):
+        """
+        Return the collected statistics as a JSON serializable dict.
+        """
+        return {
+            'allocations': dict(self.allocations),
+            'operations': {
+                label: {'calls': calls, 'seconds': seconds}
+                for label, (calls, seconds) in self.operations.items()},
+            }
+
+    def to_json(self):
+        return json.dumps(self.as_dict(), indent=2, sort_keys=True)
+
+    def summary(self):
+        """
+        Return a table of operations sorted by total time,
+        followed by a table of allocations.
+        """
+        lines = ["{:<45} {:>10} {:>12} {:>12}".format(
+            "operation", "calls", "total [s]", "per call [us]")]
+        for label, (calls, seconds) in sorted(
+                self.operations.items(), key=lambda item: -item[1][1]):
+            lines.append("{:<45} {:>10} {:>12.6f} {:>12.3f}".format(
+                label, calls, seconds, seconds / calls * 1e6))
+        lines.append("")
+        lines.append("{:<45} {:>10}".format("class", "allocations"))
+        for name, count in sorted(self.allocations.items(),
+                                  key=lambda item: -item[1]):
+            lines.append("{:<45} {:>10}".format(name, count))
+        return "\n".join(lines)
+
+
+def _from_environment(output):
+    """
+    Profile the whole program, writing the summary to stderr at exit.
+    """
+    stats = profile()
+    stats.start()
+
+    def report():
+        stats.stop()
+        if output == 'json':
+            print(stats.to_json(), file=sys.stderr)
+        else:
+            print(stats.summary(), file=sys.stderr)
+
+    atexit.register(report)
+    return stats
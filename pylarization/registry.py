@@ -0,0 +1,35 @@
+"""
+Module containing an enum whose members are built on first access.
+
+Members are declared with the arguments of the object they stand for,
+so defining the enum does not import the class hierarchy
+(and numpy with it). The object is built and cached the first time
+the value of a member is read.
+"""
+from enum import Enum
+
+
+class LazyEnum(Enum):
+    """
+    Enum building the values of its members on first access.
+
+    Subclasses define a _factory() staticmethod importing and returning
+    the callable that builds a value from the arguments held by a member.
+    There is no default, reading the value of a member of a subclass
+    without _factory() raises AttributeError.
+    """
+
+    @property
+    def arguments(self):
+        """
+        Arguments the value is built from.
+        """
+        return self._value_
+
+    @property
+    def value(self):
+        try:
+            return self.__dict__['_built']
+        except KeyError:
+            built = self._factory()(*self._value_)
+            return self.__dict__.setdefault('_built', built)
@@ -0,0 +1,184 @@
+"""
+Module containing generator stages for processing continuous feeds
+of polarization measurements.
+
+Every stage takes an iterable of blocks and yields blocks,
+so stages can be chained (see pipeline()) and memory use is bounded
+by the block size, regardless of the length of the feed.
+"""
+import numpy as np
+from pylarization.vectors import JonesVectorArray, StokesVectorArray
+from pylarization.precision import float_dtype, complex_dtype
+
+
+def _parse(sample, dtype):
+    if isinstance(sample, (str, bytes)):
+        if isinstance(sample, bytes):
+            sample = sample.decode()
+        sample = sample.replace(',', ' ').split()
+        if dtype.kind == 'c':
+            return [complex(value.replace('i', 'j')) for value in sample]
+        return [float(value) for value in sample]
+    return sample
+
+
+def _blocks(samples, block_size, width, dtype, array_class):
+    buffer = np.empty((block_size, width), dtype=dtype)
+    filled = 0
+    for sample in samples:
+        buffer[filled] = _parse(sample, dtype)
+        filled += 1
+        if filled == block_size:
+            yield array_class.from_matrix(buffer)
+            buffer = np.empty((block_size, width), dtype=dtype)
+            filled = 0
+    if filled:
+        yield array_class.from_matrix(buffer[:filled])
+
+
+def stokes_blocks(samples, block_size=4096, precision=None):
+    """
+    Group Stokes samples into blocks.
+
+    Parameters
+    ----------
+    :samples:
+        Iterable of samples, each being a sequence of I, M, C, S
+        or a line of text holding them separated by spaces or commas.
+    :block_size:
+        Number of samples in a block. The last block may be shorter.
+    :precision:
+        'single' or 'double', the global default when omitted.
+
+    Yields
+    ------
+    StokesVectorArray
+    """
+    return _blocks(samples, block_size, 4, float_dtype(precision),
+                   StokesVectorArray)
+
+
+def jones_blocks(samples, block_size=4096, precision=None):
+    """
+    Group Jones samples into blocks.
+
+    Parameters
+    ----------
+    :samples:
+        Iterable of samples, each being a sequence of Ex, Ey
+        or a line of text holding them separated by spaces or commas.
+    :block_size:
+        Number of samples in a block. The last block may be shorter.
+    :precision:
+        'single' or 'double', the global default when omitted.
+
+    Yields
+    ------
+    JonesVectorArray
+    """
+    return _blocks(samples, block_size, 2, complex_dtype(precision),
+                   JonesVectorArray)
+
+
+def normalize(blocks):
+    """
+    Normalize every block of vectors in place.
+    """
+    for block in blocks:
+        block.normalize()
+        yield block
+
+
+def transform(blocks, operator):
+    """
+    Transform every block of vectors with an optical element.
+
+    Parameters
+    ----------
+    :operator:
+        Anything supporting operator @ vector batch, e.g. a JonesMatrix,
+        MuellerMatrix, a stack of either or an OpticalTrain.
+    """
+    for block in blocks:
+        yield operator @ block
+
+
+def ellipse_parameters(blocks):
+    """
+    Calculate parameters of the polarization ellipse for every block.
+
+    Yields
+    ------
+    ndarray
+        (N, 5) matrix with columns of intensity, azimuth,
+        ellipticity angle, diagonal angle and its complement.
+    """
+    for block in blocks:
+        yield np.column_stack((block.intensity,) + block.ellipse_angles())
+
+
+def windowed(blocks, window, function=np.mean):
+    """
+    Aggregate consecutive windows of samples, regardless of
+    the boundaries of blocks. Incomplete trailing windows are dropped.
+
+    Parameters
+    ----------
+    :blocks:
+        Iterable of ndarrays or vector batches.
+    :window:
+        Number of samples in a window.
+    :function:
+        Aggregate called as function(samples, axis=0).
+
+    Yields
+    ------
+    ndarray
+        Aggregate of a single window.
+
+    Windows lying inside a block are passed to the function as views.
+    Windows spanning blocks are gathered in a single buffer reused for
+    every window, so every sample is copied at most once.
+    """
+    buffer = None
+    filled = 0
+    for block in blocks:
+        data = np.asarray(getattr(block, 'vector', block))
+        start = 0
+        if filled:
+            take = min(window - filled, len(data))
+            buffer[filled:filled + take] = data[:take]
+            filled += take
+            start = take
+            if filled < window:
+                continue
+            yield function(buffer, axis=0)
+            filled = 0
+        complete = start + (len(data) - start) // window * window
+        for start in range(start, complete, window):
+            yield function(data[start:start + window], axis=0)
+        rest = len(data) - complete
+        if rest:
+            if buffer is None:
+                buffer = np.empty((window,) + data.shape[1:], data.dtype)
+            buffer[:rest] = data[complete:]
+            filled = rest
+
+
+def pipeline(source, *stages):
+    """
+    Chain stages, each being a callable taking an iterable of blocks.
+    Stages needing parameters can be wrapped with functools.partial
+    or a lambda.
+
+    Example
+    -------
+    pipeline(stokes_blocks(lines, 1024),
+             normalize,
+             lambda blocks: transform(blocks, train),
+             ellipse_parameters,
+             lambda blocks: windowed(blocks, 8192))
+    """
+    for stage in stages:
+        source = stage(source)
+    return source
@@ -0,0 +1,174 @@
+"""
+Module containing Monte Carlo analysis of manufacturing tolerances
+of optical elements.
+
+All trials are generated as arrays of parameters, so every element
+becomes a single stack of matrices and the whole analysis takes
+a handful of NumPy calls regardless of the number of trials.
+"""
+import numpy as np
+from pylarization.vectors import StokesVector
+from pylarization.matrices import JonesMatrixArray
+from pylarization.conversions import jones_to_stokes
+
+
+class ElementTolerance(object):
+    """
+    Class describing a JonesMatrix element with imperfect parameters.
+
+    Parameters
+    ----------
+    :angle:
+        Nominal orientation of the element.
+    :retardance:
+        Nominal phase shift introduced by the element.
+    :transparency:
+        Nominal transparency of the absorption axis.
+    :angle_tolerance:
+        Spread of the orientation.
+    :retardance_tolerance:
+        Spread of the retardance.
+    :transparency_tolerance:
+        Spread of the transparency. Sampled transparency is clipped
+        to 0. <= transparency <= 1.0
+    :distribution:
+        'normal', where tolerances are standard deviations,
+        or 'uniform', where tolerances are half-widths of the range.
+    """
+
+    _distributions = ('normal', 'uniform')
+
+    def __init__(self, angle=0.0, retardance=0.0, transparency=0.0,
+                 angle_tolerance=0.0, retardance_tolerance=0.0,
+                 transparency_tolerance=0.0, distribution='normal'):
+        if distribution not in self._distributions:
+            raise ValueError("Unknown distribution")
+        self.angle = angle
+        self.retardance = retardance
+        self.transparency = transparency
+        self.angle_tolerance = angle_tolerance
+        self.retardance_tolerance = retardance_tolerance
+        self.transparency_tolerance = transparency_tolerance
+        self.distribution = distribution
+
+    def _draw(self, rng, nominal, tolerance, trials):
+        if self.distribution == 'normal':
+            return rng.normal(nominal, tolerance, trials)
+        return rng.uniform(nominal - tolerance, nominal + tolerance, trials)
+
+    def sample(self, rng, trials):
+        """
+        Draw parameters of the element for every trial.
+
+        Returns
+        -------
+        tuple
+            Arrays of angles, retardances and transparencies.
+        """
+        angle = self._draw(rng, self.angle, self.angle_tolerance, trials)
+        retardance = self._draw(rng, self.retardance,
+                                self.retardance_tolerance, trials)
+        transparency = np.clip(self._draw(rng, self.transparency,
+                                          self.transparency_tolerance,
+                                          trials),
+                               0.0, 1.0)
+        return angle, retardance, transparency
+
+    def stack(self, rng, trials, precision=None):
+        """
+        Build matrices of the element for every trial.
+        """
+        angle, retardance, transparency = self.sample(rng, trials)
+        return JonesMatrixArray.sweep(angle, retardance, transparency,
+                                      precision)
+
+
+class ToleranceResult(object):
+    """
+    Class describing output states of a Monte Carlo analysis.
+
+    Parameters
+    ----------
+    :stokes:
+        StokesVectorArray with the output state of every trial.
+    """
+
+    def __init__(self, stokes):
+        self.stokes = stokes
+
+    @property
+    def mean_stokes(self):
+        """
+        Mean output state, i.e. incoherent sum of all trials
+        divided by their number.
+        """
+        return StokesVector.from_matrix(self.stokes.vector.mean(axis=0))
+
+    @property
+    def degree_of_polarization(self):
+        """
+        Degree of polarization of the mean output state.
+        """
+        mean = self.stokes.vector.mean(axis=0)
+        if mean[0] == 0:
+            return 0.0
+        return float(np.sqrt(np.square(mean[1:]).sum()) / mean[0])
+
+    @property
+    def azimuth_spread(self):
+        """
+        Circular standard deviation of azimuths in radians.
+        Calculated from orientations of the Stokes vectors on the
+        S1-S2 plane, so it is not affected by the azimuth folding.
+        Azimuths spread so evenly that their mean resultant length
+        is 0 have no circular mean, their spread is inf.
+        """
+        linear = self.stokes.vector[:, 1] + 1j * self.stokes.vector[:, 2]
+        magnitude = np.abs(linear)
+        linear = linear[magnitude > 0] / magnitude[magnitude > 0]
+        if linear.size == 0:
+            return 0.0
+        length = min(np.abs(linear.mean()), 1.0)
+        if length == 0:
+            return float('inf')
+        return float(0.5 * np.sqrt(-2 * np.log(length)))
+
+    @property
+    def ellipticity_angle_spread(self):
+        """
+        Standard deviation of ellipticity angles in radians.
+        """
+        return float(np.std(self.stokes.ellipticity_angle))
+
+
+def monte_carlo(elements, state, trials=100000, seed=None, precision=None):
+    """
+    Propagate a polarization state through a train of elements
+    with randomly perturbed parameters.
+
+    Parameters
+    ----------
+    :elements:
+        ElementTolerance objects in the order in which light passes them.
+    :state:
+        Input JonesVector.
+    :trials:
+        Number of trials.
+    :seed:
+        Seed of the random number generator, for reproducible results.
+    :precision:
+        'single' or 'double' precision of matrix stacks,
+        the global default when omitted.
+
+    Returns
+    -------
+    ToleranceResult
+    """
+    rng = np.random.default_rng(seed)
+    operator = None
+    for element in elements:
+        stack = element.stack(rng, trials, precision)
+        operator = stack if operator is None else stack @ operator
+    if operator is None:
+        raise ValueError("No elements")
+    return ToleranceResult(jones_to_stokes(operator @ state))
@@ -0,0 +1,140 @@
+"""
+Module containing a class describing a sequence of optical elements.
+"""
+from enum import Enum
+from pylarization.matrices import JonesMatrix, MuellerMatrix
+from pylarization.matrices import JonesMatrixArray, MuellerMatrixArray
+
+
+class OpticalTrain(object):
+    """
+    Class describing optical elements passed by light one after another.
+    Elements are composed into a single operator once and the result is
+    reused until any of the elements changes.
+
+    Parameters
+    ----------
+    :elements:
+        Elements in the order in which light passes them.
+        Jones matrices, Mueller matrices, stacks of either and
+        JonesMatrixOpticalElements members are accepted,
+        but Jones and Mueller elements can not be mixed.
+
+    Attributes
+    ----------
+    :_elements:
+        List of optical elements.
+    :_keys:
+        Keys of elements used to compose the cached operator.
+    :_partials:
+        Cached products, _partials[i] being the operator of
+        the first i + 1 elements.
+    """
+
+    _jones_types = (JonesMatrix, JonesMatrixArray)
+    _mueller_types = (MuellerMatrix, MuellerMatrixArray)
+
+    def __init__(self, elements=()):
+        self._elements = []
+        self._keys = []
+        self._partials = []
+        for element in elements:
+            self.append(element)
+
+    @staticmethod
+    def _unwrap(element):
+        if isinstance(element, Enum):
+            return element.value
+        return element
+
+    @staticmethod
+    def _key(element):
+        """
+        Return the key identifying parameters of an element.
+        Single matrices are keyed by their values, so in-place changes
+        are noticed. Stacks are keyed by their buffer only,
+        call invalidate() after modifying one in place.
+        """
+        matrix_ = element.matrix
+        if matrix_.ndim == 2:
+            return matrix_.tobytes()
+        return matrix_
+
+    @staticmethod
+    def _same_key(key, cached):
+        if isinstance(key, bytes):
+            return key == cached
+        return key is cached
+
+    def _validate(self, element, others):
+        if not isinstance(element, self._jones_types + self._mueller_types):
+            raise TypeError("Not an optical element")
+        if others:
+            jones = isinstance(others[0], self._jones_types)
+            if jones != isinstance(element, self._jones_types):
+                raise TypeError("Can not mix Jones and Mueller elements")
+
+    def append(self, element):
+        """
+        Add an element at the end of the train.
+        """
+        element = self._unwrap(element)
+        self._validate(element, self._elements)
+        self._elements.append(element)
+
+    def invalidate(self, index=0):
+        """
+        Drop cached products starting with the element at index.
+        """
+        del self._keys[index:]
+        del self._partials[index:]
+
+    @property
+    def elements(self):
+        return tuple(self._elements)
+
+    @property
+    def operator(self):
+        """
+        Return a single matrix (or stack) equivalent to the whole train.
+        Only the elements that changed since the last call,
+        and the ones after them, are composed again.
+        """
+        if not self._elements:
+            raise ValueError("Empty optical train")
+        keys = [self._key(element) for element in self._elements]
+        start = 0
+        for key, cached in zip(keys, self._keys):
+            if not self._same_key(key, cached):
+                break
+            start += 1
+        self.invalidate(start)
+        for index in range(start, len(self._elements)):
+            element = self._elements[index]
+            if index == 0:
+                self._partials.append(element)
+            else:
+                self._partials.append(element @ self._partials[-1])
+            self._keys.append(keys[index])
+        return self._partials[-1]
+
+    def apply(self, other):
+        """
+        Transform a vector, a vector batch or a matrix with the whole train.
+        """
+        return self.operator @ other
+
+    __matmul__ = apply
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __getitem__(self, index):
+        return self._elements[index]
+
+    def __setitem__(self, index, element):
+        element = self._unwrap(element)
+        others = list(self._elements)
+        del others[index]
+        self._validate(element, others)
+        self._elements[index] = element
@@ -2,8 +2,20 @@
 Module containing classes describing Jones and Stokes vectors.
 Both are used in describing light polarization.
 """
+import cmath
+import math
 import numpy as np
-from pylarization.ellipse import PolarizationEllipse
+from pylarization.ellipse import PolarizationEllipse, PolarizationEllipseArray
+from pylarization.precision import float_dtype, complex_dtype
+
+
+def _sqrt(value):
+    """
+    Square root of a plain float, NaN for negative values like np.sqrt.
+    """
+    if value < 0:
+        return float('nan')
+    return math.sqrt(value)
 
 
 class JonesVector(PolarizationEllipse):
@@ -16,6 +28,8 @@ class JonesVector(PolarizationEllipse):
         Scalar component of electric field vector along the X axis.
     :Ey:
         Scalar component of electric field vector along the Y axis.
+    :precision:
+        'single' or 'double', the global default when omitted.
 
     Attributes
     ----------
@@ -26,23 +40,42 @@ class JonesVector(PolarizationEllipse):
     :_y_phase:
         Absolute phase of the Ey component.
     """
-    def __init__(self, Ex, Ey):
-        self._vector = np.array([[Ex], [Ey]], dtype=complex)
-        self._x_phase = np.angle(Ex)
-        self._y_phase = np.angle(Ey)
-        super().__init__(
-                         self._get_amplitude(0),
-                         self._get_amplitude(1),
-                         self._y_phase - self._x_phase
-                        )
+    __slots__ = ('_vector', '_x_phase', '_y_phase')
+
+    def __init__(self, Ex, Ey, precision=None):
+        self._vector = np.array([[Ex], [Ey]], dtype=complex_dtype(precision))
+        self._update()
+
+    @classmethod
+    def from_matrix(cls, matrix_, precision=None):
+        buffer = np.empty((2, 1), dtype=complex_dtype(precision, matrix_))
+        buffer[:, 0] = np.ravel(matrix_)
+        return cls._from_buffer(buffer)
 
     @classmethod
-    def from_matrix(cls, matrix_):
-        vector = cls(matrix_.item(0),
-                     matrix_.item(1)
-                     )
+    def _from_buffer(cls, buffer):
+        """
+        Create a vector adopting a (2, 1) complex buffer.
+        The buffer is neither copied nor validated.
+        """
+        vector = cls.__new__(cls)
+        vector._vector = buffer
+        vector._update()
         return vector
 
+    def _update(self):
+        """
+        Recalculates parameters of the ellipse from the vector.
+        """
+        Ex = self._vector.item(0)
+        Ey = self._vector.item(1)
+        self._x_phase = cmath.phase(Ex)
+        self._y_phase = cmath.phase(Ey)
+        self._E0x = abs(Ex)
+        self._E0y = abs(Ey)
+        self._phase = self._y_phase - self._x_phase
+        self._invalidate()
+
     @property
     def vector(self):
         """
@@ -62,6 +95,7 @@ class JonesVector(PolarizationEllipse):
         if np.isnan(a) or a == 0.0:
             a = 1.0
         np.divide(self._vector, a, out=self._vector)
+        self._update()
 
     def normalize(self):
         """
@@ -72,24 +106,102 @@ class JonesVector(PolarizationEllipse):
         if absW2 == 0:
             absW2 = 1
         np.divide(self._vector, np.sqrt(absW2), out=self._vector)
-        super().__init__(
-                         self._get_amplitude(0),
-                         self._get_amplitude(1),
-                         self._y_phase - self._x_phase
-                        )
+        self._update()
+
+    def __add__(self, other):
+        if not isinstance(other, JonesVector):
+            return NotImplemented
+        return JonesVector._from_buffer(self._vector + other.vector)
+
+    __radd__ = __add__
+
+
+class JonesVectorArray(PolarizationEllipseArray):
+    """
+    Class for describing many polarization states using Jones vectors.
+    All vectors share a single contiguous complex buffer.
+
+    Parameters
+    ----------
+    :Ex:
+        Array of scalar components of electric field vector along the X axis.
+    :Ey:
+        Array of scalar components of electric field vector along the Y axis.
+    :precision:
+        'single' or 'double', the global default when omitted.
+
+    Attributes
+    ----------
+    :_vector:
+        (N, 2) complex matrix, each row being a full Jones vector.
+    """
+    def __init__(self, Ex, Ey, precision=None):
+        Ex, Ey = np.broadcast_arrays(Ex, Ey)
+        self._vector = np.empty((Ex.size, 2), dtype=complex_dtype(precision))
+        self._vector[:, 0] = Ex.ravel()
+        self._vector[:, 1] = Ey.ravel()
 
-    def _get_amplitude(self, index):
+    @classmethod
+    def from_matrix(cls, matrix_, precision=None):
+        """
+        Create an array from a (N, 2) matrix.
+        The matrix is adopted without copying when it already is complex.
+        """
+        matrix_ = np.asarray(matrix_, dtype=complex_dtype(precision, matrix_))
+        if matrix_.ndim != 2 or matrix_.shape[1] != 2:
+            raise ValueError("Wrong matrix shape")
+        vectors = cls.__new__(cls)
+        vectors._vector = matrix_
+        return vectors
+
+    @property
+    def vector(self):
         """
-        Returns the amplitude along specified axis.
-        Amplitudes are always real.
+        Return all Jones vectors as a (N, 2) matrix.
         """
-        return np.abs(
-                self._vector[index]
-            ).item().real
+        return self._vector
+
+    @property
+    def _ellipse(self):
+        return np.stack([self.E0x, self.E0y, self.phase], axis=1)
+
+    @property
+    def E0x(self):
+        return np.abs(self._vector[:, 0])
+
+    @property
+    def E0y(self):
+        return np.abs(self._vector[:, 1])
+
+    @property
+    def phase(self):
+        return np.angle(self._vector[:, 1]) - np.angle(self._vector[:, 0])
+
+    @property
+    def intensity(self):
+        return np.square(np.abs(self._vector)).sum(axis=1)
+
+    def normalize(self):
+        """
+        Normalizes all vectors in place.
+        After normalization the magnitude of each vector should be equal to ~1.
+        """
+        absW2 = self.intensity
+        absW2[absW2 == 0] = 1
+        np.divide(self._vector, np.sqrt(absW2)[:, np.newaxis],
+                  out=self._vector)
+
+    def __len__(self):
+        return self._vector.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return JonesVector.from_matrix(self._vector[index])
+        return JonesVectorArray.from_matrix(self._vector[index])
 
     def __add__(self, other):
-        vector = self.vector + other.vector
-        return JonesVector.from_matrix(vector)
+        vector = self._vector + other.vector.reshape(-1, 2)
+        return JonesVectorArray.from_matrix(vector)
 
     __radd__ = __add__
 
@@ -111,27 +223,36 @@ class StokesVector(PolarizationEllipse):
     :S:
         Describes the circularity of polarization.
         Sometimes described as S_3 or V.
+    :precision:
+        'single' or 'double', the global default when omitted.
 
     Attributes
     ----------
     :_vector:
         Full Stokes Vector.
     """
-    def __init__(self, I, M, C, S):
-        self._vector = np.array([[I], [M], [C], [S]], dtype=float)
-        super().__init__(
-                         self._calc_E0x(),
-                         self._calc_E0y(),
-                         self._calc_phase()
-                        )
+    __slots__ = ('_vector',)
+
+    def __init__(self, I, M, C, S, precision=None):
+        self._vector = np.array([[I], [M], [C], [S]],
+                                dtype=float_dtype(precision))
+        self._update()
 
     @classmethod
-    def from_matrix(cls, matrix_):
-        vector = cls(matrix_.item(0),
-                     matrix_.item(1),
-                     matrix_.item(2),
-                     matrix_.item(3)
-                     )
+    def from_matrix(cls, matrix_, precision=None):
+        buffer = np.empty((4, 1), dtype=float_dtype(precision, matrix_))
+        buffer[:, 0] = np.ravel(matrix_)
+        return cls._from_buffer(buffer)
+
+    @classmethod
+    def _from_buffer(cls, buffer):
+        """
+        Create a vector adopting a (4, 1) float buffer.
+        The buffer is neither copied nor validated.
+        """
+        vector = cls.__new__(cls)
+        vector._vector = buffer
+        vector._update()
         return vector
 
     @property
@@ -141,23 +262,16 @@ class StokesVector(PolarizationEllipse):
         """
         return self._vector
 
-    def _calc_E0x(self):
-        return np.sqrt(
-            (self._vector[0] +
-             self._vector[1]) / 2
-            ).item()
-
-    def _calc_E0y(self):
-        return np.sqrt(
-            (self._vector[0] -
-             self._vector[1]) / 2
-            ).item()
-
-    def _calc_phase(self):
+    def _update(self):
         """
-        Calculates the phase difference.
+        Recalculates parameters of the ellipse from the vector.
         """
-        return np.arctan2(self._vector[3], self._vector[2]).item()
+        I = self._vector.item(0)
+        M = self._vector.item(1)
+        self._E0x = _sqrt((I + M) / 2)
+        self._E0y = _sqrt((I - M) / 2)
+        self._phase = math.atan2(self._vector.item(3), self._vector.item(2))
+        self._invalidate()
 
     def normalize(self):
         """
@@ -165,11 +279,7 @@ class StokesVector(PolarizationEllipse):
         After normalization the magnitude should be equal to ~1.
         """
         np.divide(self._vector, self._vector[0], out=self.vector)
-        super().__init__(
-                         self._calc_E0x(),
-                         self._calc_E0y(),
-                         self._calc_phase()
-                        )
+        self._update()
 
     def __str__(self):
         return "I={}, M={}, C={}, S={}".format(
@@ -180,7 +290,116 @@ class StokesVector(PolarizationEllipse):
             )
 
     def __add__(self, other):
-        vector = self.vector + other.vector
-        return StokesVector.from_matrix(vector)
+        if not isinstance(other, StokesVector):
+            return NotImplemented
+        return StokesVector._from_buffer(self._vector + other.vector)
+
+    __radd__ = __add__
+
+
+class StokesVectorArray(PolarizationEllipseArray):
+    """
+    Class for describing many polarization states using Stokes vectors.
+    All vectors share a single contiguous float buffer.
+
+    Parameters
+    ----------
+    :I:
+        Array of intensities of the light beams (S_0).
+    :M:
+        Array of S_1 (Q) components.
+    :C:
+        Array of S_2 (U) components.
+    :S:
+        Array of S_3 (V) components.
+    :precision:
+        'single' or 'double', the global default when omitted.
+
+    Attributes
+    ----------
+    :_vector:
+        (N, 4) float matrix, each row being a full Stokes vector.
+    """
+    def __init__(self, I, M, C, S, precision=None):
+        I, M, C, S = np.broadcast_arrays(I, M, C, S)
+        self._vector = np.empty((I.size, 4), dtype=float_dtype(precision))
+        self._vector[:, 0] = I.ravel()
+        self._vector[:, 1] = M.ravel()
+        self._vector[:, 2] = C.ravel()
+        self._vector[:, 3] = S.ravel()
+
+    @classmethod
+    def from_matrix(cls, matrix_, precision=None):
+        """
+        Create an array from a (N, 4) matrix.
+        The matrix is adopted without copying when it already is float.
+        """
+        matrix_ = np.asarray(matrix_, dtype=float_dtype(precision, matrix_))
+        if matrix_.ndim != 2 or matrix_.shape[1] != 4:
+            raise ValueError("Wrong matrix shape")
+        vectors = cls.__new__(cls)
+        vectors._vector = matrix_
+        return vectors
+
+    @property
+    def vector(self):
+        """
+        Return all Stokes vectors as a (N, 4) matrix.
+        """
+        return self._vector
+
+    @property
+    def _ellipse(self):
+        return np.stack([self.E0x, self.E0y, self.phase], axis=1)
+
+    @property
+    def E0x(self):
+        return np.sqrt((self._vector[:, 0] + self._vector[:, 1]) / 2)
+
+    @property
+    def E0y(self):
+        return np.sqrt((self._vector[:, 0] - self._vector[:, 1]) / 2)
+
+    @property
+    def phase(self):
+        return np.arctan2(self._vector[:, 3], self._vector[:, 2])
+
+    @property
+    def degree_of_polarization(self):
+        """
+        Degree of polarization of every beam.
+        Beams with zero intensity have a degree of polarization of 0.
+
+        Returns
+        -------
+        ndarray
+            0. <= degree_of_polarization <= 1.0
+        """
+        polarized = np.sqrt(np.square(self._vector[:, 1:]).sum(axis=1))
+        intensity = self._vector[:, 0]
+        return np.divide(polarized, intensity,
+                         out=np.zeros_like(polarized),
+                         where=intensity != 0)
+
+    def normalize(self):
+        """
+        Normalizes all vectors in place by dividing each one by its intensity.
+        Vectors with zero intensity are left untouched.
+        """
+        intensity = self._vector[:, :1].copy()
+        np.divide(self._vector, intensity, out=self._vector,
+                  where=intensity != 0)
+
+    def __len__(self):
+        return self._vector.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return StokesVector.from_matrix(self._vector[index])
+        return StokesVectorArray.from_matrix(self._vector[index])
+
+    def __add__(self, other):
+        vector = self._vector + other.vector.reshape(-1, 4)
+        return StokesVectorArray.from_matrix(vector)
 
     __radd__ = __add__
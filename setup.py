@@ -32,7 +32,8 @@ setup(
         'Programming Language :: Python :: 3.7'
     ],
     keywords='polarization light ellipse jones stokes mueller coherency',
-    packages=find_packages(exclude=['contrib', 'docs', 'tests']),
+    packages=find_packages(exclude=['contrib', 'docs', 'tests', 'benchmarks']),
     install_requires=['numpy'],
+    extras_require={'scipy': ['scipy']},
     test_suite="tests"
 )
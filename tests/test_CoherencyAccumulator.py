@@ -0,0 +1,108 @@
+import unittest
+import numpy as np
+from pylarization.accumulators import CoherencyAccumulator
+from pylarization.vectors import JonesVector, JonesVectorArray
+from pylarization.matrices import CoherencyMatrix
+from pylarization.conversions import jones_to_coherency, jones_to_stokes
+
+
+class TestCoherencyAccumulator(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.samples = (rng.normal(size=(1000, 2)) +
+                        1j * rng.normal(size=(1000, 2)))
+        self.coherency = jones_to_coherency(self.samples)
+
+    def test_mean_and_variance(self):
+        accumulator = CoherencyAccumulator()
+        for block in np.array_split(self.samples, 7):
+            accumulator.add(block)
+        self.assertEqual(accumulator.weight, 1000)
+        self.assertTrue(np.allclose(accumulator.mean,
+                                    self.coherency.mean(axis=0)))
+        variance = np.abs(self.coherency - self.coherency.mean(axis=0)) ** 2
+        self.assertTrue(np.allclose(accumulator.variance,
+                                    variance.mean(axis=0)))
+
+    def test_single_samples(self):
+        accumulator = CoherencyAccumulator()
+        for sample in self.samples[:10]:
+            accumulator.add(sample)
+        accumulator.add(JonesVector(1, 0))
+        accumulator.add(JonesVectorArray([1], [1j]))
+        self.assertEqual(accumulator.weight, 12)
+        expected = np.concatenate(
+            [self.coherency[:10], jones_to_coherency([[1, 0], [1, 1j]])])
+        self.assertTrue(np.allclose(accumulator.mean, expected.mean(axis=0)))
+
+    def test_forgetting(self):
+        forgetting = 0.9
+        accumulator = CoherencyAccumulator(forgetting)
+        accumulator.add(self.samples[:30]).add(self.samples[30:50])
+        weights = forgetting ** np.arange(49, -1, -1.0)
+        mean = np.einsum('n,nij->ij', weights, self.coherency[:50])
+        mean /= weights.sum()
+        self.assertAlmostEqual(accumulator.weight, weights.sum())
+        self.assertTrue(np.allclose(accumulator.mean, mean))
+        variance = np.einsum('n,nij->ij', weights,
+                             np.abs(self.coherency[:50] - mean) ** 2)
+        self.assertTrue(np.allclose(accumulator.variance,
+                                    variance / weights.sum()))
+
+    def test_stokes(self):
+        accumulator = CoherencyAccumulator().add(self.samples)
+        stokes = jones_to_stokes(self.samples).mean(axis=0)
+        self.assertTrue(np.allclose(accumulator.stokes().vector[:, 0],
+                                    stokes))
+        polarized = np.sqrt(np.sum(stokes[1:] ** 2)) / stokes[0]
+        self.assertAlmostEqual(accumulator.degree_of_polarization, polarized)
+
+    def test_degree_of_polarization(self):
+        accumulator = CoherencyAccumulator()
+        accumulator.add(JonesVector(1, 0))
+        self.assertAlmostEqual(accumulator.degree_of_polarization, 1.0)
+        accumulator.add(JonesVector(0, 1))
+        self.assertAlmostEqual(accumulator.degree_of_polarization, 0.0)
+        accumulator.reset()
+        self.assertEqual(accumulator.degree_of_polarization, 0.0)
+        self.assertTrue(np.isnan(accumulator.variance).all())
+
+    def test_coherency_matrix(self):
+        vector = JonesVector(0.6, 0.8j)
+        matrix = CoherencyAccumulator().add(vector).coherency_matrix()
+        self.assertIsInstance(matrix, CoherencyMatrix)
+        self.assertAlmostEqual(matrix.phase, vector.phase)
+        self.assertAlmostEqual(matrix.azimuth, vector.azimuth)
+
+    def test_precision(self):
+        accumulator = CoherencyAccumulator(precision='single')
+        accumulator.add(self.samples.astype(np.complex64))
+        self.assertEqual(accumulator.mean.dtype, np.complex64)
+        self.assertEqual(accumulator.variance.dtype, np.float32)
+
+    def test_large_mean_small_spread(self):
+        rng = np.random.default_rng(8)
+        noise = rng.normal(size=(1000, 2)) + 1j * rng.normal(size=(1000, 2))
+        cases = (('double', np.complex128, 1000.0, 1e-6),
+                 ('single', np.complex64, 1.0, 1e-2))
+        for precision, dtype, offset, rtol in cases:
+            samples = (offset + 1e-3 * noise).astype(dtype)
+            coherency = jones_to_coherency(samples.astype(np.complex128))
+            expected = np.mean(
+                np.abs(coherency - coherency.mean(axis=0)) ** 2, axis=0)
+            for block_count in (1, 3):
+                accumulator = CoherencyAccumulator(precision=precision)
+                for block in np.array_split(samples, block_count):
+                    accumulator.add(block)
+                self.assertTrue(np.allclose(accumulator.variance, expected,
+                                            rtol=rtol), precision)
+
+    def test_wrong_input(self):
+        with self.assertRaises(ValueError):
+            CoherencyAccumulator(0.0)
+        with self.assertRaises(ValueError):
+            CoherencyAccumulator().add(np.ones((3, 4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
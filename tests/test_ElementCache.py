@@ -0,0 +1,101 @@
+import threading
+import unittest
+import numpy as np
+from pylarization.cache import ElementCache
+from pylarization.elements import JonesMatrixOpticalElements
+from pylarization.matrices import JonesMatrix
+from pylarization.vectors import JonesVector
+
+
+class TestElementCache(unittest.TestCase):
+    def test_shared_matrix(self):
+        cache = ElementCache()
+        first = cache.jones_matrix(0.3, np.pi / 2, 1.0)
+        self.assertIs(cache.jones_matrix(0.3, np.pi / 2, 1.0), first)
+        self.assertTrue(np.allclose(first.matrix,
+                                    JonesMatrix(0.3, np.pi / 2, 1.0).matrix))
+        self.assertEqual(cache.statistics[:2], (1, 1))
+
+    def test_read_only(self):
+        matrix = ElementCache().jones_matrix(0.3, 1.0, 1.0)
+        with self.assertRaises(ValueError):
+            matrix.matrix[0, 0] = 0
+        result = matrix @ JonesVector(1, 0)
+        self.assertTrue(result.vector.flags.writeable)
+
+    def test_quantization(self):
+        cache = ElementCache(resolution=1e-3)
+        first = cache.jones_matrix(0.1001, 0.0, 0.0)
+        self.assertIs(cache.jones_matrix(0.0999, 0.0, 0.0), first)
+        self.assertTrue(np.allclose(first.matrix,
+                                    JonesMatrix(0.1, 0.0, 0.0).matrix))
+
+    def test_precision(self):
+        cache = ElementCache()
+        single = cache.jones_matrix(0.3, 1.0, 1.0, 'single')
+        self.assertEqual(single.matrix.dtype, np.complex64)
+        self.assertIsNot(cache.jones_matrix(0.3, 1.0, 1.0), single)
+
+    def test_lru_eviction(self):
+        cache = ElementCache(maxsize=2)
+        first = cache.jones_matrix(0.1)
+        cache.jones_matrix(0.2)
+        cache.jones_matrix(0.1)
+        cache.jones_matrix(0.3)
+        self.assertIs(cache.jones_matrix(0.1), first)
+        statistics = cache.statistics
+        self.assertEqual(statistics.evictions, 1)
+        self.assertEqual(statistics.size, 2)
+        cache.jones_matrix(0.2)
+        self.assertEqual(cache.statistics.misses, 4)
+
+    def test_fifo_eviction(self):
+        cache = ElementCache(maxsize=2, policy='fifo')
+        first = cache.jones_matrix(0.1)
+        cache.jones_matrix(0.2)
+        cache.jones_matrix(0.1)
+        cache.jones_matrix(0.3)
+        self.assertIsNot(cache.jones_matrix(0.1), first)
+
+    def test_elements(self):
+        cache = ElementCache()
+        member = JonesMatrixOpticalElements.VERTICAL_LINEAR_POLARIZER
+        matrix = cache.element(member)
+        self.assertIs(cache.element(member), matrix)
+        self.assertTrue(np.array_equal(matrix.matrix, member.value.matrix))
+        self.assertFalse(matrix.matrix.flags.writeable)
+        self.assertTrue(member.value.matrix.flags.writeable)
+
+    def test_threads(self):
+        cache = ElementCache(maxsize=8)
+        angles = np.linspace(0, 1, 16)
+
+        def work():
+            for _ in range(50):
+                for angle in angles:
+                    cache.jones_matrix(angle)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        statistics = cache.statistics
+        self.assertEqual(statistics.hits + statistics.misses, 4 * 50 * 16)
+        self.assertEqual(statistics.size, 8)
+
+    def test_clear(self):
+        cache = ElementCache()
+        cache.jones_matrix(0.1)
+        cache.clear()
+        self.assertEqual(tuple(cache.statistics), (0, 0, 0, 0, 256))
+
+    def test_wrong_parameters(self):
+        with self.assertRaises(ValueError):
+            ElementCache(policy='random')
+        with self.assertRaises(ValueError):
+            ElementCache(maxsize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,6 +22,14 @@ class TestJonesMatrix(unittest.TestCase):
             JonesMatrixOpticalElements.VERTICAL_LINEAR_POLARIZER.value.matrix
             ))
 
+    def test_init_rotated(self):
+        self.assertTrue(np.allclose(JonesMatrix(angle=pi/4).matrix,
+                                    [[0.5, 0.5], [0.5, 0.5]]))
+        quarter_wave = JonesMatrix(angle=pi/4, retardance=pi/2, transparency=1)
+        self.assertTrue(np.allclose(quarter_wave.matrix,
+                                    0.5 * np.array([[1 + 1j, 1 - 1j],
+                                                    [1 - 1j, 1 + 1j]])))
+
 
 class TestJonesMatrixClassmethods(unittest.TestCase):
     def test_device_factor(self):
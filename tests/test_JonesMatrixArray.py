@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+from numpy import pi
+from pylarization.vectors import JonesVector, JonesVectorArray
+from pylarization.matrices import JonesMatrix, JonesMatrixArray
+
+
+class TestJonesMatrixArray(unittest.TestCase):
+    def setUp(self):
+        self.horizontal = JonesMatrix()
+        self.vertical = JonesMatrix(angle=pi/2)
+        self.stack = JonesMatrixArray([self.horizontal.matrix,
+                                       self.vertical.matrix])
+
+    def test_init_with_wrong_shape(self):
+        with self.assertRaises(ValueError):
+            JonesMatrixArray(np.eye(2))
+        with self.assertRaises(ValueError):
+            JonesMatrixArray(np.ones((3, 4, 4)))
+
+    def test_indexing(self):
+        self.assertEqual(len(self.stack), 2)
+        self.assertIsInstance(self.stack[1], JonesMatrix)
+        self.assertTrue(np.allclose(self.stack[1].matrix, self.vertical.matrix))
+        self.assertIsInstance(self.stack[:1], JonesMatrixArray)
+
+
+class TestJonesMatrixArrayCalculations(unittest.TestCase):
+    def setUp(self):
+        self.stack = JonesMatrixArray([[[1, 0], [0, 0]],
+                                       [[0, 0], [0, 1]],
+                                       [[1, 0], [0, -1j]]])
+        self.vector = JonesVector(1, 1)
+
+    def test_single_vector_multiplication(self):
+        result = self.stack @ self.vector
+        self.assertIsInstance(result, JonesVectorArray)
+        self.assertTrue(np.allclose(result.vector,
+                                    [[1, 0], [0, 1], [1, -1j]]))
+
+    def test_vector_batch_multiplication(self):
+        vectors = JonesVectorArray([1, 1, 1], [1, 2, 1j])
+        result = self.stack @ vectors
+        self.assertTrue(np.allclose(result.vector,
+                                    [[1, 0], [0, 2], [1, 1]]))
+
+    def test_vector_batch_broadcasting(self):
+        vectors = JonesVectorArray([1, 0, 1], [0, 1, 1])
+        result = JonesMatrixArray(self.stack.matrix[2:]) @ vectors
+        self.assertEqual(len(result), 3)
+        self.assertTrue(np.allclose(result.vector,
+                                    [[1, 0], [0, -1j], [1, -1j]]))
+
+    def test_single_matrix_times_vector_batch(self):
+        vectors = JonesVectorArray([1, 0], [0, 1])
+        result = JonesMatrix.from_matrix([[1, 0], [0, -1j]]) @ vectors
+        self.assertIsInstance(result, JonesVectorArray)
+        self.assertTrue(np.allclose(result.vector, [[1, 0], [0, -1j]]))
+
+    def test_stack_multiplication(self):
+        result = self.stack @ self.stack
+        self.assertIsInstance(result, JonesMatrixArray)
+        self.assertTrue(np.allclose(result.matrix[2], [[1, 0], [0, -1]]))
+
+    def test_single_matrix_multiplication(self):
+        matrix = JonesMatrix.from_matrix([[0, 1], [1, 0]])
+        self.assertTrue(np.allclose((self.stack @ matrix).matrix[0],
+                                    [[0, 1], [0, 0]]))
+        self.assertTrue(np.allclose((matrix @ self.stack).matrix[0],
+                                    [[0, 0], [1, 0]]))
+
+    def test_vector_multiplication_with_wrong_order(self):
+        with self.assertRaises(ValueError):
+            self.vector @ self.stack
+
+
+class TestJonesMatrixArraySweep(unittest.TestCase):
+    def test_sweep_matches_constructor(self):
+        angles = np.linspace(0, pi, 7)
+        retardances = np.array([0, pi/2, pi])
+        stack = JonesMatrixArray.sweep(angles[:, None], retardances[None, :],
+                                       0.5)
+        self.assertIsInstance(stack, JonesMatrixArray)
+        self.assertEqual(stack.matrix.shape, (21, 2, 2))
+        grid = stack.matrix.reshape(7, 3, 2, 2)
+        for i, angle in enumerate(angles):
+            for j, retardance in enumerate(retardances):
+                expected = JonesMatrix(angle, retardance, 0.5).matrix
+                self.assertTrue(np.allclose(grid[i, j], expected))
+
+    def test_sweep_of_scalars(self):
+        stack = JonesMatrixArray.sweep(pi/2)
+        self.assertEqual(len(stack), 1)
+        self.assertTrue(np.allclose(stack.matrix[0], JonesMatrix(pi/2).matrix))
+
+
+if __name__ == '__main__':
+    unittest.main()
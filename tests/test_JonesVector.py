@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from numpy import sqrt, pi
 from pylarization.vectors import JonesVector
 from pylarization.ellipse import PolarizationEllipse
@@ -90,5 +91,44 @@ class TestJonesVectorAddition(unittest.TestCase):
         self.assertEqual(expected_sum.vector.all(), vector_sum.vector.all())
 
 
+class TestJonesVectorConstruction(unittest.TestCase):
+    def test_from_buffer_does_not_copy(self):
+        buffer = np.array([[1], [1j]], dtype=complex)
+        vector = JonesVector._from_buffer(buffer)
+        self.assertIs(vector.vector, buffer)
+        self.assertAlmostEqual(vector.phase, JonesVector(1, 1j).phase)
+
+    def test_from_matrix_copies(self):
+        buffer = np.array([[1], [1j]], dtype=complex)
+        self.assertIsNot(JonesVector.from_matrix(buffer).vector, buffer)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(JonesVector(1, 1j), '__dict__'))
+
+
+class TestJonesVectorCaching(unittest.TestCase):
+    def test_derived_parameters_are_cached(self):
+        vector = JonesVector(0.89 * 0.5, 0.89 * 1j)
+        self.assertIsNone(vector._derived)
+        azimuth = vector.azimuth
+        self.assertIsNotNone(vector._derived)
+        self.assertEqual(vector.azimuth, azimuth)
+
+    def test_normalize_invalidates_cache(self):
+        vector = JonesVector(3, 4j)
+        self.assertAlmostEqual(vector.intensity, 25)
+        vector.normalize()
+        self.assertAlmostEqual(vector.intensity, 1)
+        self.assertAlmostEqual(vector.E0x, 0.6)
+
+    def test_simplify_invalidates_cache(self):
+        vector = JonesVector(1j, -1)
+        ellipticity_angle = vector.ellipticity_angle
+        vector._simplify()
+        self.assertIsNone(vector._derived)
+        self.assertAlmostEqual(vector._x_phase, 0)
+        self.assertAlmostEqual(vector.ellipticity_angle, ellipticity_angle)
+
+
 if __name__ == '__main__':
     unittest.main()
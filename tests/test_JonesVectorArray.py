@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+from numpy import sqrt
+from pylarization.vectors import JonesVector, JonesVectorArray
+from pylarization.polarizations import JonesVectorState
+
+
+E = sqrt(2) * 0.5
+
+
+class TestJonesVectorArrayValues(unittest.TestCase):
+    def setUp(self):
+        self.states = [state.value for state in JonesVectorState]
+        self.states.append(JonesVector(0.89 * 0.5, 0.89 * 1j))
+        self.array = JonesVectorArray(
+            [state.vector.item(0) for state in self.states],
+            [state.vector.item(1) for state in self.states]
+            )
+
+    def test_shape(self):
+        self.assertEqual(len(self.array), len(self.states))
+        self.assertEqual(self.array.vector.shape, (len(self.states), 2))
+
+    def test_parameters_match_scalar_vectors(self):
+        for name in ('E0x', 'E0y', 'phase', 'intensity', 'azimuth',
+                     'ellipticity_angle', 'diagonal_angle',
+                     'complement_diagonal_angle'):
+            expected = [getattr(state, name) for state in self.states]
+            self.assertTrue(
+                np.allclose(getattr(self.array, name), expected), name)
+
+    def test_indexing(self):
+        vector = self.array[2]
+        self.assertIsInstance(vector, JonesVector)
+        self.assertTrue(np.allclose(vector.vector, self.states[2].vector))
+        self.assertIsInstance(self.array[1:3], JonesVectorArray)
+        self.assertEqual(len(self.array[1:3]), 2)
+
+    def test_from_matrix_does_not_copy(self):
+        matrix = np.ones((3, 2), dtype=complex)
+        self.assertIs(JonesVectorArray.from_matrix(matrix).vector, matrix)
+
+    def test_from_matrix_with_wrong_shape(self):
+        with self.assertRaises(ValueError):
+            JonesVectorArray.from_matrix(np.ones((3, 3)))
+
+
+class TestJonesVectorArrayNormalization(unittest.TestCase):
+    def test_normalize(self):
+        array = JonesVectorArray([2, 0, 0.445], [0, 0, 0.89j])
+        azimuth = array.azimuth
+        array.normalize()
+        self.assertTrue(np.allclose(array.intensity, [1, 0, 1]))
+        self.assertTrue(np.allclose(array.azimuth, azimuth))
+
+
+class TestJonesVectorArrayAddition(unittest.TestCase):
+    def test_addition(self):
+        left = JonesVectorArray([E, 1], [E * 1j, 0])
+        right = JonesVectorArray([E, 0], [-E * 1j, 1])
+        vector_sum = left + right
+        self.assertIsInstance(vector_sum, JonesVectorArray)
+        self.assertTrue(np.allclose(vector_sum.vector, [[2 * E, 0], [1, 1]]))
+
+    def test_addition_of_single_vector(self):
+        vector_sum = JonesVectorArray([1, 0], [0, 1]) + JonesVector(1, 1)
+        self.assertTrue(np.allclose(vector_sum.vector, [[2, 1], [1, 2]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import subprocess
+import sys
+import unittest
+import pylarization
+from pylarization.registry import LazyEnum
+from pylarization.polarizations import JonesVectorState, StokesVectorState
+from pylarization.elements import JonesMatrixOpticalElements
+from pylarization.vectors import JonesVector, StokesVector
+from pylarization.matrices import JonesMatrix
+
+
+class TestLazyEnum(unittest.TestCase):
+    def test_value(self):
+        state = StokesVectorState.LINEAR_VERTICAL
+        self.assertIsInstance(state.value, StokesVector)
+        self.assertEqual(state.value.vector[1, 0], -1)
+        self.assertEqual(state.arguments, (1, -1, 0, 0))
+
+    def test_value_is_cached(self):
+        state = JonesVectorState.LINEAR_DIAGONAL
+        self.assertIs(state.value, state.value)
+
+    def test_lookup(self):
+        self.assertIs(JonesVectorState['LINEAR_HORIZONTAL'],
+                      JonesVectorState.LINEAR_HORIZONTAL)
+        self.assertIs(JonesVectorState((1, 0)),
+                      JonesVectorState.LINEAR_HORIZONTAL)
+        self.assertEqual(len(JonesVectorState), 6)
+        for state in JonesVectorState:
+            self.assertIsInstance(state.value, JonesVector)
+
+    def test_elements(self):
+        element = JonesMatrixOpticalElements.HORIZONTAL_LINEAR_POLARIZER
+        self.assertIsInstance(element.value, JonesMatrix)
+        self.assertEqual(element.value.matrix[0, 0], 1)
+
+    def test_missing_factory(self):
+        class States(LazyEnum):
+            ONE = (1,)
+
+        with self.assertRaises(AttributeError):
+            States.ONE.value
+
+    def test_import_does_not_build_members(self):
+        code = ("import sys, pylarization.polarizations, "
+                "pylarization.elements; "
+                "sys.exit('pylarization.vectors' in sys.modules)")
+        self.assertEqual(subprocess.call([sys.executable, '-c', code]), 0)
+
+
+class TestNamespace(unittest.TestCase):
+    def test_exports(self):
+        self.assertIs(pylarization.JonesVector, JonesVector)
+        self.assertIs(pylarization.JonesVectorState, JonesVectorState)
+        self.assertIn('JonesMatrix', dir(pylarization))
+        for name in pylarization.__all__:
+            self.assertTrue(hasattr(pylarization, name), name)
+
+    def test_submodules(self):
+        from pylarization import vectors
+        self.assertIs(pylarization.vectors, vectors)
+
+    def test_missing(self):
+        with self.assertRaises(AttributeError):
+            pylarization.nothing
+
+    def test_import_is_lazy(self):
+        code = ("import sys, pylarization; "
+                "sys.exit('numpy' in sys.modules)")
+        self.assertEqual(subprocess.call([sys.executable, '-c', code]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
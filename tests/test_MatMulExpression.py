@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+from numpy import pi
+from pylarization.vectors import JonesVector, JonesVectorArray
+from pylarization.vectors import StokesVector, StokesVectorArray
+from pylarization.matrices import JonesMatrix, JonesMatrixArray
+from pylarization.matrices import MuellerMatrix
+from pylarization.expressions import lazy, MatMulExpression
+
+
+class TestMatMulExpression(unittest.TestCase):
+    def setUp(self):
+        self.matrices = [JonesMatrix(0.3, 1, 0.5),
+                         JonesMatrix(1.1, pi/2, 1),
+                         JonesMatrix(2, 0.2, 0.1)]
+        self.batch = JonesVectorArray(np.linspace(0, 1, 100),
+                                      np.linspace(1, 0, 100) * 1j)
+        self.stack = JonesMatrixArray.sweep(np.linspace(0, pi, 100), pi/2, 1)
+
+    def eager(self, operands):
+        result = operands[-1]
+        for operand in reversed(operands[:-1]):
+            result = operand @ result
+        return result
+
+    def test_building_is_lazy(self):
+        m1, m2, m3 = self.matrices
+        expression = lazy(m1) @ m2 @ m3 @ self.batch
+        self.assertIsInstance(expression, MatMulExpression)
+        self.assertEqual(len(expression.operands), 4)
+        expression = m1 @ (m2 @ lazy(m3))
+        self.assertEqual(expression.operands, tuple(self.matrices))
+
+    def test_matrices_are_folded_before_a_batch(self):
+        expression = lazy(self.matrices[0]) @ self.matrices[1] @ \
+            self.matrices[2] @ self.batch
+        splits, _ = expression._association()
+        self.assertEqual(splits[0][3], 2)
+
+    def test_batch_is_pushed_through_stacks(self):
+        expression = lazy(self.stack) @ self.stack @ self.batch
+        splits, _ = expression._association()
+        self.assertEqual(splits[0][2], 0)
+
+    def test_evaluate(self):
+        chains = [
+            self.matrices + [self.batch],
+            [self.stack, self.matrices[0], self.stack, self.batch],
+            self.matrices + [JonesVector(1, 1j)],
+            self.matrices,
+            [self.matrices[0], self.stack, self.matrices[1]],
+            ]
+        for operands in chains:
+            expression = MatMulExpression(operands)
+            result = expression.evaluate()
+            expected = self.eager(operands)
+            self.assertIsInstance(result, type(expected))
+            if hasattr(expected, 'vector'):
+                self.assertTrue(np.allclose(result.vector, expected.vector))
+            else:
+                self.assertTrue(np.allclose(result.matrix, expected.matrix))
+
+    def test_evaluate_mueller(self):
+        matrix = MuellerMatrix(0.5 * np.array([[1, 1, 0, 0],
+                                               [1, 1, 0, 0],
+                                               [0, 0, 0, 0],
+                                               [0, 0, 0, 0]]))
+        vectors = StokesVectorArray([1, 1], [0, -1], [1, 0], [0, 0])
+        result = (lazy(matrix) @ matrix @ vectors).evaluate()
+        self.assertTrue(np.allclose(result.vector,
+                                    [[0.5, 0.5, 0, 0], [0, 0, 0, 0]]))
+        single = (lazy(matrix) @ StokesVector(1, 1, 0, 0)).evaluate()
+        self.assertIsInstance(single, StokesVector)
+
+    def test_mixing_is_not_allowed(self):
+        with self.assertRaises(TypeError):
+            (lazy(self.matrices[0]) @ StokesVector(1, 0, 0, 0)).evaluate()
+
+    def test_vector_must_be_last(self):
+        vector = JonesVector(1, 0)
+        with self.assertRaises(TypeError):
+            vector @ lazy(self.matrices[0])
+        with self.assertRaises(TypeError):
+            lazy(vector) @ self.matrices[0]
+        with self.assertRaises(TypeError):
+            lazy(self.matrices[0]) @ self.batch @ self.matrices[1]
+        with self.assertRaises(TypeError):
+            MatMulExpression([self.batch, self.matrices[0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+from pylarization.vectors import StokesVector, StokesVectorArray
+from pylarization.matrices import MuellerMatrix, MuellerMatrixArray
+
+
+HORIZONTAL_POLARIZER = 0.5 * np.array([[1, 1, 0, 0],
+                                       [1, 1, 0, 0],
+                                       [0, 0, 0, 0],
+                                       [0, 0, 0, 0]])
+
+
+class TestMuellerMatrixArrayCalculations(unittest.TestCase):
+    def setUp(self):
+        self.stack = MuellerMatrixArray([np.eye(4), HORIZONTAL_POLARIZER])
+
+    def test_single_vector_multiplication(self):
+        result = self.stack @ StokesVector(1, 0, 0, 0)
+        self.assertIsInstance(result, StokesVectorArray)
+        self.assertTrue(np.allclose(result.vector,
+                                    [[1, 0, 0, 0], [0.5, 0.5, 0, 0]]))
+
+    def test_vector_batch_multiplication(self):
+        vectors = StokesVectorArray([1, 1], [0, -1], [1, 0], [0, 0])
+        result = self.stack @ vectors
+        self.assertTrue(np.allclose(result.vector,
+                                    [[1, 0, 1, 0], [0, 0, 0, 0]]))
+
+    def test_stack_multiplication(self):
+        result = self.stack @ self.stack
+        self.assertIsInstance(result, MuellerMatrixArray)
+        self.assertTrue(np.allclose(result.matrix[1], HORIZONTAL_POLARIZER))
+
+    def test_single_matrix_multiplication(self):
+        result = MuellerMatrix(HORIZONTAL_POLARIZER) @ self.stack
+        self.assertIsInstance(result, MuellerMatrixArray)
+        self.assertTrue(np.allclose(result.matrix[0], HORIZONTAL_POLARIZER))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import numpy as np
+from pylarization.polarimetry import MuellerPolarimeter
+from pylarization.vectors import StokesVector, StokesVectorArray
+from pylarization.matrices import MuellerMatrix, MuellerMatrixArray
+
+
+# Regular tetrahedron on the Poincare sphere, the optimal set of states.
+TETRAHEDRON = np.array([[1, 1, 0, 0],
+                        [1, -1 / 3, np.sqrt(8) / 3, 0],
+                        [1, -1 / 3, -np.sqrt(2) / 3, np.sqrt(2 / 3)],
+                        [1, -1 / 3, -np.sqrt(2) / 3, -np.sqrt(2 / 3)]])
+
+
+class TestMuellerPolarimeter(unittest.TestCase):
+    def setUp(self):
+        self.polarimeter = MuellerPolarimeter(TETRAHEDRON, TETRAHEDRON)
+        rng = np.random.default_rng(5)
+        self.matrices = rng.normal(size=(6, 4, 4))
+
+    def test_condition_number(self):
+        self.assertEqual(len(self.polarimeter), 16)
+        self.assertAlmostEqual(self.polarimeter.condition_number, 3.0)
+
+    def test_single_matrix(self):
+        mueller = MuellerMatrix(self.matrices[0])
+        intensities = self.polarimeter.measure(mueller)
+        self.assertEqual(intensities.shape, (16,))
+        result = self.polarimeter.reconstruct(intensities)
+        self.assertIsInstance(result, MuellerMatrix)
+        self.assertTrue(np.allclose(result.matrix, mueller.matrix))
+
+    def test_frames(self):
+        frames = self.polarimeter.measure(self.matrices).reshape(16, 2, 3)
+        result = self.polarimeter.reconstruct(frames)
+        self.assertIsInstance(result, MuellerMatrixArray)
+        self.assertTrue(np.allclose(result.matrix, self.matrices))
+
+    def test_paired_states(self):
+        rng = np.random.default_rng(7)
+        pairs = rng.permutation(np.arange(40) % 16)
+        generators = StokesVectorArray.from_matrix(TETRAHEDRON[pairs % 4])
+        analyzers = [StokesVector(*state)
+                     for state in TETRAHEDRON[pairs // 4]]
+        polarimeter = MuellerPolarimeter(generators, analyzers,
+                                         combinations=False)
+        frames = polarimeter.measure(MuellerMatrixArray(self.matrices))
+        self.assertEqual(frames.shape, (40, 6))
+        result = polarimeter.reconstruct(frames)
+        self.assertTrue(np.allclose(result.matrix, self.matrices))
+
+    def test_reduction_matrix_is_cached(self):
+        reduction = self.polarimeter.reduction_matrix()
+        self.assertIs(self.polarimeter.reduction_matrix(), reduction)
+        frames = self.polarimeter.measure(self.matrices).astype(np.float32)
+        result = self.polarimeter.reconstruct(frames)
+        self.assertEqual(result.matrix.dtype, np.float32)
+        self.assertTrue(np.allclose(result.matrix, self.matrices, atol=1e-4))
+
+    def test_insufficient_states(self):
+        with self.assertRaises(ValueError):
+            MuellerPolarimeter(TETRAHEDRON[:3], TETRAHEDRON)
+        with self.assertRaises(ValueError):
+            MuellerPolarimeter(TETRAHEDRON, TETRAHEDRON[:3],
+                               combinations=False)
+
+    def test_wrong_number_of_frames(self):
+        with self.assertRaises(ValueError):
+            self.polarimeter.reconstruct(np.ones((15, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
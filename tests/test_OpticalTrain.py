@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from numpy import pi
+from pylarization.vectors import JonesVector, JonesVectorArray
+from pylarization.matrices import JonesMatrix, JonesMatrixArray, MuellerMatrix
+from pylarization.elements import JonesMatrixOpticalElements
+from pylarization.trains import OpticalTrain
+
+
+class TestOpticalTrain(unittest.TestCase):
+    def setUp(self):
+        self.quarter_wave = JonesMatrix(pi/4, pi/2, 1)
+        self.train = OpticalTrain([
+            JonesMatrixOpticalElements.HORIZONTAL_LINEAR_POLARIZER,
+            self.quarter_wave,
+            JonesMatrix(pi/2, pi, 1),
+            ])
+
+    def test_operator(self):
+        expected = (JonesMatrix(pi/2, pi, 1) @ self.quarter_wave @
+                    JonesMatrixOpticalElements.HORIZONTAL_LINEAR_POLARIZER.value)
+        self.assertIsInstance(self.train.operator, JonesMatrix)
+        self.assertTrue(np.allclose(self.train.operator.matrix,
+                                    expected.matrix))
+
+    def test_apply(self):
+        result = self.train @ JonesVector(1, 1)
+        self.assertIsInstance(result, JonesVector)
+        expected = self.train.operator @ JonesVector(1, 1)
+        self.assertTrue(np.allclose(result.vector, expected.vector))
+        batch = self.train.apply(JonesVectorArray([1, 0, 1], [0, 1, 1j]))
+        self.assertIsInstance(batch, JonesVectorArray)
+        self.assertTrue(np.allclose(batch[2].vector, expected.vector))
+
+    def test_operator_is_cached(self):
+        operator = self.train.operator
+        self.assertIs(self.train.operator, operator)
+
+    def test_only_changed_elements_are_recomposed(self):
+        self.train.operator
+        first, second = self.train._partials[:2]
+        self.train[2] = JonesMatrix(0, pi, 1)
+        self.train.operator
+        self.assertIs(self.train._partials[0], first)
+        self.assertIs(self.train._partials[1], second)
+
+    def test_in_place_change_is_noticed(self):
+        self.train.operator
+        self.quarter_wave.matrix[:] = np.eye(2)
+        expected = JonesMatrix(pi/2, pi, 1) @ JonesMatrix()
+        self.assertTrue(np.allclose(self.train.operator.matrix,
+                                    expected.matrix))
+
+    def test_stacks(self):
+        stack = JonesMatrixArray.sweep(np.linspace(0, pi, 5), pi/2, 1)
+        self.train.append(stack)
+        result = self.train @ JonesVector(1, 0)
+        self.assertEqual(len(result), 5)
+        expected = stack[1] @ OpticalTrain(self.train[:3]).operator
+        self.assertTrue(np.allclose(result[1].vector,
+                                    (expected @ JonesVector(1, 0)).vector))
+
+    def test_mixing_is_not_allowed(self):
+        with self.assertRaises(TypeError):
+            self.train.append(MuellerMatrix(np.eye(4)))
+        with self.assertRaises(TypeError):
+            self.train[0] = MuellerMatrix(np.eye(4))
+
+    def test_empty_train(self):
+        with self.assertRaises(ValueError):
+            OpticalTrain().operator
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import warnings
+from unittest import mock
+import numpy as np
+from numpy import pi
+from pylarization.vectors import JonesVectorArray, StokesVectorArray
+from pylarization.matrices import JonesMatrix, JonesMatrixArray
+from pylarization.matrices import MuellerMatrix
+from pylarization.trains import OpticalTrain
+from pylarization import parallel
+from pylarization.parallel import ProcessExecutor
+
+
+class TestProcessExecutor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessExecutor(workers=2, threshold=0)
+        # without shared memory the tests run the serial fallback
+        cls.executor._warned = parallel.shared_memory is None
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.jones = JonesVectorArray(rng.randn(101) + 1j * rng.randn(101),
+                                      rng.randn(101) + 1j * rng.randn(101))
+        polarized = rng.uniform(-1, 1, (101, 3))
+        self.stokes = StokesVectorArray.from_matrix(np.column_stack(
+            [np.linalg.norm(polarized, axis=1), polarized]))
+
+    def test_ellipse_angles(self):
+        for states in (self.jones, self.stokes):
+            angles = self.executor.ellipse_angles(states)
+            for result, expected in zip(angles, states.ellipse_angles()):
+                self.assertTrue(np.allclose(result, expected))
+
+    @unittest.skipIf(parallel.shared_memory is None,
+                     "shared memory requires Python 3.8")
+    def test_pool_is_used(self):
+        self.executor.ellipse_angles(self.jones)
+        self.assertIsNotNone(self.executor._pool)
+
+    def test_apply_matrix(self):
+        matrix = JonesMatrix(pi/3, pi/2, 0.5)
+        result = self.executor.apply(matrix, self.jones)
+        self.assertIsInstance(result, JonesVectorArray)
+        self.assertTrue(np.allclose(result.vector, (matrix @ self.jones).vector))
+
+    def test_apply_train(self):
+        train = OpticalTrain([MuellerMatrix(np.eye(4)),
+                              MuellerMatrix(np.diag([1, 1, -1, -1]))])
+        result = self.executor.apply(train, self.stokes)
+        self.assertIsInstance(result, StokesVectorArray)
+        self.assertTrue(np.allclose(result.vector, (train @ self.stokes).vector))
+
+    def test_apply_stack(self):
+        stack = JonesMatrixArray.sweep(np.linspace(0, pi, 101), pi/2, 1)
+        result = self.executor.apply(stack, self.jones)
+        self.assertTrue(np.allclose(result.vector, (stack @ self.jones).vector))
+
+    def test_normalize(self):
+        buffer = self.jones.vector
+        self.executor.normalize(self.jones)
+        self.assertIs(self.jones.vector, buffer)
+        self.assertTrue(np.allclose(self.jones.intensity, 1))
+
+    def test_serial_fallback(self):
+        executor = ProcessExecutor(workers=2, threshold=1000)
+        executor.ellipse_angles(self.jones)
+        self.assertIsNone(executor._pool)
+
+    def test_fallback_without_shared_memory(self):
+        executor = ProcessExecutor(workers=2, threshold=0)
+        with mock.patch.object(parallel, 'shared_memory', None):
+            with self.assertWarns(RuntimeWarning):
+                angles = executor.ellipse_angles(self.jones)
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                executor.normalize(self.jones)
+        self.assertIsNone(executor._pool)
+        for result, expected in zip(angles, self.jones.ellipse_angles()):
+            self.assertTrue(np.allclose(result, expected))
+        self.assertTrue(np.allclose(self.jones.intensity, 1))
+
+    def test_mismatched_stack(self):
+        stack = JonesMatrixArray.sweep(np.linspace(0, pi, 50), pi/2, 1)
+        with self.assertRaises(ValueError):
+            self.executor.apply(stack, self.jones)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+from pylarization.demodulation import RotatingElementPolarimeter
+from pylarization.vectors import JonesVectorArray, StokesVector
+from pylarization.vectors import StokesVectorArray
+from pylarization.matrices import JonesMatrix, JonesMatrixArray
+from pylarization.conversions import jones_to_stokes
+
+
+class TestRotatingElementPolarimeter(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        phase = np.exp(1j * rng.random(50))
+        self.jones = JonesVectorArray(rng.random(50), rng.random(50) * phase)
+        self.stokes = jones_to_stokes(self.jones)
+
+    def test_harmonics(self):
+        polarimeter = RotatingElementPolarimeter(36)
+        self.assertEqual(list(polarimeter.harmonics), [0, 2, 4])
+        polarimeter = RotatingElementPolarimeter(36, rotations=2)
+        self.assertEqual(list(polarimeter.harmonics), [0, 4, 8])
+
+    def test_fields(self):
+        # traces propagated through the Jones model, not the Mueller one
+        samples = 24
+        angles = 2 * np.pi * np.arange(samples) / samples
+        instrument = (JonesMatrix(0.3, 0.0, 0.0) @
+                      JonesMatrixArray.sweep(angles, 2.0, 1.0))
+        traces = np.empty((len(self.jones), samples))
+        for index in range(len(self.jones)):
+            fields = (instrument @ self.jones[index]).vector
+            traces[index] = np.sum(np.abs(fields) ** 2, axis=1)
+        polarimeter = RotatingElementPolarimeter(
+            samples, retardance=2.0, analyzer_angle=0.3)
+        stokes = polarimeter.demodulate(traces)
+        self.assertIsInstance(stokes, StokesVectorArray)
+        self.assertTrue(np.allclose(stokes.vector, self.stokes.vector))
+
+    def test_single_trace(self):
+        polarimeter = RotatingElementPolarimeter(20, offset=0.1)
+        stokes = StokesVector(1, 0.6, 0, 0.8)
+        result = polarimeter.demodulate(polarimeter.measure(stokes))
+        self.assertIsInstance(result, StokesVector)
+        self.assertTrue(np.allclose(result.vector, stokes.vector))
+
+    def test_rotating_analyzer(self):
+        polarimeter = RotatingElementPolarimeter(16, 'analyzer')
+        stokes = polarimeter.demodulate(polarimeter.measure(self.stokes))
+        self.assertTrue(np.allclose(stokes.vector[:, :3],
+                                    self.stokes.vector[:, :3]))
+        self.assertTrue(np.allclose(stokes.vector[:, 3], 0))
+
+    def test_precision(self):
+        polarimeter = RotatingElementPolarimeter(16)
+        traces = polarimeter.measure(self.stokes).astype(np.float32)
+        stokes = polarimeter.demodulate(traces)
+        self.assertEqual(stokes.vector.dtype, np.float32)
+        self.assertTrue(np.allclose(stokes.vector, self.stokes.vector,
+                                    atol=1e-5))
+
+    def test_wrong_input(self):
+        with self.assertRaises(ValueError):
+            RotatingElementPolarimeter(8)
+        with self.assertRaises(ValueError):
+            RotatingElementPolarimeter(16, 'compensator')
+        with self.assertRaises(ValueError):
+            RotatingElementPolarimeter(16).demodulate(np.ones(15))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+from pylarization.classification import StateClassifier, poincare_points
+from pylarization.classification import cKDTree
+from pylarization.polarizations import (
+    JonesVectorState, StokesVectorState, PolarizationEllipseState)
+from pylarization.vectors import StokesVectorArray, JonesVectorArray
+
+
+class TestPoincarePoints(unittest.TestCase):
+    def test_representations_agree(self):
+        for state in JonesVectorState:
+            expected = poincare_points(StokesVectorState[state.name].value)
+            self.assertTrue(np.allclose(poincare_points(state.value),
+                                        expected), state.name)
+            ellipse = PolarizationEllipseState[state.name].value
+            self.assertTrue(np.allclose(poincare_points(ellipse), expected),
+                            state.name)
+
+    def test_unpolarized(self):
+        points = poincare_points([[1, 0, 0, 0], [2, 0, 0, 1]])
+        self.assertTrue(np.isnan(points[0]).all())
+        self.assertTrue(np.allclose(points[1], [0, 0, 1]))
+
+
+class TestStateClassifier(unittest.TestCase):
+    def test_enum(self):
+        classifier = StateClassifier(StokesVectorState)
+        states = StokesVectorArray([1, 2, 1, 1], [0.9, 1, 0, 0],
+                                   [0.1, 0, 0, 0], [0, 0, -1, 0])
+        labels, distances = classifier.classify(states)
+        self.assertEqual(list(labels), [
+            StokesVectorState.LINEAR_HORIZONTAL,
+            StokesVectorState.LINEAR_HORIZONTAL,
+            StokesVectorState.CIRCULAR_RIGHT_HANDED,
+            None])
+        self.assertAlmostEqual(distances[0], np.arctan2(0.1, 0.9))
+        self.assertAlmostEqual(distances[2], 0.0)
+        self.assertTrue(np.isnan(distances[3]))
+
+    def test_enums_agree(self):
+        jones = StateClassifier(JonesVectorState, block_size=2)
+        ellipse = StateClassifier(PolarizationEllipseState)
+        rng = np.random.default_rng(2)
+        phase = np.exp(6j * rng.random(100))
+        states = JonesVectorArray(rng.random(100), rng.random(100) * phase)
+        jones_labels, jones_distances = jones.classify(states)
+        ellipse_labels, ellipse_distances = ellipse.classify(states)
+        self.assertEqual([label.name for label in jones_labels],
+                         [label.name for label in ellipse_labels])
+        self.assertTrue(np.allclose(jones_distances, ellipse_distances))
+
+    def test_user_references(self):
+        rng = np.random.default_rng(4)
+        references = np.hstack([np.ones((1000, 1)),
+                                rng.normal(size=(1000, 3))])
+        classifier = StateClassifier(references, tree=False)
+        indices, distances = classifier.nearest(references[::7] * 2)
+        self.assertTrue(np.array_equal(indices, np.arange(0, 1000, 7)))
+        self.assertTrue(np.allclose(distances, 0.0, atol=1e-6))
+        labels, _ = classifier.classify(references[:2])
+        self.assertEqual(list(labels), [0, 1])
+
+    @unittest.skipIf(cKDTree is None, "scipy is not installed")
+    def test_tree_matches_brute_force(self):
+        rng = np.random.default_rng(6)
+        references = np.hstack([np.ones((500, 1)),
+                                rng.normal(size=(500, 3))])
+        states = np.hstack([np.ones((300, 1)), rng.normal(size=(300, 3))])
+        brute = StateClassifier(references, tree=False).nearest(states)
+        tree = StateClassifier(references, tree=True).nearest(states)
+        self.assertTrue(np.array_equal(brute[0], tree[0]))
+        self.assertTrue(np.allclose(brute[1], tree[1]))
+
+    def test_unpolarized_reference(self):
+        with self.assertRaises(ValueError):
+            StateClassifier([[1, 0, 0, 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
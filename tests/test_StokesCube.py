@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from pylarization.vectors import StokesVectorArray
+from pylarization.matrices import MuellerMatrix
+from pylarization.cubes import StokesCube, MuellerCube
+
+
+HORIZONTAL_POLARIZER = 0.5 * np.array([[1, 1, 0, 0],
+                                       [1, 1, 0, 0],
+                                       [0, 0, 0, 0],
+                                       [0, 0, 0, 0]])
+
+
+class TestStokesCube(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        rng = np.random.RandomState(0)
+        polarized = rng.uniform(-1, 1, (5, 7, 3))
+        polarized /= np.linalg.norm(polarized, axis=2)[:, :, np.newaxis]
+        self.pixels = np.concatenate(
+            [np.ones((5, 7, 1)), polarized * rng.uniform(0, 1, (5, 7, 1))],
+            axis=2)
+        self.path = os.path.join(self.directory, 'stokes.npy')
+        np.save(self.path, self.pixels)
+        # a single tile holds two rows
+        self.cube = StokesCube.open(self.path, tile_bytes=2 * 7 * 4 * 8)
+
+    def tearDown(self):
+        del self.cube
+        shutil.rmtree(self.directory)
+
+    def path_of(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_open(self):
+        self.assertEqual(self.cube.shape, (5, 7, 4))
+        self.assertIsInstance(self.cube.data, np.memmap)
+
+    def test_open_raw(self):
+        path = self.path_of('stokes.raw')
+        self.pixels.astype(np.float32).tofile(path)
+        cube = StokesCube.open_raw(path, 5, 7, dtype=np.float32)
+        self.assertTrue(np.allclose(cube.data, self.pixels))
+
+    def test_wrong_shape(self):
+        with self.assertRaises(ValueError):
+            StokesCube(np.zeros((5, 7, 3)))
+
+    def test_tiles(self):
+        tiles = list(self.cube.tiles())
+        self.assertEqual(len(tiles), 3)
+        rows, tile = tiles[-1]
+        self.assertEqual(rows, slice(4, 5))
+        self.assertIsInstance(tile, StokesVectorArray)
+        self.assertTrue(np.allclose(tile.vector, self.pixels[4]))
+
+    def test_apply(self):
+        result = self.cube.apply(MuellerMatrix(HORIZONTAL_POLARIZER),
+                                 self.path_of('result.npy'))
+        expected = self.pixels @ HORIZONTAL_POLARIZER.T
+        self.assertTrue(np.allclose(result.data, expected))
+        self.assertTrue(np.allclose(np.load(self.path_of('result.npy')),
+                                    expected))
+
+    def test_apply_per_pixel(self):
+        matrices = np.zeros((5, 7, 4, 4))
+        matrices[:, :3] = HORIZONTAL_POLARIZER
+        matrices[:, 3:] = np.eye(4)
+        np.save(self.path_of('mueller.npy'), matrices)
+        mueller = MuellerCube.open(self.path_of('mueller.npy'), tile_bytes=1)
+        result = self.cube.apply(mueller, self.path_of('result.npy'))
+        expected = np.einsum('hwij,hwj->hwi', matrices, self.pixels)
+        self.assertTrue(np.allclose(result.data, expected))
+
+    def test_ellipse_parameters(self):
+        result = self.cube.ellipse_parameters(self.path_of('ellipse.npy'))
+        stokes = StokesVectorArray.from_matrix(self.pixels.reshape(-1, 4))
+        self.assertEqual(result.shape, (5, 7, 3))
+        self.assertTrue(np.allclose(result[:, :, 0].ravel(), stokes.azimuth))
+        self.assertTrue(np.allclose(result[:, :, 1].ravel(),
+                                    stokes.ellipticity_angle))
+        self.assertTrue(np.allclose(result[:, :, 2].ravel(),
+                                    stokes.degree_of_polarization))
+
+
+if __name__ == '__main__':
+    unittest.main()
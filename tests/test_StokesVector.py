@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from numpy import sqrt, pi
 from pylarization.vectors import StokesVector
 from pylarization.ellipse import PolarizationEllipse
@@ -87,5 +88,30 @@ class TestStokesVectorAddition(unittest.TestCase):
         self.assertEqual(expected_sum.vector.all(), vector_sum.vector.all())
 
 
+class TestStokesVectorConstruction(unittest.TestCase):
+    def test_from_buffer_does_not_copy(self):
+        buffer = np.array([[1.], [0.], [0.], [1.]])
+        vector = StokesVector._from_buffer(buffer)
+        self.assertIs(vector.vector, buffer)
+        self.assertAlmostEqual(vector.phase, StokesVector(1, 0, 0, 1).phase)
+
+    def test_from_matrix_copies(self):
+        buffer = np.array([[1.], [0.], [0.], [1.]])
+        self.assertIsNot(StokesVector.from_matrix(buffer).vector, buffer)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(StokesVector(1, 0, 0, 1), '__dict__'))
+
+
+class TestStokesVectorCaching(unittest.TestCase):
+    def test_normalize_invalidates_cache(self):
+        vector = StokesVector(2, 0, 0, 2)
+        self.assertAlmostEqual(vector.intensity, 2)
+        self.assertAlmostEqual(vector.ellipticity_angle, pi/4)
+        vector.normalize()
+        self.assertAlmostEqual(vector.intensity, 1)
+        self.assertAlmostEqual(vector.ellipticity_angle, pi/4)
+
+
 if __name__ == '__main__':
     unittest.main()
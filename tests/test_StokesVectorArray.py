@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+from pylarization.vectors import StokesVector, StokesVectorArray
+from pylarization.polarizations import StokesVectorState
+
+
+class TestStokesVectorArrayValues(unittest.TestCase):
+    def setUp(self):
+        self.states = [state.value for state in StokesVectorState]
+        self.states.append(StokesVector(0.990125, -0.594075, 0, 0.7921))
+        self.array = StokesVectorArray.from_matrix(
+            np.vstack([state.vector.T for state in self.states]))
+
+    def test_parameters_match_scalar_vectors(self):
+        for name in ('E0x', 'E0y', 'phase', 'intensity', 'azimuth',
+                     'ellipticity_angle', 'diagonal_angle',
+                     'complement_diagonal_angle'):
+            expected = [getattr(state, name) for state in self.states]
+            self.assertTrue(
+                np.allclose(getattr(self.array, name), expected), name)
+
+    def test_degree_of_polarization(self):
+        array = StokesVectorArray([1, 2, 0], [1, 0, 0], [0, 1, 0], [0, 0, 0])
+        self.assertTrue(np.allclose(array.degree_of_polarization,
+                                    [1.0, 0.5, 0.0]))
+
+    def test_indexing(self):
+        vector = self.array[-1]
+        self.assertIsInstance(vector, StokesVector)
+        self.assertTrue(np.allclose(vector.vector, self.states[-1].vector))
+        self.assertIsInstance(self.array[::2], StokesVectorArray)
+
+
+class TestStokesVectorArrayNormalization(unittest.TestCase):
+    def test_normalize(self):
+        array = StokesVectorArray([2, 0, 1.2371], [2, 0, -0.3471],
+                                  [0, 0, 0], [0, 0, 0.7921])
+        buffer = array.vector
+        azimuth = array.azimuth
+        array.normalize()
+        self.assertIs(array.vector, buffer)
+        self.assertTrue(np.allclose(array.vector[:, 0], [1, 0, 1]))
+        self.assertTrue(np.allclose(array.vector[0], [1, 1, 0, 0]))
+        self.assertTrue(np.allclose(array.azimuth, azimuth))
+
+
+class TestStokesVectorArrayAddition(unittest.TestCase):
+    def test_addition(self):
+        left = StokesVectorArray([1, 1], [1, 0], [0, 1], [0, 0])
+        vector_sum = left + StokesVectorState.LINEAR_VERTICAL.value
+        self.assertIsInstance(vector_sum, StokesVectorArray)
+        self.assertTrue(np.allclose(vector_sum.vector,
+                                    [[2, 0, 0, 0], [2, -1, 1, 0]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from numpy import pi
+from pylarization.vectors import JonesVectorArray, StokesVectorArray
+from pylarization.matrices import JonesMatrixArray, MuellerMatrix
+from pylarization.parallel import ThreadExecutor
+
+
+class TestThreadExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadExecutor(workers=3, tile_size=16)
+        rng = np.random.RandomState(0)
+        self.jones = JonesVectorArray(rng.randn(101) + 1j * rng.randn(101),
+                                      rng.randn(101) + 1j * rng.randn(101))
+        polarized = rng.uniform(-1, 1, (101, 3))
+        self.stokes = StokesVectorArray.from_matrix(np.column_stack(
+            [2 * np.linalg.norm(polarized, axis=1), polarized]))
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_ellipse_angles(self):
+        angles = self.executor.ellipse_angles(self.stokes)
+        for result, expected in zip(angles, self.stokes.ellipse_angles()):
+            self.assertTrue(np.allclose(result, expected))
+        self.assertIsNotNone(self.executor._pool)
+
+    def test_apply(self):
+        matrix = MuellerMatrix(np.diag([1, 1, -1, -1]))
+        result = self.executor.apply(matrix, self.stokes)
+        self.assertIsInstance(result, StokesVectorArray)
+        self.assertTrue(np.allclose(result.vector,
+                                    (matrix @ self.stokes).vector))
+        stack = JonesMatrixArray.sweep(np.linspace(0, pi, 101), pi/2, 1)
+        result = self.executor.apply(stack, self.jones)
+        self.assertTrue(np.allclose(result.vector,
+                                    (stack @ self.jones).vector))
+
+    def test_normalize(self):
+        buffer = self.stokes.vector
+        self.executor.normalize(self.stokes)
+        self.assertIs(self.stokes.vector, buffer)
+        self.assertTrue(np.allclose(self.stokes.vector[:, 0], 1))
+        self.executor.normalize(self.jones)
+        self.assertTrue(np.allclose(self.jones.intensity, 1))
+
+    def test_serial_for_single_tile(self):
+        executor = ThreadExecutor(workers=3, tile_size=1000)
+        executor.normalize(self.stokes)
+        self.assertIsNone(executor._pool)
+        self.assertTrue(np.allclose(self.stokes.vector[:, 0], 1))
+
+    def test_mismatched_stack(self):
+        stack = JonesMatrixArray.sweep(np.linspace(0, pi, 50), pi/2, 1)
+        with self.assertRaises(ValueError):
+            self.executor.apply(stack, self.jones)
+
+
+if __name__ == '__main__':
+    unittest.main()
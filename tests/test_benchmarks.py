@@ -0,0 +1,65 @@
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from benchmarks.suite import compare, measure, main
+
+
+def _report(*results):
+    return {'meta': {}, 'results': [
+        {'case': case, 'size': size, 'seconds': seconds}
+        for case, size, seconds in results]}
+
+
+class TestCompare(unittest.TestCase):
+    def setUp(self):
+        self.baseline = _report(('azimuth', 'scalar', 1.0),
+                                ('azimuth', 10, 2.0),
+                                ('normalize', 10, 4.0))
+
+    def test_regressions(self):
+        current = _report(('azimuth', 'scalar', 1.05),
+                          ('azimuth', 10, 2.4),
+                          ('normalize', 10, 2.0))
+        rows = compare(self.baseline, current)
+        self.assertEqual([row[:2] for row in rows],
+                         [('azimuth', 'scalar'), ('azimuth', 10),
+                          ('normalize', 10)])
+        self.assertEqual([row[-1] for row in rows], [False, True, False])
+        self.assertAlmostEqual(rows[1][4], 1.2)
+        self.assertAlmostEqual(rows[2][4], 0.5)
+
+    def test_tolerance(self):
+        current = _report(('azimuth', 10, 2.4))
+        self.assertTrue(compare(self.baseline, current)[0][-1])
+        self.assertFalse(compare(self.baseline, current, 0.25)[0][-1])
+
+    def test_unmatched_cases_are_skipped(self):
+        current = _report(('azimuth', 100, 9.0), ('transform', 10, 1.0))
+        self.assertEqual(compare(self.baseline, current), [])
+
+    def test_exit_status(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, seconds in (('baseline', 2.0), ('current', 3.0)):
+                path = os.path.join(directory, name + '.json')
+                with open(path, 'w') as report:
+                    json.dump(_report(('azimuth', 10, seconds)), report)
+                paths.append(path)
+            with redirect_stdout(StringIO()) as output:
+                self.assertEqual(main(['compare'] + paths), 1)
+                self.assertEqual(main(['compare', paths[0], paths[0]]), 0)
+        self.assertIn('SLOWER', output.getvalue())
+
+
+class TestMeasure(unittest.TestCase):
+    def test_measure(self):
+        seconds = measure(lambda: None, repeat=1)
+        self.assertGreater(seconds, 0)
+        self.assertLess(seconds, 1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
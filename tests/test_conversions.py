@@ -0,0 +1,85 @@
+import unittest
+import numpy as np
+from numpy import pi
+from pylarization.vectors import JonesVector, JonesVectorArray
+from pylarization.vectors import StokesVector, StokesVectorArray
+from pylarization.matrices import JonesMatrix, JonesMatrixArray
+from pylarization.matrices import MuellerMatrix, MuellerMatrixArray
+from pylarization.polarizations import JonesVectorState, StokesVectorState
+from pylarization.conversions import (
+    jones_to_mueller, jones_to_coherency, coherency_to_stokes,
+    jones_to_stokes, stokes_to_jones)
+
+
+class TestJonesToStokes(unittest.TestCase):
+    def test_reference_states(self):
+        for state in JonesVectorState:
+            stokes = jones_to_stokes(state.value)
+            self.assertIsInstance(stokes, StokesVector)
+            self.assertTrue(np.allclose(
+                stokes.vector, StokesVectorState[state.name].value.vector),
+                state.name)
+
+    def test_batch(self):
+        jones = JonesVectorArray.from_matrix(np.vstack(
+            [state.value.vector.T for state in JonesVectorState]))
+        stokes = jones_to_stokes(jones)
+        self.assertIsInstance(stokes, StokesVectorArray)
+        self.assertTrue(np.allclose(stokes.vector, np.vstack(
+            [state.value.vector.T for state in StokesVectorState])))
+        self.assertTrue(np.allclose(stokes.azimuth, jones.azimuth))
+        self.assertTrue(np.allclose(stokes.ellipticity_angle,
+                                    jones.ellipticity_angle))
+
+    def test_through_coherency(self):
+        jones = JonesVectorArray([0.3 + 1j, -2, 0], [1j, 0.5 - 0.1j, 1])
+        coherency = jones_to_coherency(jones)
+        self.assertEqual(coherency.shape, (3, 2, 2))
+        self.assertTrue(np.allclose(coherency_to_stokes(coherency).vector,
+                                    jones_to_stokes(jones).vector))
+
+    def test_arrays(self):
+        stokes = jones_to_stokes(np.array([[1, 0], [0, 1]]))
+        self.assertIsInstance(stokes, np.ndarray)
+        self.assertTrue(np.allclose(stokes, [[1, 1, 0, 0], [1, -1, 0, 0]]))
+
+
+class TestStokesToJones(unittest.TestCase):
+    def test_round_trip(self):
+        stokes = StokesVectorArray.from_matrix(np.vstack(
+            [state.value.vector.T for state in StokesVectorState]))
+        jones = stokes_to_jones(stokes)
+        self.assertIsInstance(jones, JonesVectorArray)
+        self.assertTrue(np.allclose(jones_to_stokes(jones).vector,
+                                    stokes.vector))
+
+    def test_partially_polarized(self):
+        jones = stokes_to_jones(StokesVector(2, 0, 0, 1))
+        self.assertIsInstance(jones, JonesVector)
+        self.assertAlmostEqual(jones.intensity, 1)
+        self.assertAlmostEqual(jones.ellipticity_angle, pi/4)
+
+
+class TestJonesToMueller(unittest.TestCase):
+    def test_polarizer(self):
+        mueller = jones_to_mueller(JonesMatrix())
+        self.assertIsInstance(mueller, MuellerMatrix)
+        self.assertTrue(np.allclose(mueller.matrix,
+                                    0.5 * np.array([[1, 1, 0, 0],
+                                                    [1, 1, 0, 0],
+                                                    [0, 0, 0, 0],
+                                                    [0, 0, 0, 0]])))
+
+    def test_stack_commutes_with_transformation(self):
+        angles = np.linspace(0, pi, 9)
+        jones = JonesMatrixArray.sweep(angles, pi/2, 0.8)
+        vector = JonesVector(0.445, 0.89j)
+        mueller = jones_to_mueller(jones)
+        self.assertIsInstance(mueller, MuellerMatrixArray)
+        self.assertTrue(np.allclose(
+            jones_to_stokes(jones @ vector).vector,
+            (mueller @ jones_to_stokes(vector)).vector))
+
+
+if __name__ == '__main__':
+    unittest.main()
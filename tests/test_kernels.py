@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+from numpy import pi
+from pylarization import kernels
+from pylarization.ellipse import PolarizationEllipse
+from pylarization.polarizations import PolarizationEllipseState
+
+
+class TestKernels(unittest.TestCase):
+    def setUp(self):
+        states = [state.value for state in PolarizationEllipseState]
+        states.append(PolarizationEllipse(0.445, 0.89, pi/2))
+        states.append(PolarizationEllipse(0.0, 0.0, 0.0))
+        self.E0x = np.array([state.E0x for state in states])
+        self.E0y = np.array([state.E0y for state in states])
+        self.phase = np.array([state.phase for state in states])
+
+    def test_expected_angles(self):
+        # E0x, E0y, phase, azimuth, ellipticity angle, diagonal angle
+        cases = np.array([
+            (1.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0, pi/2, 0.0, pi/2),
+            (0.0, 1.0, pi/3, pi/2, 0.0, pi/2),
+            (1.0, 1.0, 0.0, pi/4, 0.0, pi/4),
+            (1.0, 1.0, pi, -pi/4, 0.0, pi/4),
+            (1.0, 1.0, pi/3, pi/4, pi/6, pi/4),
+            (1.0, 1.0, pi/2, pi/4, pi/4, pi/4),
+            (1.0, 1.0, -pi/2, pi/4, -pi/4, pi/4),
+            (2.0, 1.0, pi/3, 0.5 * np.arctan(2/3),
+             0.5 * np.arcsin(2 * np.sqrt(3) / 5), np.arctan(0.5)),
+            (1.0, 2.0, 0.0, 0.5 * np.arctan(-4/3), 0.0, np.arctan(2.0)),
+            (0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+            ])
+        E0x, E0y, phase, azimuth, ellipticity, diagonal = cases.T
+        self.assertTrue(np.allclose(
+            kernels.azimuth(E0x, E0y, phase), azimuth))
+        self.assertTrue(np.allclose(
+            kernels.ellipticity_angle(E0x, E0y, phase), ellipticity))
+        self.assertTrue(np.allclose(
+            kernels.diagonal_angle(E0x, E0y), diagonal))
+        for case in cases:
+            state = PolarizationEllipse(*case[:3])
+            self.assertAlmostEqual(state.azimuth, case[3])
+            self.assertAlmostEqual(state.ellipticity_angle, case[4])
+            self.assertAlmostEqual(state.diagonal_angle, case[5])
+
+    def test_ellipse_angles(self):
+        angles = kernels.ellipse_angles(self.E0x, self.E0y, self.phase)
+        self.assertTrue(np.allclose(
+            angles[0], kernels.azimuth(self.E0x, self.E0y, self.phase)))
+        self.assertTrue(np.allclose(
+            angles[1],
+            kernels.ellipticity_angle(self.E0x, self.E0y, self.phase)))
+        self.assertTrue(np.allclose(
+            angles[2], kernels.diagonal_angle(self.E0x, self.E0y)))
+        self.assertTrue(np.allclose(
+            angles[3], kernels.complement_diagonal_angle(self.E0x, self.E0y)))
+
+    def test_zero_intensity(self):
+        with np.errstate(all='raise'):
+            self.assertEqual(
+                PolarizationEllipse(0.0, 0.0, 0.0).ellipticity_angle, 0.0)
+            self.assertEqual(PolarizationEllipse(0.0, 0.0, 0.0).azimuth, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
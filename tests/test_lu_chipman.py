@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+from pylarization.decomposition import lu_chipman
+from pylarization.matrices import JonesMatrix, JonesMatrixArray
+from pylarization.matrices import MuellerMatrix, MuellerMatrixArray
+from pylarization.conversions import jones_to_mueller
+
+
+class TestLuChipman(unittest.TestCase):
+    def setUp(self):
+        self.angles = np.array([0.1, 0.3, -0.4, 0.7])
+        self.retardances = np.array([0.5, 1.0, 2.0, 0.3])
+        retarders = JonesMatrixArray.from_matrix(np.stack([
+            JonesMatrix(angle, retardance, 1.0).matrix
+            for angle, retardance in zip(self.angles, self.retardances)]))
+        self.retarders = jones_to_mueller(retarders).matrix
+        self.diattenuator = jones_to_mueller(JonesMatrix(0.2, 0.0, 0.5))
+        self.depolarizer = np.diag([1.0, 0.8, 0.6, 0.4])
+
+    def test_retarders(self):
+        result = lu_chipman(MuellerMatrixArray(self.retarders))
+        self.assertTrue(result.valid.all())
+        self.assertTrue(np.allclose(result.retardance, self.retardances))
+        self.assertTrue(np.allclose(result.fast_axis, self.angles))
+        self.assertTrue(np.allclose(result.diattenuation, 0))
+        self.assertTrue(np.allclose(result.depolarization_power, 0))
+        self.assertTrue(np.allclose(result.depolarization_index, 1))
+
+    def test_composition(self):
+        stack = np.matmul(np.matmul(self.depolarizer, self.retarders),
+                          self.diattenuator.matrix) * 2
+        result = lu_chipman(stack)
+        transmittance = self.diattenuator.matrix[0, 0]
+        diattenuator = self.diattenuator.matrix / transmittance
+        self.assertTrue(np.allclose(result.transmittance, 2 * transmittance))
+        self.assertTrue(np.allclose(result.diattenuator.matrix, diattenuator))
+        self.assertTrue(np.allclose(result.retarder.matrix, self.retarders))
+        self.assertTrue(np.allclose(result.depolarizer.matrix,
+                                    self.depolarizer))
+        self.assertTrue(np.allclose(result.diattenuation, 0.6))
+        self.assertTrue(np.allclose(result.depolarization_power, 0.4))
+
+    def test_single_matrix(self):
+        result = lu_chipman(MuellerMatrix(self.retarders[0]))
+        self.assertEqual(len(result), 1)
+        self.assertAlmostEqual(result.retardance[0], 0.5)
+
+    def test_singular_pixels(self):
+        polarizer = jones_to_mueller(JonesMatrix(0.0, 0.0, 0.0)).matrix
+        depolarizer = np.diag([1.0, 0.0, 0.0, 0.0])
+        stack = np.stack([polarizer, depolarizer, np.zeros((4, 4)),
+                          self.retarders[0]])
+        result = lu_chipman(stack)
+        self.assertEqual(list(result.valid), [False, False, False, True])
+        self.assertAlmostEqual(result.diattenuation[0], 1.0)
+        self.assertTrue(np.isnan(result.retardance[:3]).all())
+        self.assertAlmostEqual(result.depolarization_power[1], 1.0)
+        self.assertAlmostEqual(result.depolarization_index[1], 0.0)
+        self.assertTrue(np.isnan(result.diattenuation[2]))
+        self.assertAlmostEqual(result.retardance[3], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
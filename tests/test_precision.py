@@ -0,0 +1,138 @@
+import unittest
+import numpy as np
+from pylarization.precision import (
+    get_precision, set_precision, using_precision, float_dtype, complex_dtype)
+from pylarization.vectors import JonesVector, JonesVectorArray
+from pylarization.vectors import StokesVector, StokesVectorArray
+from pylarization.matrices import JonesMatrix, JonesMatrixArray
+from pylarization.matrices import MuellerMatrix, MuellerMatrixArray
+from pylarization.matrices import CoherencyMatrix
+from pylarization.accumulators import CoherencyAccumulator
+from pylarization.ellipse import PolarizationEllipseArray
+from pylarization.polarizations import JonesVectorState, StokesVectorState
+from pylarization.elements import JonesMatrixOpticalElements
+from pylarization.conversions import jones_to_mueller, jones_to_stokes
+
+
+class TestPolicy(unittest.TestCase):
+    def tearDown(self):
+        set_precision('double')
+
+    def test_default(self):
+        self.assertEqual(get_precision(), 'double')
+        self.assertEqual(float_dtype(), np.float64)
+        self.assertEqual(complex_dtype(), np.complex128)
+
+    def test_set_precision(self):
+        set_precision('single')
+        self.assertEqual(float_dtype(), np.float32)
+        self.assertEqual(JonesVector(1, 0).vector.dtype, np.complex64)
+
+    def test_unknown_precision(self):
+        with self.assertRaises(ValueError):
+            set_precision('half')
+        with self.assertRaises(ValueError):
+            StokesVector(1, 1, 0, 0, precision='quad')
+
+    def test_context_manager(self):
+        with using_precision('single'):
+            self.assertEqual(StokesVector(1, 1, 0, 0).vector.dtype,
+                             np.float32)
+        self.assertEqual(get_precision(), 'double')
+
+    def test_explicit_overrides_default(self):
+        with using_precision('single'):
+            self.assertEqual(
+                StokesVector(1, 1, 0, 0, precision='double').vector.dtype,
+                np.float64)
+
+    def test_enum_members_stay_double(self):
+        members = [(JonesVectorState.LINEAR_DIAGONAL, 'vector'),
+                   (StokesVectorState.LINEAR_DIAGONAL, 'vector'),
+                   (JonesMatrixOpticalElements.VERTICAL_LINEAR_POLARIZER,
+                    'matrix')]
+        for member, attribute in members:
+            member.__dict__.pop('_built', None)
+            with using_precision('single'):
+                first = getattr(member.value, attribute).dtype
+            self.assertIn(first, (np.float64, np.complex128))
+            self.assertEqual(getattr(member.value, attribute).dtype, first)
+
+    def test_like(self):
+        self.assertEqual(float_dtype(like=np.zeros(1, np.complex64)),
+                         np.float32)
+        self.assertEqual(complex_dtype(like=[1.0]), np.complex128)
+
+
+class TestSinglePrecision(unittest.TestCase):
+    def test_vectors(self):
+        self.assertEqual(JonesVector(1, 0, 'single').vector.dtype,
+                         np.complex64)
+        self.assertEqual(StokesVector(1, 1, 0, 0, 'single').vector.dtype,
+                         np.float32)
+        jones = JonesVectorArray([1, 0], [0, 1], precision='single')
+        self.assertEqual(jones.vector.dtype, np.complex64)
+        self.assertEqual(jones.azimuth.dtype, np.float32)
+        stokes = StokesVectorArray([1], [1], [0], [0], precision='single')
+        self.assertEqual(stokes.vector.dtype, np.float32)
+        ellipse = PolarizationEllipseArray([1], [0], [0], precision='single')
+        self.assertEqual(ellipse.azimuth.dtype, np.float32)
+
+    def test_matrices(self):
+        self.assertEqual(JonesMatrix(0, 0, 1, 'single').matrix.dtype,
+                         np.complex64)
+        self.assertEqual(MuellerMatrix(np.eye(4), 'single').matrix.dtype,
+                         np.float32)
+        sweep = JonesMatrixArray.sweep([0, 1], [0, 1], precision='single')
+        self.assertEqual(sweep.matrix.dtype, np.complex64)
+
+    def test_from_matrix_keeps_precision(self):
+        stokes = StokesVectorArray.from_matrix(np.ones((3, 4), np.float32))
+        self.assertEqual(stokes.vector.dtype, np.float32)
+        mueller = MuellerMatrixArray.from_matrix(
+            np.ones((3, 4, 4), np.float32))
+        self.assertEqual(mueller.matrix.dtype, np.float32)
+        jones = JonesVectorArray.from_matrix(np.ones((3, 2), np.float32))
+        self.assertEqual(jones.vector.dtype, np.complex64)
+        coherency = CoherencyMatrix.from_matrix(np.eye(2, dtype=np.complex64))
+        self.assertEqual(coherency.matrix.dtype, np.complex64)
+        coherency = CoherencyMatrix.from_matrix(np.eye(2), 'single')
+        self.assertEqual(coherency.matrix.dtype, np.complex64)
+        accumulator = CoherencyAccumulator(precision='single')
+        accumulator.add(JonesVector(1, 0))
+        self.assertEqual(accumulator.coherency_matrix().matrix.dtype,
+                         np.complex64)
+
+    def test_arithmetic_keeps_precision(self):
+        jones = JonesVectorArray([1, 0], [0, 1], precision='single')
+        matrices = JonesMatrixArray.sweep([0, 1], [0, 1], precision='single')
+        self.assertEqual((matrices @ jones).vector.dtype, np.complex64)
+        self.assertEqual((jones + jones).vector.dtype, np.complex64)
+        jones.normalize()
+        self.assertEqual(jones.vector.dtype, np.complex64)
+
+    def test_conversions_keep_precision(self):
+        jones = JonesVectorArray([1, 0], [0, 1j], precision='single')
+        self.assertEqual(jones_to_stokes(jones).vector.dtype, np.float32)
+        matrices = JonesMatrixArray.sweep([0, 1], [0, 1], precision='single')
+        self.assertEqual(jones_to_mueller(matrices).matrix.dtype, np.float32)
+
+    def test_accuracy(self):
+        states = list(JonesVectorState)
+        double = JonesVectorArray.from_matrix(np.vstack(
+            [state.value.vector.T for state in states]))
+        single = JonesVectorArray.from_matrix(double.vector, 'single')
+        error = np.abs(single.ellipticity_angle - double.ellipticity_angle)
+        self.assertLess(error.max(), 1e-6)
+        # azimuth of circular states is undefined and may fold either way
+        linear = np.array(['LINEAR' in state.name for state in states])
+        error = np.abs(single.azimuth - double.azimuth)[linear]
+        self.assertLess(error.max(), 1e-6)
+        stokes = jones_to_stokes(single)
+        expected = np.vstack([StokesVectorState[state.name].value.vector.T
+                              for state in states])
+        self.assertLess(np.abs(stokes.vector - expected).max(), 1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
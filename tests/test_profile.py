@@ -0,0 +1,50 @@
+import json
+import unittest
+from pylarization.profiling import profile
+from pylarization.vectors import JonesVector, StokesVector
+from pylarization.matrices import JonesMatrix
+
+
+class TestProfile(unittest.TestCase):
+    def test_allocations(self):
+        with profile() as stats:
+            JonesMatrix(0.3, 1.0, 0.5) @ JonesVector(1, 0)
+            StokesVector.from_matrix([[1], [1], [0], [0]])
+        self.assertEqual(stats.allocations, {
+            'JonesMatrix': 1, 'JonesVector': 2, 'StokesVector': 1})
+
+    def test_operations(self):
+        with profile() as stats:
+            vector = JonesMatrix(0.3, 1.0, 0.5) @ JonesVector(1, 0)
+            vector.azimuth
+            vector.azimuth
+        calls, seconds = stats.operations['JonesVector.azimuth']
+        self.assertEqual(calls, 2)
+        self.assertGreater(seconds, 0.0)
+        self.assertIn('JonesMatrix.__matmul__', stats.operations)
+        self.assertIn('JonesMatrix.__matmul__', stats.summary())
+
+    def test_disabled_after_block(self):
+        init = JonesVector.__init__
+        with profile() as stats:
+            self.assertIsNot(JonesVector.__init__, init)
+        self.assertIs(JonesVector.__init__, init)
+        JonesVector(1, 0)
+        self.assertEqual(stats.allocations, {})
+
+    def test_nested(self):
+        with profile():
+            with self.assertRaises(RuntimeError):
+                profile().start()
+
+    def test_json(self):
+        with profile() as stats:
+            StokesVector(1, 1, 0, 0).normalize()
+        report = json.loads(stats.to_json())
+        self.assertEqual(report['allocations'], {'StokesVector': 1})
+        self.assertEqual(
+            report['operations']['StokesVector.normalize']['calls'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
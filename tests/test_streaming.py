@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+from pylarization.vectors import JonesVectorArray, StokesVectorArray
+from pylarization.matrices import MuellerMatrix
+from pylarization.streaming import (
+    stokes_blocks, jones_blocks, normalize, transform, ellipse_parameters,
+    windowed, pipeline)
+
+
+HORIZONTAL_POLARIZER = 0.5 * np.array([[1, 1, 0, 0],
+                                       [1, 1, 0, 0],
+                                       [0, 0, 0, 0],
+                                       [0, 0, 0, 0]])
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        polarized = rng.uniform(-1, 1, (10, 3))
+        self.samples = np.column_stack(
+            [2 * np.linalg.norm(polarized, axis=1), polarized])
+
+    def test_stokes_blocks(self):
+        blocks = list(stokes_blocks(self.samples, 4))
+        self.assertEqual([len(block) for block in blocks], [4, 4, 2])
+        self.assertIsInstance(blocks[0], StokesVectorArray)
+        self.assertTrue(np.allclose(blocks[2].vector, self.samples[8:]))
+
+    def test_parsing_text(self):
+        lines = ['1 1 0 0', '1, 0, 0, -1\n']
+        block, = stokes_blocks(lines)
+        self.assertTrue(np.allclose(block.vector, [[1, 1, 0, 0],
+                                                   [1, 0, 0, -1]]))
+        block, = jones_blocks(['1 1i', '0.5 -2j'])
+        self.assertIsInstance(block, JonesVectorArray)
+        self.assertTrue(np.allclose(block.vector, [[1, 1j], [0.5, -2j]]))
+
+    def test_blocks_are_independent(self):
+        first, second = stokes_blocks(self.samples[:8], 4)
+        self.assertTrue(np.allclose(first.vector, self.samples[:4]))
+
+    def test_stages_are_lazy(self):
+        def samples():
+            yield self.samples[0]
+            raise AssertionError("Read too far")
+
+        stream = normalize(stokes_blocks(samples(), 1))
+        self.assertTrue(np.allclose(next(stream).vector[0, 0], 1))
+
+    def test_pipeline(self):
+        results = list(pipeline(
+            stokes_blocks(self.samples, 3),
+            normalize,
+            lambda blocks: transform(blocks, MuellerMatrix(
+                HORIZONTAL_POLARIZER)),
+            ellipse_parameters,
+            lambda blocks: windowed(blocks, 5)))
+        stokes = StokesVectorArray.from_matrix(self.samples.copy())
+        stokes.normalize()
+        stokes = MuellerMatrix(HORIZONTAL_POLARIZER) @ stokes
+        expected = np.column_stack((stokes.intensity,) +
+                                   stokes.ellipse_angles())
+        self.assertEqual(len(results), 2)
+        self.assertTrue(np.allclose(results[0], expected[:5].mean(axis=0)))
+        self.assertTrue(np.allclose(results[1], expected[5:].mean(axis=0)))
+
+    def test_windowed_drops_incomplete_window(self):
+        results = list(windowed(stokes_blocks(self.samples, 3), 4, np.sum))
+        self.assertEqual(len(results), 2)
+        self.assertTrue(np.allclose(results[1], self.samples[4:8].sum(0)))
+
+    def test_windowed_uneven_blocks(self):
+        blocks = np.split(self.samples, [1, 2, 7, 7])
+        for window in (1, 3, 4, 10):
+            results = list(windowed(blocks, window, np.sum))
+            expected = [self.samples[start:start + window].sum(0)
+                        for start in range(0, 10 - 10 % window, window)]
+            self.assertEqual(len(results), len(expected))
+            self.assertTrue(np.allclose(results, expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
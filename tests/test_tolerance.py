@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+from numpy import pi
+from pylarization.vectors import JonesVector, StokesVector
+from pylarization.matrices import JonesMatrix
+from pylarization.conversions import jones_to_stokes
+from pylarization.vectors import StokesVectorArray
+from pylarization.tolerance import ElementTolerance, ToleranceResult
+from pylarization.tolerance import monte_carlo
+
+
+class TestMonteCarlo(unittest.TestCase):
+    def setUp(self):
+        self.state = JonesVector(1, 0)
+        self.elements = [
+            ElementTolerance(pi/4, pi/2, 1, angle_tolerance=0.01,
+                             retardance_tolerance=0.02),
+            ElementTolerance(0.3, pi, 1, angle_tolerance=0.005,
+                             distribution='uniform'),
+            ]
+
+    def test_without_tolerances(self):
+        elements = [ElementTolerance(pi/4, pi/2, 1), ElementTolerance(0.3, pi, 1)]
+        result = monte_carlo(elements, self.state, trials=10, seed=0)
+        expected = jones_to_stokes(JonesMatrix(0.3, pi, 1) @
+                                   JonesMatrix(pi/4, pi/2, 1) @ self.state)
+        self.assertIsInstance(result.mean_stokes, StokesVector)
+        self.assertTrue(np.allclose(result.mean_stokes.vector, expected.vector))
+        self.assertAlmostEqual(result.degree_of_polarization, 1)
+        self.assertAlmostEqual(result.ellipticity_angle_spread, 0)
+
+    def test_trials(self):
+        result = monte_carlo(self.elements, self.state, trials=1000, seed=1)
+        self.assertEqual(len(result.stokes), 1000)
+        self.assertTrue(np.allclose(result.stokes.degree_of_polarization, 1))
+        self.assertLess(result.degree_of_polarization, 1)
+        self.assertGreater(result.ellipticity_angle_spread, 0)
+
+    def test_seed_is_reproducible(self):
+        first = monte_carlo(self.elements, self.state, trials=100, seed=7)
+        second = monte_carlo(self.elements, self.state, trials=100, seed=7)
+        self.assertTrue(np.array_equal(first.stokes.vector,
+                                       second.stokes.vector))
+
+    def test_azimuth_spread(self):
+        polarizer = [ElementTolerance(0.0, 0.0, 0.0, angle_tolerance=0.01)]
+        result = monte_carlo(polarizer, JonesVector(1, 1), trials=20000,
+                             seed=0)
+        self.assertAlmostEqual(result.azimuth_spread, 0.01, places=3)
+
+    def test_uniform_azimuth_spread(self):
+        stokes = StokesVectorArray([1, 1, 1, 1], [1, -1, 0, 0],
+                                   [0, 0, 1, -1], [0, 0, 0, 0])
+        with np.errstate(all='raise'):
+            spread = ToleranceResult(stokes).azimuth_spread
+        self.assertEqual(spread, np.inf)
+
+    def test_unknown_distribution(self):
+        with self.assertRaises(ValueError):
+            ElementTolerance(distribution='cauchy')
+
+
+if __name__ == '__main__':
+    unittest.main()